@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2015, Nicolas P. Rougier
+# Distributed under the (new) BSD License. See LICENSE.txt for more info.
+# -----------------------------------------------------------------------------
+import asyncio
+import weakref
+import threading
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+
+
+def signature(shader):
+    """
+    Return a (hashable) description of the current shader graph. It holds
+    snippets and hooks themselves (compared by identity) such that a
+    collected object cannot be mistaken for a new one reusing its id.
+    """
+    snippets = frozenset(shader.snippets)
+    connections = frozenset((input, input.source)
+                            for snippet in shader.snippets
+                            for input in snippet.inputs)
+    return snippets, connections
+
+
+class Builder(object):
+    """
+    A builder offloads snippet parsing, shader linking and code generation to
+    an executor such that an asyncio event loop is not blocked. Concurrent
+    requests for the same (unchanged) shader graph share a single build while
+    a build whose graph has been modified in the meantime is cancelled.
+
+    Methods return asyncio futures and are meant to be called from the event
+    loop thread:
+
+        code = await builder.build(shader)
+    """
+
+    def __init__(self, executor=None, loop=None):
+        self._executor = executor or ThreadPoolExecutor()
+        self._loop     = loop
+        self._pending  = {}
+        self._locks    = weakref.WeakKeyDictionary()
+        self._lock     = threading.Lock()
+
+    def _shader_lock(self, shader):
+        """ Lock serializing all work done on a given shader """
+        with self._lock:
+            if shader not in self._locks:
+                self._locks[shader] = threading.Lock()
+            return self._locks[shader]
+
+    def _run(self, function, *args):
+        loop = self._loop or asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor, function, *args)
+
+    def snippet(self, shader, key):
+        """ Create (and parse) a new snippet for shader """
+        def create():
+            with self._shader_lock(shader):
+                return shader(key)
+        return self._run(create)
+
+    def build(self, shader):
+        """ Link shader and generate its code """
+
+        key = signature(shader)
+        if shader in self._pending:
+            future, graph, cancelled = self._pending[shader]
+            if graph == key and not future.done():
+                return future
+            self.cancel(shader)
+
+        cancelled = threading.Event()
+        def build():
+            with self._shader_lock(shader):
+                if cancelled.is_set():
+                    raise CancelledError()
+                shader.link()
+                if cancelled.is_set():
+                    raise CancelledError()
+                return str(shader)
+        future = self._run(build)
+        self._pending[shader] = future, key, cancelled
+
+        def done(future):
+            if shader in self._pending and self._pending[shader][0] is future:
+                del self._pending[shader]
+        future.add_done_callback(done)
+        return future
+
+    def cancel(self, shader):
+        """ Cancel pending build for shader (if any) """
+        if shader not in self._pending:
+            return False
+        future, graph, cancelled = self._pending.pop(shader)
+        cancelled.set()
+        return future.cancel()
+
+    def shutdown(self, wait=True):
+        """ Cancel all pending builds and shutdown executor """
+        for shader in list(self._pending.keys()):
+            self.cancel(shader)
+        self._executor.shutdown(wait=wait)
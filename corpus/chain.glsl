@@ -0,0 +1,1216 @@
+#define _sn_1_SCALE 0.5
+uniform vec4 _sn_1_base_color;
+vec4 _sn_1_get_vec4 () {
+    return _sn_1_base_color * SCALE;
+}
+
+uniform float _sn_2_intensity;
+vec4 _sn_2_apply_filter (vec4 _sn_1_get_vec4) {
+    return mix(_sn_1_get_vec4, _sn_1_get_vec4 * (1.0 - _sn_1_get_vec4) * 2.0, _sn_2_intensity);
+}
+
+uniform float _sn_3_intensity;
+vec4 _sn_3_apply_filter (vec4 _sn_2_apply_filter) {
+    return mix(_sn_2_apply_filter, _sn_2_apply_filter * (1.0 - _sn_2_apply_filter) * 2.0, _sn_3_intensity);
+}
+
+uniform float _sn_4_intensity;
+vec4 _sn_4_apply_filter (vec4 _sn_3_apply_filter) {
+    return mix(_sn_3_apply_filter, _sn_3_apply_filter * (1.0 - _sn_3_apply_filter) * 2.0, _sn_4_intensity);
+}
+
+uniform float _sn_5_intensity;
+vec4 _sn_5_apply_filter (vec4 _sn_4_apply_filter) {
+    return mix(_sn_4_apply_filter, _sn_4_apply_filter * (1.0 - _sn_4_apply_filter) * 2.0, _sn_5_intensity);
+}
+
+uniform float _sn_6_intensity;
+vec4 _sn_6_apply_filter (vec4 _sn_5_apply_filter) {
+    return mix(_sn_5_apply_filter, _sn_5_apply_filter * (1.0 - _sn_5_apply_filter) * 2.0, _sn_6_intensity);
+}
+
+uniform float _sn_7_intensity;
+vec4 _sn_7_apply_filter (vec4 _sn_6_apply_filter) {
+    return mix(_sn_6_apply_filter, _sn_6_apply_filter * (1.0 - _sn_6_apply_filter) * 2.0, _sn_7_intensity);
+}
+
+uniform float _sn_8_intensity;
+vec4 _sn_8_apply_filter (vec4 _sn_7_apply_filter) {
+    return mix(_sn_7_apply_filter, _sn_7_apply_filter * (1.0 - _sn_7_apply_filter) * 2.0, _sn_8_intensity);
+}
+
+uniform float _sn_9_intensity;
+vec4 _sn_9_apply_filter (vec4 _sn_8_apply_filter) {
+    return mix(_sn_8_apply_filter, _sn_8_apply_filter * (1.0 - _sn_8_apply_filter) * 2.0, _sn_9_intensity);
+}
+
+uniform float _sn_10_intensity;
+vec4 _sn_10_apply_filter (vec4 _sn_9_apply_filter) {
+    return mix(_sn_9_apply_filter, _sn_9_apply_filter * (1.0 - _sn_9_apply_filter) * 2.0, _sn_10_intensity);
+}
+
+uniform float _sn_11_intensity;
+vec4 _sn_11_apply_filter (vec4 _sn_10_apply_filter) {
+    return mix(_sn_10_apply_filter, _sn_10_apply_filter * (1.0 - _sn_10_apply_filter) * 2.0, _sn_11_intensity);
+}
+
+uniform float _sn_12_intensity;
+vec4 _sn_12_apply_filter (vec4 _sn_11_apply_filter) {
+    return mix(_sn_11_apply_filter, _sn_11_apply_filter * (1.0 - _sn_11_apply_filter) * 2.0, _sn_12_intensity);
+}
+
+uniform float _sn_13_intensity;
+vec4 _sn_13_apply_filter (vec4 _sn_12_apply_filter) {
+    return mix(_sn_12_apply_filter, _sn_12_apply_filter * (1.0 - _sn_12_apply_filter) * 2.0, _sn_13_intensity);
+}
+
+uniform float _sn_14_intensity;
+vec4 _sn_14_apply_filter (vec4 _sn_13_apply_filter) {
+    return mix(_sn_13_apply_filter, _sn_13_apply_filter * (1.0 - _sn_13_apply_filter) * 2.0, _sn_14_intensity);
+}
+
+uniform float _sn_15_intensity;
+vec4 _sn_15_apply_filter (vec4 _sn_14_apply_filter) {
+    return mix(_sn_14_apply_filter, _sn_14_apply_filter * (1.0 - _sn_14_apply_filter) * 2.0, _sn_15_intensity);
+}
+
+uniform float _sn_16_intensity;
+vec4 _sn_16_apply_filter (vec4 _sn_15_apply_filter) {
+    return mix(_sn_15_apply_filter, _sn_15_apply_filter * (1.0 - _sn_15_apply_filter) * 2.0, _sn_16_intensity);
+}
+
+uniform float _sn_17_intensity;
+vec4 _sn_17_apply_filter (vec4 _sn_16_apply_filter) {
+    return mix(_sn_16_apply_filter, _sn_16_apply_filter * (1.0 - _sn_16_apply_filter) * 2.0, _sn_17_intensity);
+}
+
+uniform float _sn_18_intensity;
+vec4 _sn_18_apply_filter (vec4 _sn_17_apply_filter) {
+    return mix(_sn_17_apply_filter, _sn_17_apply_filter * (1.0 - _sn_17_apply_filter) * 2.0, _sn_18_intensity);
+}
+
+uniform float _sn_19_intensity;
+vec4 _sn_19_apply_filter (vec4 _sn_18_apply_filter) {
+    return mix(_sn_18_apply_filter, _sn_18_apply_filter * (1.0 - _sn_18_apply_filter) * 2.0, _sn_19_intensity);
+}
+
+uniform float _sn_20_intensity;
+vec4 _sn_20_apply_filter (vec4 _sn_19_apply_filter) {
+    return mix(_sn_19_apply_filter, _sn_19_apply_filter * (1.0 - _sn_19_apply_filter) * 2.0, _sn_20_intensity);
+}
+
+uniform float _sn_21_intensity;
+vec4 _sn_21_apply_filter (vec4 _sn_20_apply_filter) {
+    return mix(_sn_20_apply_filter, _sn_20_apply_filter * (1.0 - _sn_20_apply_filter) * 2.0, _sn_21_intensity);
+}
+
+uniform float _sn_22_intensity;
+vec4 _sn_22_apply_filter (vec4 _sn_21_apply_filter) {
+    return mix(_sn_21_apply_filter, _sn_21_apply_filter * (1.0 - _sn_21_apply_filter) * 2.0, _sn_22_intensity);
+}
+
+uniform float _sn_23_intensity;
+vec4 _sn_23_apply_filter (vec4 _sn_22_apply_filter) {
+    return mix(_sn_22_apply_filter, _sn_22_apply_filter * (1.0 - _sn_22_apply_filter) * 2.0, _sn_23_intensity);
+}
+
+uniform float _sn_24_intensity;
+vec4 _sn_24_apply_filter (vec4 _sn_23_apply_filter) {
+    return mix(_sn_23_apply_filter, _sn_23_apply_filter * (1.0 - _sn_23_apply_filter) * 2.0, _sn_24_intensity);
+}
+
+uniform float _sn_25_intensity;
+vec4 _sn_25_apply_filter (vec4 _sn_24_apply_filter) {
+    return mix(_sn_24_apply_filter, _sn_24_apply_filter * (1.0 - _sn_24_apply_filter) * 2.0, _sn_25_intensity);
+}
+
+uniform float _sn_26_intensity;
+vec4 _sn_26_apply_filter (vec4 _sn_25_apply_filter) {
+    return mix(_sn_25_apply_filter, _sn_25_apply_filter * (1.0 - _sn_25_apply_filter) * 2.0, _sn_26_intensity);
+}
+
+uniform float _sn_27_intensity;
+vec4 _sn_27_apply_filter (vec4 _sn_26_apply_filter) {
+    return mix(_sn_26_apply_filter, _sn_26_apply_filter * (1.0 - _sn_26_apply_filter) * 2.0, _sn_27_intensity);
+}
+
+uniform float _sn_28_intensity;
+vec4 _sn_28_apply_filter (vec4 _sn_27_apply_filter) {
+    return mix(_sn_27_apply_filter, _sn_27_apply_filter * (1.0 - _sn_27_apply_filter) * 2.0, _sn_28_intensity);
+}
+
+uniform float _sn_29_intensity;
+vec4 _sn_29_apply_filter (vec4 _sn_28_apply_filter) {
+    return mix(_sn_28_apply_filter, _sn_28_apply_filter * (1.0 - _sn_28_apply_filter) * 2.0, _sn_29_intensity);
+}
+
+uniform float _sn_30_intensity;
+vec4 _sn_30_apply_filter (vec4 _sn_29_apply_filter) {
+    return mix(_sn_29_apply_filter, _sn_29_apply_filter * (1.0 - _sn_29_apply_filter) * 2.0, _sn_30_intensity);
+}
+
+uniform float _sn_31_intensity;
+vec4 _sn_31_apply_filter (vec4 _sn_30_apply_filter) {
+    return mix(_sn_30_apply_filter, _sn_30_apply_filter * (1.0 - _sn_30_apply_filter) * 2.0, _sn_31_intensity);
+}
+
+uniform float _sn_32_intensity;
+vec4 _sn_32_apply_filter (vec4 _sn_31_apply_filter) {
+    return mix(_sn_31_apply_filter, _sn_31_apply_filter * (1.0 - _sn_31_apply_filter) * 2.0, _sn_32_intensity);
+}
+
+uniform float _sn_33_intensity;
+vec4 _sn_33_apply_filter (vec4 _sn_32_apply_filter) {
+    return mix(_sn_32_apply_filter, _sn_32_apply_filter * (1.0 - _sn_32_apply_filter) * 2.0, _sn_33_intensity);
+}
+
+uniform float _sn_34_intensity;
+vec4 _sn_34_apply_filter (vec4 _sn_33_apply_filter) {
+    return mix(_sn_33_apply_filter, _sn_33_apply_filter * (1.0 - _sn_33_apply_filter) * 2.0, _sn_34_intensity);
+}
+
+uniform float _sn_35_intensity;
+vec4 _sn_35_apply_filter (vec4 _sn_34_apply_filter) {
+    return mix(_sn_34_apply_filter, _sn_34_apply_filter * (1.0 - _sn_34_apply_filter) * 2.0, _sn_35_intensity);
+}
+
+uniform float _sn_36_intensity;
+vec4 _sn_36_apply_filter (vec4 _sn_35_apply_filter) {
+    return mix(_sn_35_apply_filter, _sn_35_apply_filter * (1.0 - _sn_35_apply_filter) * 2.0, _sn_36_intensity);
+}
+
+uniform float _sn_37_intensity;
+vec4 _sn_37_apply_filter (vec4 _sn_36_apply_filter) {
+    return mix(_sn_36_apply_filter, _sn_36_apply_filter * (1.0 - _sn_36_apply_filter) * 2.0, _sn_37_intensity);
+}
+
+uniform float _sn_38_intensity;
+vec4 _sn_38_apply_filter (vec4 _sn_37_apply_filter) {
+    return mix(_sn_37_apply_filter, _sn_37_apply_filter * (1.0 - _sn_37_apply_filter) * 2.0, _sn_38_intensity);
+}
+
+uniform float _sn_39_intensity;
+vec4 _sn_39_apply_filter (vec4 _sn_38_apply_filter) {
+    return mix(_sn_38_apply_filter, _sn_38_apply_filter * (1.0 - _sn_38_apply_filter) * 2.0, _sn_39_intensity);
+}
+
+uniform float _sn_40_intensity;
+vec4 _sn_40_apply_filter (vec4 _sn_39_apply_filter) {
+    return mix(_sn_39_apply_filter, _sn_39_apply_filter * (1.0 - _sn_39_apply_filter) * 2.0, _sn_40_intensity);
+}
+
+uniform float _sn_41_intensity;
+vec4 _sn_41_apply_filter (vec4 _sn_40_apply_filter) {
+    return mix(_sn_40_apply_filter, _sn_40_apply_filter * (1.0 - _sn_40_apply_filter) * 2.0, _sn_41_intensity);
+}
+
+uniform float _sn_42_intensity;
+vec4 _sn_42_apply_filter (vec4 _sn_41_apply_filter) {
+    return mix(_sn_41_apply_filter, _sn_41_apply_filter * (1.0 - _sn_41_apply_filter) * 2.0, _sn_42_intensity);
+}
+
+uniform float _sn_43_intensity;
+vec4 _sn_43_apply_filter (vec4 _sn_42_apply_filter) {
+    return mix(_sn_42_apply_filter, _sn_42_apply_filter * (1.0 - _sn_42_apply_filter) * 2.0, _sn_43_intensity);
+}
+
+uniform float _sn_44_intensity;
+vec4 _sn_44_apply_filter (vec4 _sn_43_apply_filter) {
+    return mix(_sn_43_apply_filter, _sn_43_apply_filter * (1.0 - _sn_43_apply_filter) * 2.0, _sn_44_intensity);
+}
+
+uniform float _sn_45_intensity;
+vec4 _sn_45_apply_filter (vec4 _sn_44_apply_filter) {
+    return mix(_sn_44_apply_filter, _sn_44_apply_filter * (1.0 - _sn_44_apply_filter) * 2.0, _sn_45_intensity);
+}
+
+uniform float _sn_46_intensity;
+vec4 _sn_46_apply_filter (vec4 _sn_45_apply_filter) {
+    return mix(_sn_45_apply_filter, _sn_45_apply_filter * (1.0 - _sn_45_apply_filter) * 2.0, _sn_46_intensity);
+}
+
+uniform float _sn_47_intensity;
+vec4 _sn_47_apply_filter (vec4 _sn_46_apply_filter) {
+    return mix(_sn_46_apply_filter, _sn_46_apply_filter * (1.0 - _sn_46_apply_filter) * 2.0, _sn_47_intensity);
+}
+
+uniform float _sn_48_intensity;
+vec4 _sn_48_apply_filter (vec4 _sn_47_apply_filter) {
+    return mix(_sn_47_apply_filter, _sn_47_apply_filter * (1.0 - _sn_47_apply_filter) * 2.0, _sn_48_intensity);
+}
+
+uniform float _sn_49_intensity;
+vec4 _sn_49_apply_filter (vec4 _sn_48_apply_filter) {
+    return mix(_sn_48_apply_filter, _sn_48_apply_filter * (1.0 - _sn_48_apply_filter) * 2.0, _sn_49_intensity);
+}
+
+uniform float _sn_50_intensity;
+vec4 _sn_50_apply_filter (vec4 _sn_49_apply_filter) {
+    return mix(_sn_49_apply_filter, _sn_49_apply_filter * (1.0 - _sn_49_apply_filter) * 2.0, _sn_50_intensity);
+}
+
+uniform float _sn_51_intensity;
+vec4 _sn_51_apply_filter (vec4 _sn_50_apply_filter) {
+    return mix(_sn_50_apply_filter, _sn_50_apply_filter * (1.0 - _sn_50_apply_filter) * 2.0, _sn_51_intensity);
+}
+
+uniform float _sn_52_intensity;
+vec4 _sn_52_apply_filter (vec4 _sn_51_apply_filter) {
+    return mix(_sn_51_apply_filter, _sn_51_apply_filter * (1.0 - _sn_51_apply_filter) * 2.0, _sn_52_intensity);
+}
+
+uniform float _sn_53_intensity;
+vec4 _sn_53_apply_filter (vec4 _sn_52_apply_filter) {
+    return mix(_sn_52_apply_filter, _sn_52_apply_filter * (1.0 - _sn_52_apply_filter) * 2.0, _sn_53_intensity);
+}
+
+uniform float _sn_54_intensity;
+vec4 _sn_54_apply_filter (vec4 _sn_53_apply_filter) {
+    return mix(_sn_53_apply_filter, _sn_53_apply_filter * (1.0 - _sn_53_apply_filter) * 2.0, _sn_54_intensity);
+}
+
+uniform float _sn_55_intensity;
+vec4 _sn_55_apply_filter (vec4 _sn_54_apply_filter) {
+    return mix(_sn_54_apply_filter, _sn_54_apply_filter * (1.0 - _sn_54_apply_filter) * 2.0, _sn_55_intensity);
+}
+
+uniform float _sn_56_intensity;
+vec4 _sn_56_apply_filter (vec4 _sn_55_apply_filter) {
+    return mix(_sn_55_apply_filter, _sn_55_apply_filter * (1.0 - _sn_55_apply_filter) * 2.0, _sn_56_intensity);
+}
+
+uniform float _sn_57_intensity;
+vec4 _sn_57_apply_filter (vec4 _sn_56_apply_filter) {
+    return mix(_sn_56_apply_filter, _sn_56_apply_filter * (1.0 - _sn_56_apply_filter) * 2.0, _sn_57_intensity);
+}
+
+uniform float _sn_58_intensity;
+vec4 _sn_58_apply_filter (vec4 _sn_57_apply_filter) {
+    return mix(_sn_57_apply_filter, _sn_57_apply_filter * (1.0 - _sn_57_apply_filter) * 2.0, _sn_58_intensity);
+}
+
+uniform float _sn_59_intensity;
+vec4 _sn_59_apply_filter (vec4 _sn_58_apply_filter) {
+    return mix(_sn_58_apply_filter, _sn_58_apply_filter * (1.0 - _sn_58_apply_filter) * 2.0, _sn_59_intensity);
+}
+
+uniform float _sn_60_intensity;
+vec4 _sn_60_apply_filter (vec4 _sn_59_apply_filter) {
+    return mix(_sn_59_apply_filter, _sn_59_apply_filter * (1.0 - _sn_59_apply_filter) * 2.0, _sn_60_intensity);
+}
+
+uniform float _sn_61_intensity;
+vec4 _sn_61_apply_filter (vec4 _sn_60_apply_filter) {
+    return mix(_sn_60_apply_filter, _sn_60_apply_filter * (1.0 - _sn_60_apply_filter) * 2.0, _sn_61_intensity);
+}
+
+uniform float _sn_62_intensity;
+vec4 _sn_62_apply_filter (vec4 _sn_61_apply_filter) {
+    return mix(_sn_61_apply_filter, _sn_61_apply_filter * (1.0 - _sn_61_apply_filter) * 2.0, _sn_62_intensity);
+}
+
+uniform float _sn_63_intensity;
+vec4 _sn_63_apply_filter (vec4 _sn_62_apply_filter) {
+    return mix(_sn_62_apply_filter, _sn_62_apply_filter * (1.0 - _sn_62_apply_filter) * 2.0, _sn_63_intensity);
+}
+
+uniform float _sn_64_intensity;
+vec4 _sn_64_apply_filter (vec4 _sn_63_apply_filter) {
+    return mix(_sn_63_apply_filter, _sn_63_apply_filter * (1.0 - _sn_63_apply_filter) * 2.0, _sn_64_intensity);
+}
+
+uniform float _sn_65_intensity;
+vec4 _sn_65_apply_filter (vec4 _sn_64_apply_filter) {
+    return mix(_sn_64_apply_filter, _sn_64_apply_filter * (1.0 - _sn_64_apply_filter) * 2.0, _sn_65_intensity);
+}
+
+uniform float _sn_66_intensity;
+vec4 _sn_66_apply_filter (vec4 _sn_65_apply_filter) {
+    return mix(_sn_65_apply_filter, _sn_65_apply_filter * (1.0 - _sn_65_apply_filter) * 2.0, _sn_66_intensity);
+}
+
+uniform float _sn_67_intensity;
+vec4 _sn_67_apply_filter (vec4 _sn_66_apply_filter) {
+    return mix(_sn_66_apply_filter, _sn_66_apply_filter * (1.0 - _sn_66_apply_filter) * 2.0, _sn_67_intensity);
+}
+
+uniform float _sn_68_intensity;
+vec4 _sn_68_apply_filter (vec4 _sn_67_apply_filter) {
+    return mix(_sn_67_apply_filter, _sn_67_apply_filter * (1.0 - _sn_67_apply_filter) * 2.0, _sn_68_intensity);
+}
+
+uniform float _sn_69_intensity;
+vec4 _sn_69_apply_filter (vec4 _sn_68_apply_filter) {
+    return mix(_sn_68_apply_filter, _sn_68_apply_filter * (1.0 - _sn_68_apply_filter) * 2.0, _sn_69_intensity);
+}
+
+uniform float _sn_70_intensity;
+vec4 _sn_70_apply_filter (vec4 _sn_69_apply_filter) {
+    return mix(_sn_69_apply_filter, _sn_69_apply_filter * (1.0 - _sn_69_apply_filter) * 2.0, _sn_70_intensity);
+}
+
+uniform float _sn_71_intensity;
+vec4 _sn_71_apply_filter (vec4 _sn_70_apply_filter) {
+    return mix(_sn_70_apply_filter, _sn_70_apply_filter * (1.0 - _sn_70_apply_filter) * 2.0, _sn_71_intensity);
+}
+
+uniform float _sn_72_intensity;
+vec4 _sn_72_apply_filter (vec4 _sn_71_apply_filter) {
+    return mix(_sn_71_apply_filter, _sn_71_apply_filter * (1.0 - _sn_71_apply_filter) * 2.0, _sn_72_intensity);
+}
+
+uniform float _sn_73_intensity;
+vec4 _sn_73_apply_filter (vec4 _sn_72_apply_filter) {
+    return mix(_sn_72_apply_filter, _sn_72_apply_filter * (1.0 - _sn_72_apply_filter) * 2.0, _sn_73_intensity);
+}
+
+uniform float _sn_74_intensity;
+vec4 _sn_74_apply_filter (vec4 _sn_73_apply_filter) {
+    return mix(_sn_73_apply_filter, _sn_73_apply_filter * (1.0 - _sn_73_apply_filter) * 2.0, _sn_74_intensity);
+}
+
+uniform float _sn_75_intensity;
+vec4 _sn_75_apply_filter (vec4 _sn_74_apply_filter) {
+    return mix(_sn_74_apply_filter, _sn_74_apply_filter * (1.0 - _sn_74_apply_filter) * 2.0, _sn_75_intensity);
+}
+
+uniform float _sn_76_intensity;
+vec4 _sn_76_apply_filter (vec4 _sn_75_apply_filter) {
+    return mix(_sn_75_apply_filter, _sn_75_apply_filter * (1.0 - _sn_75_apply_filter) * 2.0, _sn_76_intensity);
+}
+
+uniform float _sn_77_intensity;
+vec4 _sn_77_apply_filter (vec4 _sn_76_apply_filter) {
+    return mix(_sn_76_apply_filter, _sn_76_apply_filter * (1.0 - _sn_76_apply_filter) * 2.0, _sn_77_intensity);
+}
+
+uniform float _sn_78_intensity;
+vec4 _sn_78_apply_filter (vec4 _sn_77_apply_filter) {
+    return mix(_sn_77_apply_filter, _sn_77_apply_filter * (1.0 - _sn_77_apply_filter) * 2.0, _sn_78_intensity);
+}
+
+uniform float _sn_79_intensity;
+vec4 _sn_79_apply_filter (vec4 _sn_78_apply_filter) {
+    return mix(_sn_78_apply_filter, _sn_78_apply_filter * (1.0 - _sn_78_apply_filter) * 2.0, _sn_79_intensity);
+}
+
+uniform float _sn_80_intensity;
+vec4 _sn_80_apply_filter (vec4 _sn_79_apply_filter) {
+    return mix(_sn_79_apply_filter, _sn_79_apply_filter * (1.0 - _sn_79_apply_filter) * 2.0, _sn_80_intensity);
+}
+
+uniform float _sn_81_intensity;
+vec4 _sn_81_apply_filter (vec4 _sn_80_apply_filter) {
+    return mix(_sn_80_apply_filter, _sn_80_apply_filter * (1.0 - _sn_80_apply_filter) * 2.0, _sn_81_intensity);
+}
+
+uniform float _sn_82_intensity;
+vec4 _sn_82_apply_filter (vec4 _sn_81_apply_filter) {
+    return mix(_sn_81_apply_filter, _sn_81_apply_filter * (1.0 - _sn_81_apply_filter) * 2.0, _sn_82_intensity);
+}
+
+uniform float _sn_83_intensity;
+vec4 _sn_83_apply_filter (vec4 _sn_82_apply_filter) {
+    return mix(_sn_82_apply_filter, _sn_82_apply_filter * (1.0 - _sn_82_apply_filter) * 2.0, _sn_83_intensity);
+}
+
+uniform float _sn_84_intensity;
+vec4 _sn_84_apply_filter (vec4 _sn_83_apply_filter) {
+    return mix(_sn_83_apply_filter, _sn_83_apply_filter * (1.0 - _sn_83_apply_filter) * 2.0, _sn_84_intensity);
+}
+
+uniform float _sn_85_intensity;
+vec4 _sn_85_apply_filter (vec4 _sn_84_apply_filter) {
+    return mix(_sn_84_apply_filter, _sn_84_apply_filter * (1.0 - _sn_84_apply_filter) * 2.0, _sn_85_intensity);
+}
+
+uniform float _sn_86_intensity;
+vec4 _sn_86_apply_filter (vec4 _sn_85_apply_filter) {
+    return mix(_sn_85_apply_filter, _sn_85_apply_filter * (1.0 - _sn_85_apply_filter) * 2.0, _sn_86_intensity);
+}
+
+uniform float _sn_87_intensity;
+vec4 _sn_87_apply_filter (vec4 _sn_86_apply_filter) {
+    return mix(_sn_86_apply_filter, _sn_86_apply_filter * (1.0 - _sn_86_apply_filter) * 2.0, _sn_87_intensity);
+}
+
+uniform float _sn_88_intensity;
+vec4 _sn_88_apply_filter (vec4 _sn_87_apply_filter) {
+    return mix(_sn_87_apply_filter, _sn_87_apply_filter * (1.0 - _sn_87_apply_filter) * 2.0, _sn_88_intensity);
+}
+
+uniform float _sn_89_intensity;
+vec4 _sn_89_apply_filter (vec4 _sn_88_apply_filter) {
+    return mix(_sn_88_apply_filter, _sn_88_apply_filter * (1.0 - _sn_88_apply_filter) * 2.0, _sn_89_intensity);
+}
+
+uniform float _sn_90_intensity;
+vec4 _sn_90_apply_filter (vec4 _sn_89_apply_filter) {
+    return mix(_sn_89_apply_filter, _sn_89_apply_filter * (1.0 - _sn_89_apply_filter) * 2.0, _sn_90_intensity);
+}
+
+uniform float _sn_91_intensity;
+vec4 _sn_91_apply_filter (vec4 _sn_90_apply_filter) {
+    return mix(_sn_90_apply_filter, _sn_90_apply_filter * (1.0 - _sn_90_apply_filter) * 2.0, _sn_91_intensity);
+}
+
+uniform float _sn_92_intensity;
+vec4 _sn_92_apply_filter (vec4 _sn_91_apply_filter) {
+    return mix(_sn_91_apply_filter, _sn_91_apply_filter * (1.0 - _sn_91_apply_filter) * 2.0, _sn_92_intensity);
+}
+
+uniform float _sn_93_intensity;
+vec4 _sn_93_apply_filter (vec4 _sn_92_apply_filter) {
+    return mix(_sn_92_apply_filter, _sn_92_apply_filter * (1.0 - _sn_92_apply_filter) * 2.0, _sn_93_intensity);
+}
+
+uniform float _sn_94_intensity;
+vec4 _sn_94_apply_filter (vec4 _sn_93_apply_filter) {
+    return mix(_sn_93_apply_filter, _sn_93_apply_filter * (1.0 - _sn_93_apply_filter) * 2.0, _sn_94_intensity);
+}
+
+uniform float _sn_95_intensity;
+vec4 _sn_95_apply_filter (vec4 _sn_94_apply_filter) {
+    return mix(_sn_94_apply_filter, _sn_94_apply_filter * (1.0 - _sn_94_apply_filter) * 2.0, _sn_95_intensity);
+}
+
+uniform float _sn_96_intensity;
+vec4 _sn_96_apply_filter (vec4 _sn_95_apply_filter) {
+    return mix(_sn_95_apply_filter, _sn_95_apply_filter * (1.0 - _sn_95_apply_filter) * 2.0, _sn_96_intensity);
+}
+
+uniform float _sn_97_intensity;
+vec4 _sn_97_apply_filter (vec4 _sn_96_apply_filter) {
+    return mix(_sn_96_apply_filter, _sn_96_apply_filter * (1.0 - _sn_96_apply_filter) * 2.0, _sn_97_intensity);
+}
+
+uniform float _sn_98_intensity;
+vec4 _sn_98_apply_filter (vec4 _sn_97_apply_filter) {
+    return mix(_sn_97_apply_filter, _sn_97_apply_filter * (1.0 - _sn_97_apply_filter) * 2.0, _sn_98_intensity);
+}
+
+uniform float _sn_99_intensity;
+vec4 _sn_99_apply_filter (vec4 _sn_98_apply_filter) {
+    return mix(_sn_98_apply_filter, _sn_98_apply_filter * (1.0 - _sn_98_apply_filter) * 2.0, _sn_99_intensity);
+}
+
+uniform float _sn_100_intensity;
+vec4 _sn_100_apply_filter (vec4 _sn_99_apply_filter) {
+    return mix(_sn_99_apply_filter, _sn_99_apply_filter * (1.0 - _sn_99_apply_filter) * 2.0, _sn_100_intensity);
+}
+
+uniform float _sn_101_intensity;
+vec4 _sn_101_apply_filter (vec4 _sn_100_apply_filter) {
+    return mix(_sn_100_apply_filter, _sn_100_apply_filter * (1.0 - _sn_100_apply_filter) * 2.0, _sn_101_intensity);
+}
+
+uniform float _sn_102_intensity;
+vec4 _sn_102_apply_filter (vec4 _sn_101_apply_filter) {
+    return mix(_sn_101_apply_filter, _sn_101_apply_filter * (1.0 - _sn_101_apply_filter) * 2.0, _sn_102_intensity);
+}
+
+uniform float _sn_103_intensity;
+vec4 _sn_103_apply_filter (vec4 _sn_102_apply_filter) {
+    return mix(_sn_102_apply_filter, _sn_102_apply_filter * (1.0 - _sn_102_apply_filter) * 2.0, _sn_103_intensity);
+}
+
+uniform float _sn_104_intensity;
+vec4 _sn_104_apply_filter (vec4 _sn_103_apply_filter) {
+    return mix(_sn_103_apply_filter, _sn_103_apply_filter * (1.0 - _sn_103_apply_filter) * 2.0, _sn_104_intensity);
+}
+
+uniform float _sn_105_intensity;
+vec4 _sn_105_apply_filter (vec4 _sn_104_apply_filter) {
+    return mix(_sn_104_apply_filter, _sn_104_apply_filter * (1.0 - _sn_104_apply_filter) * 2.0, _sn_105_intensity);
+}
+
+uniform float _sn_106_intensity;
+vec4 _sn_106_apply_filter (vec4 _sn_105_apply_filter) {
+    return mix(_sn_105_apply_filter, _sn_105_apply_filter * (1.0 - _sn_105_apply_filter) * 2.0, _sn_106_intensity);
+}
+
+uniform float _sn_107_intensity;
+vec4 _sn_107_apply_filter (vec4 _sn_106_apply_filter) {
+    return mix(_sn_106_apply_filter, _sn_106_apply_filter * (1.0 - _sn_106_apply_filter) * 2.0, _sn_107_intensity);
+}
+
+uniform float _sn_108_intensity;
+vec4 _sn_108_apply_filter (vec4 _sn_107_apply_filter) {
+    return mix(_sn_107_apply_filter, _sn_107_apply_filter * (1.0 - _sn_107_apply_filter) * 2.0, _sn_108_intensity);
+}
+
+uniform float _sn_109_intensity;
+vec4 _sn_109_apply_filter (vec4 _sn_108_apply_filter) {
+    return mix(_sn_108_apply_filter, _sn_108_apply_filter * (1.0 - _sn_108_apply_filter) * 2.0, _sn_109_intensity);
+}
+
+uniform float _sn_110_intensity;
+vec4 _sn_110_apply_filter (vec4 _sn_109_apply_filter) {
+    return mix(_sn_109_apply_filter, _sn_109_apply_filter * (1.0 - _sn_109_apply_filter) * 2.0, _sn_110_intensity);
+}
+
+uniform float _sn_111_intensity;
+vec4 _sn_111_apply_filter (vec4 _sn_110_apply_filter) {
+    return mix(_sn_110_apply_filter, _sn_110_apply_filter * (1.0 - _sn_110_apply_filter) * 2.0, _sn_111_intensity);
+}
+
+uniform float _sn_112_intensity;
+vec4 _sn_112_apply_filter (vec4 _sn_111_apply_filter) {
+    return mix(_sn_111_apply_filter, _sn_111_apply_filter * (1.0 - _sn_111_apply_filter) * 2.0, _sn_112_intensity);
+}
+
+uniform float _sn_113_intensity;
+vec4 _sn_113_apply_filter (vec4 _sn_112_apply_filter) {
+    return mix(_sn_112_apply_filter, _sn_112_apply_filter * (1.0 - _sn_112_apply_filter) * 2.0, _sn_113_intensity);
+}
+
+uniform float _sn_114_intensity;
+vec4 _sn_114_apply_filter (vec4 _sn_113_apply_filter) {
+    return mix(_sn_113_apply_filter, _sn_113_apply_filter * (1.0 - _sn_113_apply_filter) * 2.0, _sn_114_intensity);
+}
+
+uniform float _sn_115_intensity;
+vec4 _sn_115_apply_filter (vec4 _sn_114_apply_filter) {
+    return mix(_sn_114_apply_filter, _sn_114_apply_filter * (1.0 - _sn_114_apply_filter) * 2.0, _sn_115_intensity);
+}
+
+uniform float _sn_116_intensity;
+vec4 _sn_116_apply_filter (vec4 _sn_115_apply_filter) {
+    return mix(_sn_115_apply_filter, _sn_115_apply_filter * (1.0 - _sn_115_apply_filter) * 2.0, _sn_116_intensity);
+}
+
+uniform float _sn_117_intensity;
+vec4 _sn_117_apply_filter (vec4 _sn_116_apply_filter) {
+    return mix(_sn_116_apply_filter, _sn_116_apply_filter * (1.0 - _sn_116_apply_filter) * 2.0, _sn_117_intensity);
+}
+
+uniform float _sn_118_intensity;
+vec4 _sn_118_apply_filter (vec4 _sn_117_apply_filter) {
+    return mix(_sn_117_apply_filter, _sn_117_apply_filter * (1.0 - _sn_117_apply_filter) * 2.0, _sn_118_intensity);
+}
+
+uniform float _sn_119_intensity;
+vec4 _sn_119_apply_filter (vec4 _sn_118_apply_filter) {
+    return mix(_sn_118_apply_filter, _sn_118_apply_filter * (1.0 - _sn_118_apply_filter) * 2.0, _sn_119_intensity);
+}
+
+uniform float _sn_120_intensity;
+vec4 _sn_120_apply_filter (vec4 _sn_119_apply_filter) {
+    return mix(_sn_119_apply_filter, _sn_119_apply_filter * (1.0 - _sn_119_apply_filter) * 2.0, _sn_120_intensity);
+}
+
+uniform float _sn_121_intensity;
+vec4 _sn_121_apply_filter (vec4 _sn_120_apply_filter) {
+    return mix(_sn_120_apply_filter, _sn_120_apply_filter * (1.0 - _sn_120_apply_filter) * 2.0, _sn_121_intensity);
+}
+
+uniform float _sn_122_intensity;
+vec4 _sn_122_apply_filter (vec4 _sn_121_apply_filter) {
+    return mix(_sn_121_apply_filter, _sn_121_apply_filter * (1.0 - _sn_121_apply_filter) * 2.0, _sn_122_intensity);
+}
+
+uniform float _sn_123_intensity;
+vec4 _sn_123_apply_filter (vec4 _sn_122_apply_filter) {
+    return mix(_sn_122_apply_filter, _sn_122_apply_filter * (1.0 - _sn_122_apply_filter) * 2.0, _sn_123_intensity);
+}
+
+uniform float _sn_124_intensity;
+vec4 _sn_124_apply_filter (vec4 _sn_123_apply_filter) {
+    return mix(_sn_123_apply_filter, _sn_123_apply_filter * (1.0 - _sn_123_apply_filter) * 2.0, _sn_124_intensity);
+}
+
+uniform float _sn_125_intensity;
+vec4 _sn_125_apply_filter (vec4 _sn_124_apply_filter) {
+    return mix(_sn_124_apply_filter, _sn_124_apply_filter * (1.0 - _sn_124_apply_filter) * 2.0, _sn_125_intensity);
+}
+
+uniform float _sn_126_intensity;
+vec4 _sn_126_apply_filter (vec4 _sn_125_apply_filter) {
+    return mix(_sn_125_apply_filter, _sn_125_apply_filter * (1.0 - _sn_125_apply_filter) * 2.0, _sn_126_intensity);
+}
+
+uniform float _sn_127_intensity;
+vec4 _sn_127_apply_filter (vec4 _sn_126_apply_filter) {
+    return mix(_sn_126_apply_filter, _sn_126_apply_filter * (1.0 - _sn_126_apply_filter) * 2.0, _sn_127_intensity);
+}
+
+uniform float _sn_128_intensity;
+vec4 _sn_128_apply_filter (vec4 _sn_127_apply_filter) {
+    return mix(_sn_127_apply_filter, _sn_127_apply_filter * (1.0 - _sn_127_apply_filter) * 2.0, _sn_128_intensity);
+}
+
+uniform float _sn_129_intensity;
+vec4 _sn_129_apply_filter (vec4 _sn_128_apply_filter) {
+    return mix(_sn_128_apply_filter, _sn_128_apply_filter * (1.0 - _sn_128_apply_filter) * 2.0, _sn_129_intensity);
+}
+
+uniform float _sn_130_intensity;
+vec4 _sn_130_apply_filter (vec4 _sn_129_apply_filter) {
+    return mix(_sn_129_apply_filter, _sn_129_apply_filter * (1.0 - _sn_129_apply_filter) * 2.0, _sn_130_intensity);
+}
+
+uniform float _sn_131_intensity;
+vec4 _sn_131_apply_filter (vec4 _sn_130_apply_filter) {
+    return mix(_sn_130_apply_filter, _sn_130_apply_filter * (1.0 - _sn_130_apply_filter) * 2.0, _sn_131_intensity);
+}
+
+uniform float _sn_132_intensity;
+vec4 _sn_132_apply_filter (vec4 _sn_131_apply_filter) {
+    return mix(_sn_131_apply_filter, _sn_131_apply_filter * (1.0 - _sn_131_apply_filter) * 2.0, _sn_132_intensity);
+}
+
+uniform float _sn_133_intensity;
+vec4 _sn_133_apply_filter (vec4 _sn_132_apply_filter) {
+    return mix(_sn_132_apply_filter, _sn_132_apply_filter * (1.0 - _sn_132_apply_filter) * 2.0, _sn_133_intensity);
+}
+
+uniform float _sn_134_intensity;
+vec4 _sn_134_apply_filter (vec4 _sn_133_apply_filter) {
+    return mix(_sn_133_apply_filter, _sn_133_apply_filter * (1.0 - _sn_133_apply_filter) * 2.0, _sn_134_intensity);
+}
+
+uniform float _sn_135_intensity;
+vec4 _sn_135_apply_filter (vec4 _sn_134_apply_filter) {
+    return mix(_sn_134_apply_filter, _sn_134_apply_filter * (1.0 - _sn_134_apply_filter) * 2.0, _sn_135_intensity);
+}
+
+uniform float _sn_136_intensity;
+vec4 _sn_136_apply_filter (vec4 _sn_135_apply_filter) {
+    return mix(_sn_135_apply_filter, _sn_135_apply_filter * (1.0 - _sn_135_apply_filter) * 2.0, _sn_136_intensity);
+}
+
+uniform float _sn_137_intensity;
+vec4 _sn_137_apply_filter (vec4 _sn_136_apply_filter) {
+    return mix(_sn_136_apply_filter, _sn_136_apply_filter * (1.0 - _sn_136_apply_filter) * 2.0, _sn_137_intensity);
+}
+
+uniform float _sn_138_intensity;
+vec4 _sn_138_apply_filter (vec4 _sn_137_apply_filter) {
+    return mix(_sn_137_apply_filter, _sn_137_apply_filter * (1.0 - _sn_137_apply_filter) * 2.0, _sn_138_intensity);
+}
+
+uniform float _sn_139_intensity;
+vec4 _sn_139_apply_filter (vec4 _sn_138_apply_filter) {
+    return mix(_sn_138_apply_filter, _sn_138_apply_filter * (1.0 - _sn_138_apply_filter) * 2.0, _sn_139_intensity);
+}
+
+uniform float _sn_140_intensity;
+vec4 _sn_140_apply_filter (vec4 _sn_139_apply_filter) {
+    return mix(_sn_139_apply_filter, _sn_139_apply_filter * (1.0 - _sn_139_apply_filter) * 2.0, _sn_140_intensity);
+}
+
+uniform float _sn_141_intensity;
+vec4 _sn_141_apply_filter (vec4 _sn_140_apply_filter) {
+    return mix(_sn_140_apply_filter, _sn_140_apply_filter * (1.0 - _sn_140_apply_filter) * 2.0, _sn_141_intensity);
+}
+
+uniform float _sn_142_intensity;
+vec4 _sn_142_apply_filter (vec4 _sn_141_apply_filter) {
+    return mix(_sn_141_apply_filter, _sn_141_apply_filter * (1.0 - _sn_141_apply_filter) * 2.0, _sn_142_intensity);
+}
+
+uniform float _sn_143_intensity;
+vec4 _sn_143_apply_filter (vec4 _sn_142_apply_filter) {
+    return mix(_sn_142_apply_filter, _sn_142_apply_filter * (1.0 - _sn_142_apply_filter) * 2.0, _sn_143_intensity);
+}
+
+uniform float _sn_144_intensity;
+vec4 _sn_144_apply_filter (vec4 _sn_143_apply_filter) {
+    return mix(_sn_143_apply_filter, _sn_143_apply_filter * (1.0 - _sn_143_apply_filter) * 2.0, _sn_144_intensity);
+}
+
+uniform float _sn_145_intensity;
+vec4 _sn_145_apply_filter (vec4 _sn_144_apply_filter) {
+    return mix(_sn_144_apply_filter, _sn_144_apply_filter * (1.0 - _sn_144_apply_filter) * 2.0, _sn_145_intensity);
+}
+
+uniform float _sn_146_intensity;
+vec4 _sn_146_apply_filter (vec4 _sn_145_apply_filter) {
+    return mix(_sn_145_apply_filter, _sn_145_apply_filter * (1.0 - _sn_145_apply_filter) * 2.0, _sn_146_intensity);
+}
+
+uniform float _sn_147_intensity;
+vec4 _sn_147_apply_filter (vec4 _sn_146_apply_filter) {
+    return mix(_sn_146_apply_filter, _sn_146_apply_filter * (1.0 - _sn_146_apply_filter) * 2.0, _sn_147_intensity);
+}
+
+uniform float _sn_148_intensity;
+vec4 _sn_148_apply_filter (vec4 _sn_147_apply_filter) {
+    return mix(_sn_147_apply_filter, _sn_147_apply_filter * (1.0 - _sn_147_apply_filter) * 2.0, _sn_148_intensity);
+}
+
+uniform float _sn_149_intensity;
+vec4 _sn_149_apply_filter (vec4 _sn_148_apply_filter) {
+    return mix(_sn_148_apply_filter, _sn_148_apply_filter * (1.0 - _sn_148_apply_filter) * 2.0, _sn_149_intensity);
+}
+
+uniform float _sn_150_intensity;
+vec4 _sn_150_apply_filter (vec4 _sn_149_apply_filter) {
+    return mix(_sn_149_apply_filter, _sn_149_apply_filter * (1.0 - _sn_149_apply_filter) * 2.0, _sn_150_intensity);
+}
+
+uniform float _sn_151_intensity;
+vec4 _sn_151_apply_filter (vec4 _sn_150_apply_filter) {
+    return mix(_sn_150_apply_filter, _sn_150_apply_filter * (1.0 - _sn_150_apply_filter) * 2.0, _sn_151_intensity);
+}
+
+uniform float _sn_152_intensity;
+vec4 _sn_152_apply_filter (vec4 _sn_151_apply_filter) {
+    return mix(_sn_151_apply_filter, _sn_151_apply_filter * (1.0 - _sn_151_apply_filter) * 2.0, _sn_152_intensity);
+}
+
+uniform float _sn_153_intensity;
+vec4 _sn_153_apply_filter (vec4 _sn_152_apply_filter) {
+    return mix(_sn_152_apply_filter, _sn_152_apply_filter * (1.0 - _sn_152_apply_filter) * 2.0, _sn_153_intensity);
+}
+
+uniform float _sn_154_intensity;
+vec4 _sn_154_apply_filter (vec4 _sn_153_apply_filter) {
+    return mix(_sn_153_apply_filter, _sn_153_apply_filter * (1.0 - _sn_153_apply_filter) * 2.0, _sn_154_intensity);
+}
+
+uniform float _sn_155_intensity;
+vec4 _sn_155_apply_filter (vec4 _sn_154_apply_filter) {
+    return mix(_sn_154_apply_filter, _sn_154_apply_filter * (1.0 - _sn_154_apply_filter) * 2.0, _sn_155_intensity);
+}
+
+uniform float _sn_156_intensity;
+vec4 _sn_156_apply_filter (vec4 _sn_155_apply_filter) {
+    return mix(_sn_155_apply_filter, _sn_155_apply_filter * (1.0 - _sn_155_apply_filter) * 2.0, _sn_156_intensity);
+}
+
+uniform float _sn_157_intensity;
+vec4 _sn_157_apply_filter (vec4 _sn_156_apply_filter) {
+    return mix(_sn_156_apply_filter, _sn_156_apply_filter * (1.0 - _sn_156_apply_filter) * 2.0, _sn_157_intensity);
+}
+
+uniform float _sn_158_intensity;
+vec4 _sn_158_apply_filter (vec4 _sn_157_apply_filter) {
+    return mix(_sn_157_apply_filter, _sn_157_apply_filter * (1.0 - _sn_157_apply_filter) * 2.0, _sn_158_intensity);
+}
+
+uniform float _sn_159_intensity;
+vec4 _sn_159_apply_filter (vec4 _sn_158_apply_filter) {
+    return mix(_sn_158_apply_filter, _sn_158_apply_filter * (1.0 - _sn_158_apply_filter) * 2.0, _sn_159_intensity);
+}
+
+uniform float _sn_160_intensity;
+vec4 _sn_160_apply_filter (vec4 _sn_159_apply_filter) {
+    return mix(_sn_159_apply_filter, _sn_159_apply_filter * (1.0 - _sn_159_apply_filter) * 2.0, _sn_160_intensity);
+}
+
+uniform float _sn_161_intensity;
+vec4 _sn_161_apply_filter (vec4 _sn_160_apply_filter) {
+    return mix(_sn_160_apply_filter, _sn_160_apply_filter * (1.0 - _sn_160_apply_filter) * 2.0, _sn_161_intensity);
+}
+
+uniform float _sn_162_intensity;
+vec4 _sn_162_apply_filter (vec4 _sn_161_apply_filter) {
+    return mix(_sn_161_apply_filter, _sn_161_apply_filter * (1.0 - _sn_161_apply_filter) * 2.0, _sn_162_intensity);
+}
+
+uniform float _sn_163_intensity;
+vec4 _sn_163_apply_filter (vec4 _sn_162_apply_filter) {
+    return mix(_sn_162_apply_filter, _sn_162_apply_filter * (1.0 - _sn_162_apply_filter) * 2.0, _sn_163_intensity);
+}
+
+uniform float _sn_164_intensity;
+vec4 _sn_164_apply_filter (vec4 _sn_163_apply_filter) {
+    return mix(_sn_163_apply_filter, _sn_163_apply_filter * (1.0 - _sn_163_apply_filter) * 2.0, _sn_164_intensity);
+}
+
+uniform float _sn_165_intensity;
+vec4 _sn_165_apply_filter (vec4 _sn_164_apply_filter) {
+    return mix(_sn_164_apply_filter, _sn_164_apply_filter * (1.0 - _sn_164_apply_filter) * 2.0, _sn_165_intensity);
+}
+
+uniform float _sn_166_intensity;
+vec4 _sn_166_apply_filter (vec4 _sn_165_apply_filter) {
+    return mix(_sn_165_apply_filter, _sn_165_apply_filter * (1.0 - _sn_165_apply_filter) * 2.0, _sn_166_intensity);
+}
+
+uniform float _sn_167_intensity;
+vec4 _sn_167_apply_filter (vec4 _sn_166_apply_filter) {
+    return mix(_sn_166_apply_filter, _sn_166_apply_filter * (1.0 - _sn_166_apply_filter) * 2.0, _sn_167_intensity);
+}
+
+uniform float _sn_168_intensity;
+vec4 _sn_168_apply_filter (vec4 _sn_167_apply_filter) {
+    return mix(_sn_167_apply_filter, _sn_167_apply_filter * (1.0 - _sn_167_apply_filter) * 2.0, _sn_168_intensity);
+}
+
+uniform float _sn_169_intensity;
+vec4 _sn_169_apply_filter (vec4 _sn_168_apply_filter) {
+    return mix(_sn_168_apply_filter, _sn_168_apply_filter * (1.0 - _sn_168_apply_filter) * 2.0, _sn_169_intensity);
+}
+
+uniform float _sn_170_intensity;
+vec4 _sn_170_apply_filter (vec4 _sn_169_apply_filter) {
+    return mix(_sn_169_apply_filter, _sn_169_apply_filter * (1.0 - _sn_169_apply_filter) * 2.0, _sn_170_intensity);
+}
+
+uniform float _sn_171_intensity;
+vec4 _sn_171_apply_filter (vec4 _sn_170_apply_filter) {
+    return mix(_sn_170_apply_filter, _sn_170_apply_filter * (1.0 - _sn_170_apply_filter) * 2.0, _sn_171_intensity);
+}
+
+uniform float _sn_172_intensity;
+vec4 _sn_172_apply_filter (vec4 _sn_171_apply_filter) {
+    return mix(_sn_171_apply_filter, _sn_171_apply_filter * (1.0 - _sn_171_apply_filter) * 2.0, _sn_172_intensity);
+}
+
+uniform float _sn_173_intensity;
+vec4 _sn_173_apply_filter (vec4 _sn_172_apply_filter) {
+    return mix(_sn_172_apply_filter, _sn_172_apply_filter * (1.0 - _sn_172_apply_filter) * 2.0, _sn_173_intensity);
+}
+
+uniform float _sn_174_intensity;
+vec4 _sn_174_apply_filter (vec4 _sn_173_apply_filter) {
+    return mix(_sn_173_apply_filter, _sn_173_apply_filter * (1.0 - _sn_173_apply_filter) * 2.0, _sn_174_intensity);
+}
+
+uniform float _sn_175_intensity;
+vec4 _sn_175_apply_filter (vec4 _sn_174_apply_filter) {
+    return mix(_sn_174_apply_filter, _sn_174_apply_filter * (1.0 - _sn_174_apply_filter) * 2.0, _sn_175_intensity);
+}
+
+uniform float _sn_176_intensity;
+vec4 _sn_176_apply_filter (vec4 _sn_175_apply_filter) {
+    return mix(_sn_175_apply_filter, _sn_175_apply_filter * (1.0 - _sn_175_apply_filter) * 2.0, _sn_176_intensity);
+}
+
+uniform float _sn_177_intensity;
+vec4 _sn_177_apply_filter (vec4 _sn_176_apply_filter) {
+    return mix(_sn_176_apply_filter, _sn_176_apply_filter * (1.0 - _sn_176_apply_filter) * 2.0, _sn_177_intensity);
+}
+
+uniform float _sn_178_intensity;
+vec4 _sn_178_apply_filter (vec4 _sn_177_apply_filter) {
+    return mix(_sn_177_apply_filter, _sn_177_apply_filter * (1.0 - _sn_177_apply_filter) * 2.0, _sn_178_intensity);
+}
+
+uniform float _sn_179_intensity;
+vec4 _sn_179_apply_filter (vec4 _sn_178_apply_filter) {
+    return mix(_sn_178_apply_filter, _sn_178_apply_filter * (1.0 - _sn_178_apply_filter) * 2.0, _sn_179_intensity);
+}
+
+uniform float _sn_180_intensity;
+vec4 _sn_180_apply_filter (vec4 _sn_179_apply_filter) {
+    return mix(_sn_179_apply_filter, _sn_179_apply_filter * (1.0 - _sn_179_apply_filter) * 2.0, _sn_180_intensity);
+}
+
+uniform float _sn_181_intensity;
+vec4 _sn_181_apply_filter (vec4 _sn_180_apply_filter) {
+    return mix(_sn_180_apply_filter, _sn_180_apply_filter * (1.0 - _sn_180_apply_filter) * 2.0, _sn_181_intensity);
+}
+
+uniform float _sn_182_intensity;
+vec4 _sn_182_apply_filter (vec4 _sn_181_apply_filter) {
+    return mix(_sn_181_apply_filter, _sn_181_apply_filter * (1.0 - _sn_181_apply_filter) * 2.0, _sn_182_intensity);
+}
+
+uniform float _sn_183_intensity;
+vec4 _sn_183_apply_filter (vec4 _sn_182_apply_filter) {
+    return mix(_sn_182_apply_filter, _sn_182_apply_filter * (1.0 - _sn_182_apply_filter) * 2.0, _sn_183_intensity);
+}
+
+uniform float _sn_184_intensity;
+vec4 _sn_184_apply_filter (vec4 _sn_183_apply_filter) {
+    return mix(_sn_183_apply_filter, _sn_183_apply_filter * (1.0 - _sn_183_apply_filter) * 2.0, _sn_184_intensity);
+}
+
+uniform float _sn_185_intensity;
+vec4 _sn_185_apply_filter (vec4 _sn_184_apply_filter) {
+    return mix(_sn_184_apply_filter, _sn_184_apply_filter * (1.0 - _sn_184_apply_filter) * 2.0, _sn_185_intensity);
+}
+
+uniform float _sn_186_intensity;
+vec4 _sn_186_apply_filter (vec4 _sn_185_apply_filter) {
+    return mix(_sn_185_apply_filter, _sn_185_apply_filter * (1.0 - _sn_185_apply_filter) * 2.0, _sn_186_intensity);
+}
+
+uniform float _sn_187_intensity;
+vec4 _sn_187_apply_filter (vec4 _sn_186_apply_filter) {
+    return mix(_sn_186_apply_filter, _sn_186_apply_filter * (1.0 - _sn_186_apply_filter) * 2.0, _sn_187_intensity);
+}
+
+uniform float _sn_188_intensity;
+vec4 _sn_188_apply_filter (vec4 _sn_187_apply_filter) {
+    return mix(_sn_187_apply_filter, _sn_187_apply_filter * (1.0 - _sn_187_apply_filter) * 2.0, _sn_188_intensity);
+}
+
+uniform float _sn_189_intensity;
+vec4 _sn_189_apply_filter (vec4 _sn_188_apply_filter) {
+    return mix(_sn_188_apply_filter, _sn_188_apply_filter * (1.0 - _sn_188_apply_filter) * 2.0, _sn_189_intensity);
+}
+
+uniform float _sn_190_intensity;
+vec4 _sn_190_apply_filter (vec4 _sn_189_apply_filter) {
+    return mix(_sn_189_apply_filter, _sn_189_apply_filter * (1.0 - _sn_189_apply_filter) * 2.0, _sn_190_intensity);
+}
+
+uniform float _sn_191_intensity;
+vec4 _sn_191_apply_filter (vec4 _sn_190_apply_filter) {
+    return mix(_sn_190_apply_filter, _sn_190_apply_filter * (1.0 - _sn_190_apply_filter) * 2.0, _sn_191_intensity);
+}
+
+uniform float _sn_192_intensity;
+vec4 _sn_192_apply_filter (vec4 _sn_191_apply_filter) {
+    return mix(_sn_191_apply_filter, _sn_191_apply_filter * (1.0 - _sn_191_apply_filter) * 2.0, _sn_192_intensity);
+}
+
+uniform float _sn_193_intensity;
+vec4 _sn_193_apply_filter (vec4 _sn_192_apply_filter) {
+    return mix(_sn_192_apply_filter, _sn_192_apply_filter * (1.0 - _sn_192_apply_filter) * 2.0, _sn_193_intensity);
+}
+
+uniform float _sn_194_intensity;
+vec4 _sn_194_apply_filter (vec4 _sn_193_apply_filter) {
+    return mix(_sn_193_apply_filter, _sn_193_apply_filter * (1.0 - _sn_193_apply_filter) * 2.0, _sn_194_intensity);
+}
+
+uniform float _sn_195_intensity;
+vec4 _sn_195_apply_filter (vec4 _sn_194_apply_filter) {
+    return mix(_sn_194_apply_filter, _sn_194_apply_filter * (1.0 - _sn_194_apply_filter) * 2.0, _sn_195_intensity);
+}
+
+uniform float _sn_196_intensity;
+vec4 _sn_196_apply_filter (vec4 _sn_195_apply_filter) {
+    return mix(_sn_195_apply_filter, _sn_195_apply_filter * (1.0 - _sn_195_apply_filter) * 2.0, _sn_196_intensity);
+}
+
+uniform float _sn_197_intensity;
+vec4 _sn_197_apply_filter (vec4 _sn_196_apply_filter) {
+    return mix(_sn_196_apply_filter, _sn_196_apply_filter * (1.0 - _sn_196_apply_filter) * 2.0, _sn_197_intensity);
+}
+
+uniform float _sn_198_intensity;
+vec4 _sn_198_apply_filter (vec4 _sn_197_apply_filter) {
+    return mix(_sn_197_apply_filter, _sn_197_apply_filter * (1.0 - _sn_197_apply_filter) * 2.0, _sn_198_intensity);
+}
+
+uniform float _sn_199_intensity;
+vec4 _sn_199_apply_filter (vec4 _sn_198_apply_filter) {
+    return mix(_sn_198_apply_filter, _sn_198_apply_filter * (1.0 - _sn_198_apply_filter) * 2.0, _sn_199_intensity);
+}
+
+uniform float _sn_200_intensity;
+vec4 _sn_200_apply_filter (vec4 _sn_199_apply_filter) {
+    return mix(_sn_199_apply_filter, _sn_199_apply_filter * (1.0 - _sn_199_apply_filter) * 2.0, _sn_200_intensity);
+}
+
+uniform float _sn_201_intensity;
+vec4 _sn_201_apply_filter (vec4 _sn_200_apply_filter) {
+    return mix(_sn_200_apply_filter, _sn_200_apply_filter * (1.0 - _sn_200_apply_filter) * 2.0, _sn_201_intensity);
+}
+
+void _sn_202_set_color (vec4 _sn_201_apply_filter) {
+    gl_FragColor = _sn_201_apply_filter;
+}
+
+
+void main() {
+
+  vec4 _io_1_return = _sn_1_get_vec4();
+  vec4 _io_2_return = _sn_2_apply_filter(_io_1_return);
+  vec4 _io_3_return = _sn_3_apply_filter(_io_2_return);
+  vec4 _io_4_return = _sn_4_apply_filter(_io_3_return);
+  vec4 _io_5_return = _sn_5_apply_filter(_io_4_return);
+  vec4 _io_6_return = _sn_6_apply_filter(_io_5_return);
+  vec4 _io_7_return = _sn_7_apply_filter(_io_6_return);
+  vec4 _io_8_return = _sn_8_apply_filter(_io_7_return);
+  vec4 _io_9_return = _sn_9_apply_filter(_io_8_return);
+  vec4 _io_10_return = _sn_10_apply_filter(_io_9_return);
+  vec4 _io_11_return = _sn_11_apply_filter(_io_10_return);
+  vec4 _io_12_return = _sn_12_apply_filter(_io_11_return);
+  vec4 _io_13_return = _sn_13_apply_filter(_io_12_return);
+  vec4 _io_14_return = _sn_14_apply_filter(_io_13_return);
+  vec4 _io_15_return = _sn_15_apply_filter(_io_14_return);
+  vec4 _io_16_return = _sn_16_apply_filter(_io_15_return);
+  vec4 _io_17_return = _sn_17_apply_filter(_io_16_return);
+  vec4 _io_18_return = _sn_18_apply_filter(_io_17_return);
+  vec4 _io_19_return = _sn_19_apply_filter(_io_18_return);
+  vec4 _io_20_return = _sn_20_apply_filter(_io_19_return);
+  vec4 _io_21_return = _sn_21_apply_filter(_io_20_return);
+  vec4 _io_22_return = _sn_22_apply_filter(_io_21_return);
+  vec4 _io_23_return = _sn_23_apply_filter(_io_22_return);
+  vec4 _io_24_return = _sn_24_apply_filter(_io_23_return);
+  vec4 _io_25_return = _sn_25_apply_filter(_io_24_return);
+  vec4 _io_26_return = _sn_26_apply_filter(_io_25_return);
+  vec4 _io_27_return = _sn_27_apply_filter(_io_26_return);
+  vec4 _io_28_return = _sn_28_apply_filter(_io_27_return);
+  vec4 _io_29_return = _sn_29_apply_filter(_io_28_return);
+  vec4 _io_30_return = _sn_30_apply_filter(_io_29_return);
+  vec4 _io_31_return = _sn_31_apply_filter(_io_30_return);
+  vec4 _io_32_return = _sn_32_apply_filter(_io_31_return);
+  vec4 _io_33_return = _sn_33_apply_filter(_io_32_return);
+  vec4 _io_34_return = _sn_34_apply_filter(_io_33_return);
+  vec4 _io_35_return = _sn_35_apply_filter(_io_34_return);
+  vec4 _io_36_return = _sn_36_apply_filter(_io_35_return);
+  vec4 _io_37_return = _sn_37_apply_filter(_io_36_return);
+  vec4 _io_38_return = _sn_38_apply_filter(_io_37_return);
+  vec4 _io_39_return = _sn_39_apply_filter(_io_38_return);
+  vec4 _io_40_return = _sn_40_apply_filter(_io_39_return);
+  vec4 _io_41_return = _sn_41_apply_filter(_io_40_return);
+  vec4 _io_42_return = _sn_42_apply_filter(_io_41_return);
+  vec4 _io_43_return = _sn_43_apply_filter(_io_42_return);
+  vec4 _io_44_return = _sn_44_apply_filter(_io_43_return);
+  vec4 _io_45_return = _sn_45_apply_filter(_io_44_return);
+  vec4 _io_46_return = _sn_46_apply_filter(_io_45_return);
+  vec4 _io_47_return = _sn_47_apply_filter(_io_46_return);
+  vec4 _io_48_return = _sn_48_apply_filter(_io_47_return);
+  vec4 _io_49_return = _sn_49_apply_filter(_io_48_return);
+  vec4 _io_50_return = _sn_50_apply_filter(_io_49_return);
+  vec4 _io_51_return = _sn_51_apply_filter(_io_50_return);
+  vec4 _io_52_return = _sn_52_apply_filter(_io_51_return);
+  vec4 _io_53_return = _sn_53_apply_filter(_io_52_return);
+  vec4 _io_54_return = _sn_54_apply_filter(_io_53_return);
+  vec4 _io_55_return = _sn_55_apply_filter(_io_54_return);
+  vec4 _io_56_return = _sn_56_apply_filter(_io_55_return);
+  vec4 _io_57_return = _sn_57_apply_filter(_io_56_return);
+  vec4 _io_58_return = _sn_58_apply_filter(_io_57_return);
+  vec4 _io_59_return = _sn_59_apply_filter(_io_58_return);
+  vec4 _io_60_return = _sn_60_apply_filter(_io_59_return);
+  vec4 _io_61_return = _sn_61_apply_filter(_io_60_return);
+  vec4 _io_62_return = _sn_62_apply_filter(_io_61_return);
+  vec4 _io_63_return = _sn_63_apply_filter(_io_62_return);
+  vec4 _io_64_return = _sn_64_apply_filter(_io_63_return);
+  vec4 _io_65_return = _sn_65_apply_filter(_io_64_return);
+  vec4 _io_66_return = _sn_66_apply_filter(_io_65_return);
+  vec4 _io_67_return = _sn_67_apply_filter(_io_66_return);
+  vec4 _io_68_return = _sn_68_apply_filter(_io_67_return);
+  vec4 _io_69_return = _sn_69_apply_filter(_io_68_return);
+  vec4 _io_70_return = _sn_70_apply_filter(_io_69_return);
+  vec4 _io_71_return = _sn_71_apply_filter(_io_70_return);
+  vec4 _io_72_return = _sn_72_apply_filter(_io_71_return);
+  vec4 _io_73_return = _sn_73_apply_filter(_io_72_return);
+  vec4 _io_74_return = _sn_74_apply_filter(_io_73_return);
+  vec4 _io_75_return = _sn_75_apply_filter(_io_74_return);
+  vec4 _io_76_return = _sn_76_apply_filter(_io_75_return);
+  vec4 _io_77_return = _sn_77_apply_filter(_io_76_return);
+  vec4 _io_78_return = _sn_78_apply_filter(_io_77_return);
+  vec4 _io_79_return = _sn_79_apply_filter(_io_78_return);
+  vec4 _io_80_return = _sn_80_apply_filter(_io_79_return);
+  vec4 _io_81_return = _sn_81_apply_filter(_io_80_return);
+  vec4 _io_82_return = _sn_82_apply_filter(_io_81_return);
+  vec4 _io_83_return = _sn_83_apply_filter(_io_82_return);
+  vec4 _io_84_return = _sn_84_apply_filter(_io_83_return);
+  vec4 _io_85_return = _sn_85_apply_filter(_io_84_return);
+  vec4 _io_86_return = _sn_86_apply_filter(_io_85_return);
+  vec4 _io_87_return = _sn_87_apply_filter(_io_86_return);
+  vec4 _io_88_return = _sn_88_apply_filter(_io_87_return);
+  vec4 _io_89_return = _sn_89_apply_filter(_io_88_return);
+  vec4 _io_90_return = _sn_90_apply_filter(_io_89_return);
+  vec4 _io_91_return = _sn_91_apply_filter(_io_90_return);
+  vec4 _io_92_return = _sn_92_apply_filter(_io_91_return);
+  vec4 _io_93_return = _sn_93_apply_filter(_io_92_return);
+  vec4 _io_94_return = _sn_94_apply_filter(_io_93_return);
+  vec4 _io_95_return = _sn_95_apply_filter(_io_94_return);
+  vec4 _io_96_return = _sn_96_apply_filter(_io_95_return);
+  vec4 _io_97_return = _sn_97_apply_filter(_io_96_return);
+  vec4 _io_98_return = _sn_98_apply_filter(_io_97_return);
+  vec4 _io_99_return = _sn_99_apply_filter(_io_98_return);
+  vec4 _io_100_return = _sn_100_apply_filter(_io_99_return);
+  vec4 _io_101_return = _sn_101_apply_filter(_io_100_return);
+  vec4 _io_102_return = _sn_102_apply_filter(_io_101_return);
+  vec4 _io_103_return = _sn_103_apply_filter(_io_102_return);
+  vec4 _io_104_return = _sn_104_apply_filter(_io_103_return);
+  vec4 _io_105_return = _sn_105_apply_filter(_io_104_return);
+  vec4 _io_106_return = _sn_106_apply_filter(_io_105_return);
+  vec4 _io_107_return = _sn_107_apply_filter(_io_106_return);
+  vec4 _io_108_return = _sn_108_apply_filter(_io_107_return);
+  vec4 _io_109_return = _sn_109_apply_filter(_io_108_return);
+  vec4 _io_110_return = _sn_110_apply_filter(_io_109_return);
+  vec4 _io_111_return = _sn_111_apply_filter(_io_110_return);
+  vec4 _io_112_return = _sn_112_apply_filter(_io_111_return);
+  vec4 _io_113_return = _sn_113_apply_filter(_io_112_return);
+  vec4 _io_114_return = _sn_114_apply_filter(_io_113_return);
+  vec4 _io_115_return = _sn_115_apply_filter(_io_114_return);
+  vec4 _io_116_return = _sn_116_apply_filter(_io_115_return);
+  vec4 _io_117_return = _sn_117_apply_filter(_io_116_return);
+  vec4 _io_118_return = _sn_118_apply_filter(_io_117_return);
+  vec4 _io_119_return = _sn_119_apply_filter(_io_118_return);
+  vec4 _io_120_return = _sn_120_apply_filter(_io_119_return);
+  vec4 _io_121_return = _sn_121_apply_filter(_io_120_return);
+  vec4 _io_122_return = _sn_122_apply_filter(_io_121_return);
+  vec4 _io_123_return = _sn_123_apply_filter(_io_122_return);
+  vec4 _io_124_return = _sn_124_apply_filter(_io_123_return);
+  vec4 _io_125_return = _sn_125_apply_filter(_io_124_return);
+  vec4 _io_126_return = _sn_126_apply_filter(_io_125_return);
+  vec4 _io_127_return = _sn_127_apply_filter(_io_126_return);
+  vec4 _io_128_return = _sn_128_apply_filter(_io_127_return);
+  vec4 _io_129_return = _sn_129_apply_filter(_io_128_return);
+  vec4 _io_130_return = _sn_130_apply_filter(_io_129_return);
+  vec4 _io_131_return = _sn_131_apply_filter(_io_130_return);
+  vec4 _io_132_return = _sn_132_apply_filter(_io_131_return);
+  vec4 _io_133_return = _sn_133_apply_filter(_io_132_return);
+  vec4 _io_134_return = _sn_134_apply_filter(_io_133_return);
+  vec4 _io_135_return = _sn_135_apply_filter(_io_134_return);
+  vec4 _io_136_return = _sn_136_apply_filter(_io_135_return);
+  vec4 _io_137_return = _sn_137_apply_filter(_io_136_return);
+  vec4 _io_138_return = _sn_138_apply_filter(_io_137_return);
+  vec4 _io_139_return = _sn_139_apply_filter(_io_138_return);
+  vec4 _io_140_return = _sn_140_apply_filter(_io_139_return);
+  vec4 _io_141_return = _sn_141_apply_filter(_io_140_return);
+  vec4 _io_142_return = _sn_142_apply_filter(_io_141_return);
+  vec4 _io_143_return = _sn_143_apply_filter(_io_142_return);
+  vec4 _io_144_return = _sn_144_apply_filter(_io_143_return);
+  vec4 _io_145_return = _sn_145_apply_filter(_io_144_return);
+  vec4 _io_146_return = _sn_146_apply_filter(_io_145_return);
+  vec4 _io_147_return = _sn_147_apply_filter(_io_146_return);
+  vec4 _io_148_return = _sn_148_apply_filter(_io_147_return);
+  vec4 _io_149_return = _sn_149_apply_filter(_io_148_return);
+  vec4 _io_150_return = _sn_150_apply_filter(_io_149_return);
+  vec4 _io_151_return = _sn_151_apply_filter(_io_150_return);
+  vec4 _io_152_return = _sn_152_apply_filter(_io_151_return);
+  vec4 _io_153_return = _sn_153_apply_filter(_io_152_return);
+  vec4 _io_154_return = _sn_154_apply_filter(_io_153_return);
+  vec4 _io_155_return = _sn_155_apply_filter(_io_154_return);
+  vec4 _io_156_return = _sn_156_apply_filter(_io_155_return);
+  vec4 _io_157_return = _sn_157_apply_filter(_io_156_return);
+  vec4 _io_158_return = _sn_158_apply_filter(_io_157_return);
+  vec4 _io_159_return = _sn_159_apply_filter(_io_158_return);
+  vec4 _io_160_return = _sn_160_apply_filter(_io_159_return);
+  vec4 _io_161_return = _sn_161_apply_filter(_io_160_return);
+  vec4 _io_162_return = _sn_162_apply_filter(_io_161_return);
+  vec4 _io_163_return = _sn_163_apply_filter(_io_162_return);
+  vec4 _io_164_return = _sn_164_apply_filter(_io_163_return);
+  vec4 _io_165_return = _sn_165_apply_filter(_io_164_return);
+  vec4 _io_166_return = _sn_166_apply_filter(_io_165_return);
+  vec4 _io_167_return = _sn_167_apply_filter(_io_166_return);
+  vec4 _io_168_return = _sn_168_apply_filter(_io_167_return);
+  vec4 _io_169_return = _sn_169_apply_filter(_io_168_return);
+  vec4 _io_170_return = _sn_170_apply_filter(_io_169_return);
+  vec4 _io_171_return = _sn_171_apply_filter(_io_170_return);
+  vec4 _io_172_return = _sn_172_apply_filter(_io_171_return);
+  vec4 _io_173_return = _sn_173_apply_filter(_io_172_return);
+  vec4 _io_174_return = _sn_174_apply_filter(_io_173_return);
+  vec4 _io_175_return = _sn_175_apply_filter(_io_174_return);
+  vec4 _io_176_return = _sn_176_apply_filter(_io_175_return);
+  vec4 _io_177_return = _sn_177_apply_filter(_io_176_return);
+  vec4 _io_178_return = _sn_178_apply_filter(_io_177_return);
+  vec4 _io_179_return = _sn_179_apply_filter(_io_178_return);
+  vec4 _io_180_return = _sn_180_apply_filter(_io_179_return);
+  vec4 _io_181_return = _sn_181_apply_filter(_io_180_return);
+  vec4 _io_182_return = _sn_182_apply_filter(_io_181_return);
+  vec4 _io_183_return = _sn_183_apply_filter(_io_182_return);
+  vec4 _io_184_return = _sn_184_apply_filter(_io_183_return);
+  vec4 _io_185_return = _sn_185_apply_filter(_io_184_return);
+  vec4 _io_186_return = _sn_186_apply_filter(_io_185_return);
+  vec4 _io_187_return = _sn_187_apply_filter(_io_186_return);
+  vec4 _io_188_return = _sn_188_apply_filter(_io_187_return);
+  vec4 _io_189_return = _sn_189_apply_filter(_io_188_return);
+  vec4 _io_190_return = _sn_190_apply_filter(_io_189_return);
+  vec4 _io_191_return = _sn_191_apply_filter(_io_190_return);
+  vec4 _io_192_return = _sn_192_apply_filter(_io_191_return);
+  vec4 _io_193_return = _sn_193_apply_filter(_io_192_return);
+  vec4 _io_194_return = _sn_194_apply_filter(_io_193_return);
+  vec4 _io_195_return = _sn_195_apply_filter(_io_194_return);
+  vec4 _io_196_return = _sn_196_apply_filter(_io_195_return);
+  vec4 _io_197_return = _sn_197_apply_filter(_io_196_return);
+  vec4 _io_198_return = _sn_198_apply_filter(_io_197_return);
+  vec4 _io_199_return = _sn_199_apply_filter(_io_198_return);
+  vec4 _io_200_return = _sn_200_apply_filter(_io_199_return);
+  vec4 _io_201_return = _sn_201_apply_filter(_io_200_return);
+  _sn_202_set_color(_io_201_return);
+}
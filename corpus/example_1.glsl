@@ -0,0 +1,35 @@
+uniform vec4 _sn_1_diffuse_color;
+void _sn_1_get_colors (out vec4 color1, out vec4 color2) {
+    color1 = _sn_1_diffuse_color;
+    color2 = _sn_1_diffuse_color.zyxw;
+}
+
+uniform float _sn_2_intensity;
+vec4 _sn_2_apply_filter (vec4 color1) {
+    return mix(color1, color1 * (1.0 - color1) * 2.0, _sn_2_intensity);
+}
+
+uniform float _sn_3_intensity;
+vec4 _sn_3_apply_filter (vec4 color2) {
+    return mix(color2, color2 * (1.0 - color2) * 2.0, _sn_3_intensity);
+}
+
+vec4 _sn_4_combine_colors (vec4 _sn_2_apply_filter, vec4 _sn_3_apply_filter) {
+    return _sn_2_apply_filter + _sn_3_apply_filter;
+}
+
+void _sn_5_set_color (vec4 _sn_4_combine_colors) {
+    gl_FragColor = _sn_4_combine_colors;
+}
+
+
+void main() {
+  vec4 _io_1_color1;
+  vec4 _io_1_color2;
+
+  _sn_1_get_colors(_io_1_color1, _io_1_color2);
+  vec4 _io_2_return = _sn_2_apply_filter(_io_1_color1);
+  vec4 _io_3_return = _sn_3_apply_filter(_io_1_color2);
+  vec4 _io_4_return = _sn_4_combine_colors(_io_2_return, _io_3_return);
+  _sn_5_set_color(_io_4_return);
+}
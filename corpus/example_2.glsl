@@ -0,0 +1,21 @@
+vec3 _sn_1_get_color () {
+  return vec3(0.2, 0.3, 0.4);
+}
+
+vec3 _sn_2_get_color () {
+  return vec3(0.2, 0.3, 0.4);
+}
+
+vec3 _sn_3_get_color_sum () {
+  return _sn_1_get_color() + _sn_2_get_color();
+}
+
+void _sn_4_main () {
+  gl_FragColor = vec4(_sn_3_get_color_sum(), 1.0);
+}
+
+
+void main() {
+
+  _sn_4_main();
+}
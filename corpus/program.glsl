@@ -0,0 +1,41 @@
+attribute vec2 _sn_1_position;
+varying vec2 _vy_v_texcoord;
+float _vy_v_depth;
+vec4 _sn_1_transform () {
+    _vy_v_texcoord = _sn_1_position;
+    _vy_v_depth = 0.0;
+    return vec4(_sn_1_position, 0.0, 1.0);
+}
+
+vec4 _sn_2_scale (vec4 _sn_1_transform) {
+    _vy_v_texcoord *= 0.5;
+    return _sn_1_transform * 0.5;
+}
+
+void _sn_3_set_position (vec4 _sn_2_scale) {
+    gl_Position = _sn_2_scale;
+}
+
+
+void main() {
+
+  vec4 _io_1_return = _sn_1_transform();
+  vec4 _io_2_return = _sn_2_scale(_io_1_return);
+  _sn_3_set_position(_io_2_return);
+}
+
+varying vec2 _vy_v_texcoord;
+vec4 _sn_1_get_texcoord () {
+    return vec4(_vy_v_texcoord, 0.0, 1.0);
+}
+
+void _sn_2_set_color (vec4 _sn_1_get_texcoord) {
+    gl_FragColor = _sn_1_get_texcoord;
+}
+
+
+void main() {
+
+  vec4 _io_1_return = _sn_1_get_texcoord();
+  _sn_2_set_color(_io_1_return);
+}
@@ -0,0 +1,2308 @@
+#define _sn_1_SCALE 0.5
+uniform vec4 _sn_1_base_color;
+vec4 _sn_1_get_vec4 () {
+    return _sn_1_base_color * SCALE;
+}
+
+uniform float _sn_2_intensity;
+vec4 _sn_2_apply_filter (vec4 _sn_1_get_vec4) {
+    return mix(_sn_1_get_vec4, _sn_1_get_vec4 * (1.0 - _sn_1_get_vec4) * 2.0, _sn_2_intensity);
+}
+
+#define _sn_3_SCALE 0.5
+uniform vec4 _sn_3_base_color;
+vec4 _sn_3_get_vec4 () {
+    return _sn_3_base_color * SCALE;
+}
+
+uniform float _sn_4_intensity;
+vec4 _sn_4_apply_filter (vec4 _sn_3_get_vec4) {
+    return mix(_sn_3_get_vec4, _sn_3_get_vec4 * (1.0 - _sn_3_get_vec4) * 2.0, _sn_4_intensity);
+}
+
+#define _sn_5_SCALE 0.5
+uniform vec4 _sn_5_base_color;
+vec4 _sn_5_get_vec4 () {
+    return _sn_5_base_color * SCALE;
+}
+
+uniform float _sn_6_intensity;
+vec4 _sn_6_apply_filter (vec4 _sn_5_get_vec4) {
+    return mix(_sn_5_get_vec4, _sn_5_get_vec4 * (1.0 - _sn_5_get_vec4) * 2.0, _sn_6_intensity);
+}
+
+#define _sn_7_SCALE 0.5
+uniform vec4 _sn_7_base_color;
+vec4 _sn_7_get_vec4 () {
+    return _sn_7_base_color * SCALE;
+}
+
+uniform float _sn_8_intensity;
+vec4 _sn_8_apply_filter (vec4 _sn_7_get_vec4) {
+    return mix(_sn_7_get_vec4, _sn_7_get_vec4 * (1.0 - _sn_7_get_vec4) * 2.0, _sn_8_intensity);
+}
+
+#define _sn_9_SCALE 0.5
+uniform vec4 _sn_9_base_color;
+vec4 _sn_9_get_vec4 () {
+    return _sn_9_base_color * SCALE;
+}
+
+uniform float _sn_10_intensity;
+vec4 _sn_10_apply_filter (vec4 _sn_9_get_vec4) {
+    return mix(_sn_9_get_vec4, _sn_9_get_vec4 * (1.0 - _sn_9_get_vec4) * 2.0, _sn_10_intensity);
+}
+
+#define _sn_11_SCALE 0.5
+uniform vec4 _sn_11_base_color;
+vec4 _sn_11_get_vec4 () {
+    return _sn_11_base_color * SCALE;
+}
+
+uniform float _sn_12_intensity;
+vec4 _sn_12_apply_filter (vec4 _sn_11_get_vec4) {
+    return mix(_sn_11_get_vec4, _sn_11_get_vec4 * (1.0 - _sn_11_get_vec4) * 2.0, _sn_12_intensity);
+}
+
+#define _sn_13_SCALE 0.5
+uniform vec4 _sn_13_base_color;
+vec4 _sn_13_get_vec4 () {
+    return _sn_13_base_color * SCALE;
+}
+
+uniform float _sn_14_intensity;
+vec4 _sn_14_apply_filter (vec4 _sn_13_get_vec4) {
+    return mix(_sn_13_get_vec4, _sn_13_get_vec4 * (1.0 - _sn_13_get_vec4) * 2.0, _sn_14_intensity);
+}
+
+#define _sn_15_SCALE 0.5
+uniform vec4 _sn_15_base_color;
+vec4 _sn_15_get_vec4 () {
+    return _sn_15_base_color * SCALE;
+}
+
+uniform float _sn_16_intensity;
+vec4 _sn_16_apply_filter (vec4 _sn_15_get_vec4) {
+    return mix(_sn_15_get_vec4, _sn_15_get_vec4 * (1.0 - _sn_15_get_vec4) * 2.0, _sn_16_intensity);
+}
+
+#define _sn_17_SCALE 0.5
+uniform vec4 _sn_17_base_color;
+vec4 _sn_17_get_vec4 () {
+    return _sn_17_base_color * SCALE;
+}
+
+uniform float _sn_18_intensity;
+vec4 _sn_18_apply_filter (vec4 _sn_17_get_vec4) {
+    return mix(_sn_17_get_vec4, _sn_17_get_vec4 * (1.0 - _sn_17_get_vec4) * 2.0, _sn_18_intensity);
+}
+
+#define _sn_19_SCALE 0.5
+uniform vec4 _sn_19_base_color;
+vec4 _sn_19_get_vec4 () {
+    return _sn_19_base_color * SCALE;
+}
+
+uniform float _sn_20_intensity;
+vec4 _sn_20_apply_filter (vec4 _sn_19_get_vec4) {
+    return mix(_sn_19_get_vec4, _sn_19_get_vec4 * (1.0 - _sn_19_get_vec4) * 2.0, _sn_20_intensity);
+}
+
+#define _sn_21_SCALE 0.5
+uniform vec4 _sn_21_base_color;
+vec4 _sn_21_get_vec4 () {
+    return _sn_21_base_color * SCALE;
+}
+
+uniform float _sn_22_intensity;
+vec4 _sn_22_apply_filter (vec4 _sn_21_get_vec4) {
+    return mix(_sn_21_get_vec4, _sn_21_get_vec4 * (1.0 - _sn_21_get_vec4) * 2.0, _sn_22_intensity);
+}
+
+#define _sn_23_SCALE 0.5
+uniform vec4 _sn_23_base_color;
+vec4 _sn_23_get_vec4 () {
+    return _sn_23_base_color * SCALE;
+}
+
+uniform float _sn_24_intensity;
+vec4 _sn_24_apply_filter (vec4 _sn_23_get_vec4) {
+    return mix(_sn_23_get_vec4, _sn_23_get_vec4 * (1.0 - _sn_23_get_vec4) * 2.0, _sn_24_intensity);
+}
+
+#define _sn_25_SCALE 0.5
+uniform vec4 _sn_25_base_color;
+vec4 _sn_25_get_vec4 () {
+    return _sn_25_base_color * SCALE;
+}
+
+uniform float _sn_26_intensity;
+vec4 _sn_26_apply_filter (vec4 _sn_25_get_vec4) {
+    return mix(_sn_25_get_vec4, _sn_25_get_vec4 * (1.0 - _sn_25_get_vec4) * 2.0, _sn_26_intensity);
+}
+
+#define _sn_27_SCALE 0.5
+uniform vec4 _sn_27_base_color;
+vec4 _sn_27_get_vec4 () {
+    return _sn_27_base_color * SCALE;
+}
+
+uniform float _sn_28_intensity;
+vec4 _sn_28_apply_filter (vec4 _sn_27_get_vec4) {
+    return mix(_sn_27_get_vec4, _sn_27_get_vec4 * (1.0 - _sn_27_get_vec4) * 2.0, _sn_28_intensity);
+}
+
+#define _sn_29_SCALE 0.5
+uniform vec4 _sn_29_base_color;
+vec4 _sn_29_get_vec4 () {
+    return _sn_29_base_color * SCALE;
+}
+
+uniform float _sn_30_intensity;
+vec4 _sn_30_apply_filter (vec4 _sn_29_get_vec4) {
+    return mix(_sn_29_get_vec4, _sn_29_get_vec4 * (1.0 - _sn_29_get_vec4) * 2.0, _sn_30_intensity);
+}
+
+#define _sn_31_SCALE 0.5
+uniform vec4 _sn_31_base_color;
+vec4 _sn_31_get_vec4 () {
+    return _sn_31_base_color * SCALE;
+}
+
+uniform float _sn_32_intensity;
+vec4 _sn_32_apply_filter (vec4 _sn_31_get_vec4) {
+    return mix(_sn_31_get_vec4, _sn_31_get_vec4 * (1.0 - _sn_31_get_vec4) * 2.0, _sn_32_intensity);
+}
+
+#define _sn_33_SCALE 0.5
+uniform vec4 _sn_33_base_color;
+vec4 _sn_33_get_vec4 () {
+    return _sn_33_base_color * SCALE;
+}
+
+uniform float _sn_34_intensity;
+vec4 _sn_34_apply_filter (vec4 _sn_33_get_vec4) {
+    return mix(_sn_33_get_vec4, _sn_33_get_vec4 * (1.0 - _sn_33_get_vec4) * 2.0, _sn_34_intensity);
+}
+
+#define _sn_35_SCALE 0.5
+uniform vec4 _sn_35_base_color;
+vec4 _sn_35_get_vec4 () {
+    return _sn_35_base_color * SCALE;
+}
+
+uniform float _sn_36_intensity;
+vec4 _sn_36_apply_filter (vec4 _sn_35_get_vec4) {
+    return mix(_sn_35_get_vec4, _sn_35_get_vec4 * (1.0 - _sn_35_get_vec4) * 2.0, _sn_36_intensity);
+}
+
+#define _sn_37_SCALE 0.5
+uniform vec4 _sn_37_base_color;
+vec4 _sn_37_get_vec4 () {
+    return _sn_37_base_color * SCALE;
+}
+
+uniform float _sn_38_intensity;
+vec4 _sn_38_apply_filter (vec4 _sn_37_get_vec4) {
+    return mix(_sn_37_get_vec4, _sn_37_get_vec4 * (1.0 - _sn_37_get_vec4) * 2.0, _sn_38_intensity);
+}
+
+#define _sn_39_SCALE 0.5
+uniform vec4 _sn_39_base_color;
+vec4 _sn_39_get_vec4 () {
+    return _sn_39_base_color * SCALE;
+}
+
+uniform float _sn_40_intensity;
+vec4 _sn_40_apply_filter (vec4 _sn_39_get_vec4) {
+    return mix(_sn_39_get_vec4, _sn_39_get_vec4 * (1.0 - _sn_39_get_vec4) * 2.0, _sn_40_intensity);
+}
+
+#define _sn_41_SCALE 0.5
+uniform vec4 _sn_41_base_color;
+vec4 _sn_41_get_vec4 () {
+    return _sn_41_base_color * SCALE;
+}
+
+uniform float _sn_42_intensity;
+vec4 _sn_42_apply_filter (vec4 _sn_41_get_vec4) {
+    return mix(_sn_41_get_vec4, _sn_41_get_vec4 * (1.0 - _sn_41_get_vec4) * 2.0, _sn_42_intensity);
+}
+
+#define _sn_43_SCALE 0.5
+uniform vec4 _sn_43_base_color;
+vec4 _sn_43_get_vec4 () {
+    return _sn_43_base_color * SCALE;
+}
+
+uniform float _sn_44_intensity;
+vec4 _sn_44_apply_filter (vec4 _sn_43_get_vec4) {
+    return mix(_sn_43_get_vec4, _sn_43_get_vec4 * (1.0 - _sn_43_get_vec4) * 2.0, _sn_44_intensity);
+}
+
+#define _sn_45_SCALE 0.5
+uniform vec4 _sn_45_base_color;
+vec4 _sn_45_get_vec4 () {
+    return _sn_45_base_color * SCALE;
+}
+
+uniform float _sn_46_intensity;
+vec4 _sn_46_apply_filter (vec4 _sn_45_get_vec4) {
+    return mix(_sn_45_get_vec4, _sn_45_get_vec4 * (1.0 - _sn_45_get_vec4) * 2.0, _sn_46_intensity);
+}
+
+#define _sn_47_SCALE 0.5
+uniform vec4 _sn_47_base_color;
+vec4 _sn_47_get_vec4 () {
+    return _sn_47_base_color * SCALE;
+}
+
+uniform float _sn_48_intensity;
+vec4 _sn_48_apply_filter (vec4 _sn_47_get_vec4) {
+    return mix(_sn_47_get_vec4, _sn_47_get_vec4 * (1.0 - _sn_47_get_vec4) * 2.0, _sn_48_intensity);
+}
+
+#define _sn_49_SCALE 0.5
+uniform vec4 _sn_49_base_color;
+vec4 _sn_49_get_vec4 () {
+    return _sn_49_base_color * SCALE;
+}
+
+uniform float _sn_50_intensity;
+vec4 _sn_50_apply_filter (vec4 _sn_49_get_vec4) {
+    return mix(_sn_49_get_vec4, _sn_49_get_vec4 * (1.0 - _sn_49_get_vec4) * 2.0, _sn_50_intensity);
+}
+
+#define _sn_51_SCALE 0.5
+uniform vec4 _sn_51_base_color;
+vec4 _sn_51_get_vec4 () {
+    return _sn_51_base_color * SCALE;
+}
+
+uniform float _sn_52_intensity;
+vec4 _sn_52_apply_filter (vec4 _sn_51_get_vec4) {
+    return mix(_sn_51_get_vec4, _sn_51_get_vec4 * (1.0 - _sn_51_get_vec4) * 2.0, _sn_52_intensity);
+}
+
+#define _sn_53_SCALE 0.5
+uniform vec4 _sn_53_base_color;
+vec4 _sn_53_get_vec4 () {
+    return _sn_53_base_color * SCALE;
+}
+
+uniform float _sn_54_intensity;
+vec4 _sn_54_apply_filter (vec4 _sn_53_get_vec4) {
+    return mix(_sn_53_get_vec4, _sn_53_get_vec4 * (1.0 - _sn_53_get_vec4) * 2.0, _sn_54_intensity);
+}
+
+#define _sn_55_SCALE 0.5
+uniform vec4 _sn_55_base_color;
+vec4 _sn_55_get_vec4 () {
+    return _sn_55_base_color * SCALE;
+}
+
+uniform float _sn_56_intensity;
+vec4 _sn_56_apply_filter (vec4 _sn_55_get_vec4) {
+    return mix(_sn_55_get_vec4, _sn_55_get_vec4 * (1.0 - _sn_55_get_vec4) * 2.0, _sn_56_intensity);
+}
+
+#define _sn_57_SCALE 0.5
+uniform vec4 _sn_57_base_color;
+vec4 _sn_57_get_vec4 () {
+    return _sn_57_base_color * SCALE;
+}
+
+uniform float _sn_58_intensity;
+vec4 _sn_58_apply_filter (vec4 _sn_57_get_vec4) {
+    return mix(_sn_57_get_vec4, _sn_57_get_vec4 * (1.0 - _sn_57_get_vec4) * 2.0, _sn_58_intensity);
+}
+
+#define _sn_59_SCALE 0.5
+uniform vec4 _sn_59_base_color;
+vec4 _sn_59_get_vec4 () {
+    return _sn_59_base_color * SCALE;
+}
+
+uniform float _sn_60_intensity;
+vec4 _sn_60_apply_filter (vec4 _sn_59_get_vec4) {
+    return mix(_sn_59_get_vec4, _sn_59_get_vec4 * (1.0 - _sn_59_get_vec4) * 2.0, _sn_60_intensity);
+}
+
+#define _sn_61_SCALE 0.5
+uniform vec4 _sn_61_base_color;
+vec4 _sn_61_get_vec4 () {
+    return _sn_61_base_color * SCALE;
+}
+
+uniform float _sn_62_intensity;
+vec4 _sn_62_apply_filter (vec4 _sn_61_get_vec4) {
+    return mix(_sn_61_get_vec4, _sn_61_get_vec4 * (1.0 - _sn_61_get_vec4) * 2.0, _sn_62_intensity);
+}
+
+#define _sn_63_SCALE 0.5
+uniform vec4 _sn_63_base_color;
+vec4 _sn_63_get_vec4 () {
+    return _sn_63_base_color * SCALE;
+}
+
+uniform float _sn_64_intensity;
+vec4 _sn_64_apply_filter (vec4 _sn_63_get_vec4) {
+    return mix(_sn_63_get_vec4, _sn_63_get_vec4 * (1.0 - _sn_63_get_vec4) * 2.0, _sn_64_intensity);
+}
+
+#define _sn_65_SCALE 0.5
+uniform vec4 _sn_65_base_color;
+vec4 _sn_65_get_vec4 () {
+    return _sn_65_base_color * SCALE;
+}
+
+uniform float _sn_66_intensity;
+vec4 _sn_66_apply_filter (vec4 _sn_65_get_vec4) {
+    return mix(_sn_65_get_vec4, _sn_65_get_vec4 * (1.0 - _sn_65_get_vec4) * 2.0, _sn_66_intensity);
+}
+
+#define _sn_67_SCALE 0.5
+uniform vec4 _sn_67_base_color;
+vec4 _sn_67_get_vec4 () {
+    return _sn_67_base_color * SCALE;
+}
+
+uniform float _sn_68_intensity;
+vec4 _sn_68_apply_filter (vec4 _sn_67_get_vec4) {
+    return mix(_sn_67_get_vec4, _sn_67_get_vec4 * (1.0 - _sn_67_get_vec4) * 2.0, _sn_68_intensity);
+}
+
+#define _sn_69_SCALE 0.5
+uniform vec4 _sn_69_base_color;
+vec4 _sn_69_get_vec4 () {
+    return _sn_69_base_color * SCALE;
+}
+
+uniform float _sn_70_intensity;
+vec4 _sn_70_apply_filter (vec4 _sn_69_get_vec4) {
+    return mix(_sn_69_get_vec4, _sn_69_get_vec4 * (1.0 - _sn_69_get_vec4) * 2.0, _sn_70_intensity);
+}
+
+#define _sn_71_SCALE 0.5
+uniform vec4 _sn_71_base_color;
+vec4 _sn_71_get_vec4 () {
+    return _sn_71_base_color * SCALE;
+}
+
+uniform float _sn_72_intensity;
+vec4 _sn_72_apply_filter (vec4 _sn_71_get_vec4) {
+    return mix(_sn_71_get_vec4, _sn_71_get_vec4 * (1.0 - _sn_71_get_vec4) * 2.0, _sn_72_intensity);
+}
+
+#define _sn_73_SCALE 0.5
+uniform vec4 _sn_73_base_color;
+vec4 _sn_73_get_vec4 () {
+    return _sn_73_base_color * SCALE;
+}
+
+uniform float _sn_74_intensity;
+vec4 _sn_74_apply_filter (vec4 _sn_73_get_vec4) {
+    return mix(_sn_73_get_vec4, _sn_73_get_vec4 * (1.0 - _sn_73_get_vec4) * 2.0, _sn_74_intensity);
+}
+
+#define _sn_75_SCALE 0.5
+uniform vec4 _sn_75_base_color;
+vec4 _sn_75_get_vec4 () {
+    return _sn_75_base_color * SCALE;
+}
+
+uniform float _sn_76_intensity;
+vec4 _sn_76_apply_filter (vec4 _sn_75_get_vec4) {
+    return mix(_sn_75_get_vec4, _sn_75_get_vec4 * (1.0 - _sn_75_get_vec4) * 2.0, _sn_76_intensity);
+}
+
+#define _sn_77_SCALE 0.5
+uniform vec4 _sn_77_base_color;
+vec4 _sn_77_get_vec4 () {
+    return _sn_77_base_color * SCALE;
+}
+
+uniform float _sn_78_intensity;
+vec4 _sn_78_apply_filter (vec4 _sn_77_get_vec4) {
+    return mix(_sn_77_get_vec4, _sn_77_get_vec4 * (1.0 - _sn_77_get_vec4) * 2.0, _sn_78_intensity);
+}
+
+#define _sn_79_SCALE 0.5
+uniform vec4 _sn_79_base_color;
+vec4 _sn_79_get_vec4 () {
+    return _sn_79_base_color * SCALE;
+}
+
+uniform float _sn_80_intensity;
+vec4 _sn_80_apply_filter (vec4 _sn_79_get_vec4) {
+    return mix(_sn_79_get_vec4, _sn_79_get_vec4 * (1.0 - _sn_79_get_vec4) * 2.0, _sn_80_intensity);
+}
+
+#define _sn_81_SCALE 0.5
+uniform vec4 _sn_81_base_color;
+vec4 _sn_81_get_vec4 () {
+    return _sn_81_base_color * SCALE;
+}
+
+uniform float _sn_82_intensity;
+vec4 _sn_82_apply_filter (vec4 _sn_81_get_vec4) {
+    return mix(_sn_81_get_vec4, _sn_81_get_vec4 * (1.0 - _sn_81_get_vec4) * 2.0, _sn_82_intensity);
+}
+
+#define _sn_83_SCALE 0.5
+uniform vec4 _sn_83_base_color;
+vec4 _sn_83_get_vec4 () {
+    return _sn_83_base_color * SCALE;
+}
+
+uniform float _sn_84_intensity;
+vec4 _sn_84_apply_filter (vec4 _sn_83_get_vec4) {
+    return mix(_sn_83_get_vec4, _sn_83_get_vec4 * (1.0 - _sn_83_get_vec4) * 2.0, _sn_84_intensity);
+}
+
+#define _sn_85_SCALE 0.5
+uniform vec4 _sn_85_base_color;
+vec4 _sn_85_get_vec4 () {
+    return _sn_85_base_color * SCALE;
+}
+
+uniform float _sn_86_intensity;
+vec4 _sn_86_apply_filter (vec4 _sn_85_get_vec4) {
+    return mix(_sn_85_get_vec4, _sn_85_get_vec4 * (1.0 - _sn_85_get_vec4) * 2.0, _sn_86_intensity);
+}
+
+#define _sn_87_SCALE 0.5
+uniform vec4 _sn_87_base_color;
+vec4 _sn_87_get_vec4 () {
+    return _sn_87_base_color * SCALE;
+}
+
+uniform float _sn_88_intensity;
+vec4 _sn_88_apply_filter (vec4 _sn_87_get_vec4) {
+    return mix(_sn_87_get_vec4, _sn_87_get_vec4 * (1.0 - _sn_87_get_vec4) * 2.0, _sn_88_intensity);
+}
+
+#define _sn_89_SCALE 0.5
+uniform vec4 _sn_89_base_color;
+vec4 _sn_89_get_vec4 () {
+    return _sn_89_base_color * SCALE;
+}
+
+uniform float _sn_90_intensity;
+vec4 _sn_90_apply_filter (vec4 _sn_89_get_vec4) {
+    return mix(_sn_89_get_vec4, _sn_89_get_vec4 * (1.0 - _sn_89_get_vec4) * 2.0, _sn_90_intensity);
+}
+
+#define _sn_91_SCALE 0.5
+uniform vec4 _sn_91_base_color;
+vec4 _sn_91_get_vec4 () {
+    return _sn_91_base_color * SCALE;
+}
+
+uniform float _sn_92_intensity;
+vec4 _sn_92_apply_filter (vec4 _sn_91_get_vec4) {
+    return mix(_sn_91_get_vec4, _sn_91_get_vec4 * (1.0 - _sn_91_get_vec4) * 2.0, _sn_92_intensity);
+}
+
+#define _sn_93_SCALE 0.5
+uniform vec4 _sn_93_base_color;
+vec4 _sn_93_get_vec4 () {
+    return _sn_93_base_color * SCALE;
+}
+
+uniform float _sn_94_intensity;
+vec4 _sn_94_apply_filter (vec4 _sn_93_get_vec4) {
+    return mix(_sn_93_get_vec4, _sn_93_get_vec4 * (1.0 - _sn_93_get_vec4) * 2.0, _sn_94_intensity);
+}
+
+#define _sn_95_SCALE 0.5
+uniform vec4 _sn_95_base_color;
+vec4 _sn_95_get_vec4 () {
+    return _sn_95_base_color * SCALE;
+}
+
+uniform float _sn_96_intensity;
+vec4 _sn_96_apply_filter (vec4 _sn_95_get_vec4) {
+    return mix(_sn_95_get_vec4, _sn_95_get_vec4 * (1.0 - _sn_95_get_vec4) * 2.0, _sn_96_intensity);
+}
+
+#define _sn_97_SCALE 0.5
+uniform vec4 _sn_97_base_color;
+vec4 _sn_97_get_vec4 () {
+    return _sn_97_base_color * SCALE;
+}
+
+uniform float _sn_98_intensity;
+vec4 _sn_98_apply_filter (vec4 _sn_97_get_vec4) {
+    return mix(_sn_97_get_vec4, _sn_97_get_vec4 * (1.0 - _sn_97_get_vec4) * 2.0, _sn_98_intensity);
+}
+
+#define _sn_99_SCALE 0.5
+uniform vec4 _sn_99_base_color;
+vec4 _sn_99_get_vec4 () {
+    return _sn_99_base_color * SCALE;
+}
+
+uniform float _sn_100_intensity;
+vec4 _sn_100_apply_filter (vec4 _sn_99_get_vec4) {
+    return mix(_sn_99_get_vec4, _sn_99_get_vec4 * (1.0 - _sn_99_get_vec4) * 2.0, _sn_100_intensity);
+}
+
+#define _sn_101_SCALE 0.5
+uniform vec4 _sn_101_base_color;
+vec4 _sn_101_get_vec4 () {
+    return _sn_101_base_color * SCALE;
+}
+
+uniform float _sn_102_intensity;
+vec4 _sn_102_apply_filter (vec4 _sn_101_get_vec4) {
+    return mix(_sn_101_get_vec4, _sn_101_get_vec4 * (1.0 - _sn_101_get_vec4) * 2.0, _sn_102_intensity);
+}
+
+#define _sn_103_SCALE 0.5
+uniform vec4 _sn_103_base_color;
+vec4 _sn_103_get_vec4 () {
+    return _sn_103_base_color * SCALE;
+}
+
+uniform float _sn_104_intensity;
+vec4 _sn_104_apply_filter (vec4 _sn_103_get_vec4) {
+    return mix(_sn_103_get_vec4, _sn_103_get_vec4 * (1.0 - _sn_103_get_vec4) * 2.0, _sn_104_intensity);
+}
+
+#define _sn_105_SCALE 0.5
+uniform vec4 _sn_105_base_color;
+vec4 _sn_105_get_vec4 () {
+    return _sn_105_base_color * SCALE;
+}
+
+uniform float _sn_106_intensity;
+vec4 _sn_106_apply_filter (vec4 _sn_105_get_vec4) {
+    return mix(_sn_105_get_vec4, _sn_105_get_vec4 * (1.0 - _sn_105_get_vec4) * 2.0, _sn_106_intensity);
+}
+
+#define _sn_107_SCALE 0.5
+uniform vec4 _sn_107_base_color;
+vec4 _sn_107_get_vec4 () {
+    return _sn_107_base_color * SCALE;
+}
+
+uniform float _sn_108_intensity;
+vec4 _sn_108_apply_filter (vec4 _sn_107_get_vec4) {
+    return mix(_sn_107_get_vec4, _sn_107_get_vec4 * (1.0 - _sn_107_get_vec4) * 2.0, _sn_108_intensity);
+}
+
+#define _sn_109_SCALE 0.5
+uniform vec4 _sn_109_base_color;
+vec4 _sn_109_get_vec4 () {
+    return _sn_109_base_color * SCALE;
+}
+
+uniform float _sn_110_intensity;
+vec4 _sn_110_apply_filter (vec4 _sn_109_get_vec4) {
+    return mix(_sn_109_get_vec4, _sn_109_get_vec4 * (1.0 - _sn_109_get_vec4) * 2.0, _sn_110_intensity);
+}
+
+#define _sn_111_SCALE 0.5
+uniform vec4 _sn_111_base_color;
+vec4 _sn_111_get_vec4 () {
+    return _sn_111_base_color * SCALE;
+}
+
+uniform float _sn_112_intensity;
+vec4 _sn_112_apply_filter (vec4 _sn_111_get_vec4) {
+    return mix(_sn_111_get_vec4, _sn_111_get_vec4 * (1.0 - _sn_111_get_vec4) * 2.0, _sn_112_intensity);
+}
+
+#define _sn_113_SCALE 0.5
+uniform vec4 _sn_113_base_color;
+vec4 _sn_113_get_vec4 () {
+    return _sn_113_base_color * SCALE;
+}
+
+uniform float _sn_114_intensity;
+vec4 _sn_114_apply_filter (vec4 _sn_113_get_vec4) {
+    return mix(_sn_113_get_vec4, _sn_113_get_vec4 * (1.0 - _sn_113_get_vec4) * 2.0, _sn_114_intensity);
+}
+
+#define _sn_115_SCALE 0.5
+uniform vec4 _sn_115_base_color;
+vec4 _sn_115_get_vec4 () {
+    return _sn_115_base_color * SCALE;
+}
+
+uniform float _sn_116_intensity;
+vec4 _sn_116_apply_filter (vec4 _sn_115_get_vec4) {
+    return mix(_sn_115_get_vec4, _sn_115_get_vec4 * (1.0 - _sn_115_get_vec4) * 2.0, _sn_116_intensity);
+}
+
+#define _sn_117_SCALE 0.5
+uniform vec4 _sn_117_base_color;
+vec4 _sn_117_get_vec4 () {
+    return _sn_117_base_color * SCALE;
+}
+
+uniform float _sn_118_intensity;
+vec4 _sn_118_apply_filter (vec4 _sn_117_get_vec4) {
+    return mix(_sn_117_get_vec4, _sn_117_get_vec4 * (1.0 - _sn_117_get_vec4) * 2.0, _sn_118_intensity);
+}
+
+#define _sn_119_SCALE 0.5
+uniform vec4 _sn_119_base_color;
+vec4 _sn_119_get_vec4 () {
+    return _sn_119_base_color * SCALE;
+}
+
+uniform float _sn_120_intensity;
+vec4 _sn_120_apply_filter (vec4 _sn_119_get_vec4) {
+    return mix(_sn_119_get_vec4, _sn_119_get_vec4 * (1.0 - _sn_119_get_vec4) * 2.0, _sn_120_intensity);
+}
+
+#define _sn_121_SCALE 0.5
+uniform vec4 _sn_121_base_color;
+vec4 _sn_121_get_vec4 () {
+    return _sn_121_base_color * SCALE;
+}
+
+uniform float _sn_122_intensity;
+vec4 _sn_122_apply_filter (vec4 _sn_121_get_vec4) {
+    return mix(_sn_121_get_vec4, _sn_121_get_vec4 * (1.0 - _sn_121_get_vec4) * 2.0, _sn_122_intensity);
+}
+
+#define _sn_123_SCALE 0.5
+uniform vec4 _sn_123_base_color;
+vec4 _sn_123_get_vec4 () {
+    return _sn_123_base_color * SCALE;
+}
+
+uniform float _sn_124_intensity;
+vec4 _sn_124_apply_filter (vec4 _sn_123_get_vec4) {
+    return mix(_sn_123_get_vec4, _sn_123_get_vec4 * (1.0 - _sn_123_get_vec4) * 2.0, _sn_124_intensity);
+}
+
+#define _sn_125_SCALE 0.5
+uniform vec4 _sn_125_base_color;
+vec4 _sn_125_get_vec4 () {
+    return _sn_125_base_color * SCALE;
+}
+
+uniform float _sn_126_intensity;
+vec4 _sn_126_apply_filter (vec4 _sn_125_get_vec4) {
+    return mix(_sn_125_get_vec4, _sn_125_get_vec4 * (1.0 - _sn_125_get_vec4) * 2.0, _sn_126_intensity);
+}
+
+#define _sn_127_SCALE 0.5
+uniform vec4 _sn_127_base_color;
+vec4 _sn_127_get_vec4 () {
+    return _sn_127_base_color * SCALE;
+}
+
+uniform float _sn_128_intensity;
+vec4 _sn_128_apply_filter (vec4 _sn_127_get_vec4) {
+    return mix(_sn_127_get_vec4, _sn_127_get_vec4 * (1.0 - _sn_127_get_vec4) * 2.0, _sn_128_intensity);
+}
+
+#define _sn_129_SCALE 0.5
+uniform vec4 _sn_129_base_color;
+vec4 _sn_129_get_vec4 () {
+    return _sn_129_base_color * SCALE;
+}
+
+uniform float _sn_130_intensity;
+vec4 _sn_130_apply_filter (vec4 _sn_129_get_vec4) {
+    return mix(_sn_129_get_vec4, _sn_129_get_vec4 * (1.0 - _sn_129_get_vec4) * 2.0, _sn_130_intensity);
+}
+
+#define _sn_131_SCALE 0.5
+uniform vec4 _sn_131_base_color;
+vec4 _sn_131_get_vec4 () {
+    return _sn_131_base_color * SCALE;
+}
+
+uniform float _sn_132_intensity;
+vec4 _sn_132_apply_filter (vec4 _sn_131_get_vec4) {
+    return mix(_sn_131_get_vec4, _sn_131_get_vec4 * (1.0 - _sn_131_get_vec4) * 2.0, _sn_132_intensity);
+}
+
+#define _sn_133_SCALE 0.5
+uniform vec4 _sn_133_base_color;
+vec4 _sn_133_get_vec4 () {
+    return _sn_133_base_color * SCALE;
+}
+
+uniform float _sn_134_intensity;
+vec4 _sn_134_apply_filter (vec4 _sn_133_get_vec4) {
+    return mix(_sn_133_get_vec4, _sn_133_get_vec4 * (1.0 - _sn_133_get_vec4) * 2.0, _sn_134_intensity);
+}
+
+#define _sn_135_SCALE 0.5
+uniform vec4 _sn_135_base_color;
+vec4 _sn_135_get_vec4 () {
+    return _sn_135_base_color * SCALE;
+}
+
+uniform float _sn_136_intensity;
+vec4 _sn_136_apply_filter (vec4 _sn_135_get_vec4) {
+    return mix(_sn_135_get_vec4, _sn_135_get_vec4 * (1.0 - _sn_135_get_vec4) * 2.0, _sn_136_intensity);
+}
+
+#define _sn_137_SCALE 0.5
+uniform vec4 _sn_137_base_color;
+vec4 _sn_137_get_vec4 () {
+    return _sn_137_base_color * SCALE;
+}
+
+uniform float _sn_138_intensity;
+vec4 _sn_138_apply_filter (vec4 _sn_137_get_vec4) {
+    return mix(_sn_137_get_vec4, _sn_137_get_vec4 * (1.0 - _sn_137_get_vec4) * 2.0, _sn_138_intensity);
+}
+
+#define _sn_139_SCALE 0.5
+uniform vec4 _sn_139_base_color;
+vec4 _sn_139_get_vec4 () {
+    return _sn_139_base_color * SCALE;
+}
+
+uniform float _sn_140_intensity;
+vec4 _sn_140_apply_filter (vec4 _sn_139_get_vec4) {
+    return mix(_sn_139_get_vec4, _sn_139_get_vec4 * (1.0 - _sn_139_get_vec4) * 2.0, _sn_140_intensity);
+}
+
+#define _sn_141_SCALE 0.5
+uniform vec4 _sn_141_base_color;
+vec4 _sn_141_get_vec4 () {
+    return _sn_141_base_color * SCALE;
+}
+
+uniform float _sn_142_intensity;
+vec4 _sn_142_apply_filter (vec4 _sn_141_get_vec4) {
+    return mix(_sn_141_get_vec4, _sn_141_get_vec4 * (1.0 - _sn_141_get_vec4) * 2.0, _sn_142_intensity);
+}
+
+#define _sn_143_SCALE 0.5
+uniform vec4 _sn_143_base_color;
+vec4 _sn_143_get_vec4 () {
+    return _sn_143_base_color * SCALE;
+}
+
+uniform float _sn_144_intensity;
+vec4 _sn_144_apply_filter (vec4 _sn_143_get_vec4) {
+    return mix(_sn_143_get_vec4, _sn_143_get_vec4 * (1.0 - _sn_143_get_vec4) * 2.0, _sn_144_intensity);
+}
+
+#define _sn_145_SCALE 0.5
+uniform vec4 _sn_145_base_color;
+vec4 _sn_145_get_vec4 () {
+    return _sn_145_base_color * SCALE;
+}
+
+uniform float _sn_146_intensity;
+vec4 _sn_146_apply_filter (vec4 _sn_145_get_vec4) {
+    return mix(_sn_145_get_vec4, _sn_145_get_vec4 * (1.0 - _sn_145_get_vec4) * 2.0, _sn_146_intensity);
+}
+
+#define _sn_147_SCALE 0.5
+uniform vec4 _sn_147_base_color;
+vec4 _sn_147_get_vec4 () {
+    return _sn_147_base_color * SCALE;
+}
+
+uniform float _sn_148_intensity;
+vec4 _sn_148_apply_filter (vec4 _sn_147_get_vec4) {
+    return mix(_sn_147_get_vec4, _sn_147_get_vec4 * (1.0 - _sn_147_get_vec4) * 2.0, _sn_148_intensity);
+}
+
+#define _sn_149_SCALE 0.5
+uniform vec4 _sn_149_base_color;
+vec4 _sn_149_get_vec4 () {
+    return _sn_149_base_color * SCALE;
+}
+
+uniform float _sn_150_intensity;
+vec4 _sn_150_apply_filter (vec4 _sn_149_get_vec4) {
+    return mix(_sn_149_get_vec4, _sn_149_get_vec4 * (1.0 - _sn_149_get_vec4) * 2.0, _sn_150_intensity);
+}
+
+#define _sn_151_SCALE 0.5
+uniform vec4 _sn_151_base_color;
+vec4 _sn_151_get_vec4 () {
+    return _sn_151_base_color * SCALE;
+}
+
+uniform float _sn_152_intensity;
+vec4 _sn_152_apply_filter (vec4 _sn_151_get_vec4) {
+    return mix(_sn_151_get_vec4, _sn_151_get_vec4 * (1.0 - _sn_151_get_vec4) * 2.0, _sn_152_intensity);
+}
+
+#define _sn_153_SCALE 0.5
+uniform vec4 _sn_153_base_color;
+vec4 _sn_153_get_vec4 () {
+    return _sn_153_base_color * SCALE;
+}
+
+uniform float _sn_154_intensity;
+vec4 _sn_154_apply_filter (vec4 _sn_153_get_vec4) {
+    return mix(_sn_153_get_vec4, _sn_153_get_vec4 * (1.0 - _sn_153_get_vec4) * 2.0, _sn_154_intensity);
+}
+
+#define _sn_155_SCALE 0.5
+uniform vec4 _sn_155_base_color;
+vec4 _sn_155_get_vec4 () {
+    return _sn_155_base_color * SCALE;
+}
+
+uniform float _sn_156_intensity;
+vec4 _sn_156_apply_filter (vec4 _sn_155_get_vec4) {
+    return mix(_sn_155_get_vec4, _sn_155_get_vec4 * (1.0 - _sn_155_get_vec4) * 2.0, _sn_156_intensity);
+}
+
+#define _sn_157_SCALE 0.5
+uniform vec4 _sn_157_base_color;
+vec4 _sn_157_get_vec4 () {
+    return _sn_157_base_color * SCALE;
+}
+
+uniform float _sn_158_intensity;
+vec4 _sn_158_apply_filter (vec4 _sn_157_get_vec4) {
+    return mix(_sn_157_get_vec4, _sn_157_get_vec4 * (1.0 - _sn_157_get_vec4) * 2.0, _sn_158_intensity);
+}
+
+#define _sn_159_SCALE 0.5
+uniform vec4 _sn_159_base_color;
+vec4 _sn_159_get_vec4 () {
+    return _sn_159_base_color * SCALE;
+}
+
+uniform float _sn_160_intensity;
+vec4 _sn_160_apply_filter (vec4 _sn_159_get_vec4) {
+    return mix(_sn_159_get_vec4, _sn_159_get_vec4 * (1.0 - _sn_159_get_vec4) * 2.0, _sn_160_intensity);
+}
+
+#define _sn_161_SCALE 0.5
+uniform vec4 _sn_161_base_color;
+vec4 _sn_161_get_vec4 () {
+    return _sn_161_base_color * SCALE;
+}
+
+uniform float _sn_162_intensity;
+vec4 _sn_162_apply_filter (vec4 _sn_161_get_vec4) {
+    return mix(_sn_161_get_vec4, _sn_161_get_vec4 * (1.0 - _sn_161_get_vec4) * 2.0, _sn_162_intensity);
+}
+
+#define _sn_163_SCALE 0.5
+uniform vec4 _sn_163_base_color;
+vec4 _sn_163_get_vec4 () {
+    return _sn_163_base_color * SCALE;
+}
+
+uniform float _sn_164_intensity;
+vec4 _sn_164_apply_filter (vec4 _sn_163_get_vec4) {
+    return mix(_sn_163_get_vec4, _sn_163_get_vec4 * (1.0 - _sn_163_get_vec4) * 2.0, _sn_164_intensity);
+}
+
+#define _sn_165_SCALE 0.5
+uniform vec4 _sn_165_base_color;
+vec4 _sn_165_get_vec4 () {
+    return _sn_165_base_color * SCALE;
+}
+
+uniform float _sn_166_intensity;
+vec4 _sn_166_apply_filter (vec4 _sn_165_get_vec4) {
+    return mix(_sn_165_get_vec4, _sn_165_get_vec4 * (1.0 - _sn_165_get_vec4) * 2.0, _sn_166_intensity);
+}
+
+#define _sn_167_SCALE 0.5
+uniform vec4 _sn_167_base_color;
+vec4 _sn_167_get_vec4 () {
+    return _sn_167_base_color * SCALE;
+}
+
+uniform float _sn_168_intensity;
+vec4 _sn_168_apply_filter (vec4 _sn_167_get_vec4) {
+    return mix(_sn_167_get_vec4, _sn_167_get_vec4 * (1.0 - _sn_167_get_vec4) * 2.0, _sn_168_intensity);
+}
+
+#define _sn_169_SCALE 0.5
+uniform vec4 _sn_169_base_color;
+vec4 _sn_169_get_vec4 () {
+    return _sn_169_base_color * SCALE;
+}
+
+uniform float _sn_170_intensity;
+vec4 _sn_170_apply_filter (vec4 _sn_169_get_vec4) {
+    return mix(_sn_169_get_vec4, _sn_169_get_vec4 * (1.0 - _sn_169_get_vec4) * 2.0, _sn_170_intensity);
+}
+
+#define _sn_171_SCALE 0.5
+uniform vec4 _sn_171_base_color;
+vec4 _sn_171_get_vec4 () {
+    return _sn_171_base_color * SCALE;
+}
+
+uniform float _sn_172_intensity;
+vec4 _sn_172_apply_filter (vec4 _sn_171_get_vec4) {
+    return mix(_sn_171_get_vec4, _sn_171_get_vec4 * (1.0 - _sn_171_get_vec4) * 2.0, _sn_172_intensity);
+}
+
+#define _sn_173_SCALE 0.5
+uniform vec4 _sn_173_base_color;
+vec4 _sn_173_get_vec4 () {
+    return _sn_173_base_color * SCALE;
+}
+
+uniform float _sn_174_intensity;
+vec4 _sn_174_apply_filter (vec4 _sn_173_get_vec4) {
+    return mix(_sn_173_get_vec4, _sn_173_get_vec4 * (1.0 - _sn_173_get_vec4) * 2.0, _sn_174_intensity);
+}
+
+#define _sn_175_SCALE 0.5
+uniform vec4 _sn_175_base_color;
+vec4 _sn_175_get_vec4 () {
+    return _sn_175_base_color * SCALE;
+}
+
+uniform float _sn_176_intensity;
+vec4 _sn_176_apply_filter (vec4 _sn_175_get_vec4) {
+    return mix(_sn_175_get_vec4, _sn_175_get_vec4 * (1.0 - _sn_175_get_vec4) * 2.0, _sn_176_intensity);
+}
+
+#define _sn_177_SCALE 0.5
+uniform vec4 _sn_177_base_color;
+vec4 _sn_177_get_vec4 () {
+    return _sn_177_base_color * SCALE;
+}
+
+uniform float _sn_178_intensity;
+vec4 _sn_178_apply_filter (vec4 _sn_177_get_vec4) {
+    return mix(_sn_177_get_vec4, _sn_177_get_vec4 * (1.0 - _sn_177_get_vec4) * 2.0, _sn_178_intensity);
+}
+
+#define _sn_179_SCALE 0.5
+uniform vec4 _sn_179_base_color;
+vec4 _sn_179_get_vec4 () {
+    return _sn_179_base_color * SCALE;
+}
+
+uniform float _sn_180_intensity;
+vec4 _sn_180_apply_filter (vec4 _sn_179_get_vec4) {
+    return mix(_sn_179_get_vec4, _sn_179_get_vec4 * (1.0 - _sn_179_get_vec4) * 2.0, _sn_180_intensity);
+}
+
+#define _sn_181_SCALE 0.5
+uniform vec4 _sn_181_base_color;
+vec4 _sn_181_get_vec4 () {
+    return _sn_181_base_color * SCALE;
+}
+
+uniform float _sn_182_intensity;
+vec4 _sn_182_apply_filter (vec4 _sn_181_get_vec4) {
+    return mix(_sn_181_get_vec4, _sn_181_get_vec4 * (1.0 - _sn_181_get_vec4) * 2.0, _sn_182_intensity);
+}
+
+#define _sn_183_SCALE 0.5
+uniform vec4 _sn_183_base_color;
+vec4 _sn_183_get_vec4 () {
+    return _sn_183_base_color * SCALE;
+}
+
+uniform float _sn_184_intensity;
+vec4 _sn_184_apply_filter (vec4 _sn_183_get_vec4) {
+    return mix(_sn_183_get_vec4, _sn_183_get_vec4 * (1.0 - _sn_183_get_vec4) * 2.0, _sn_184_intensity);
+}
+
+#define _sn_185_SCALE 0.5
+uniform vec4 _sn_185_base_color;
+vec4 _sn_185_get_vec4 () {
+    return _sn_185_base_color * SCALE;
+}
+
+uniform float _sn_186_intensity;
+vec4 _sn_186_apply_filter (vec4 _sn_185_get_vec4) {
+    return mix(_sn_185_get_vec4, _sn_185_get_vec4 * (1.0 - _sn_185_get_vec4) * 2.0, _sn_186_intensity);
+}
+
+#define _sn_187_SCALE 0.5
+uniform vec4 _sn_187_base_color;
+vec4 _sn_187_get_vec4 () {
+    return _sn_187_base_color * SCALE;
+}
+
+uniform float _sn_188_intensity;
+vec4 _sn_188_apply_filter (vec4 _sn_187_get_vec4) {
+    return mix(_sn_187_get_vec4, _sn_187_get_vec4 * (1.0 - _sn_187_get_vec4) * 2.0, _sn_188_intensity);
+}
+
+#define _sn_189_SCALE 0.5
+uniform vec4 _sn_189_base_color;
+vec4 _sn_189_get_vec4 () {
+    return _sn_189_base_color * SCALE;
+}
+
+uniform float _sn_190_intensity;
+vec4 _sn_190_apply_filter (vec4 _sn_189_get_vec4) {
+    return mix(_sn_189_get_vec4, _sn_189_get_vec4 * (1.0 - _sn_189_get_vec4) * 2.0, _sn_190_intensity);
+}
+
+#define _sn_191_SCALE 0.5
+uniform vec4 _sn_191_base_color;
+vec4 _sn_191_get_vec4 () {
+    return _sn_191_base_color * SCALE;
+}
+
+uniform float _sn_192_intensity;
+vec4 _sn_192_apply_filter (vec4 _sn_191_get_vec4) {
+    return mix(_sn_191_get_vec4, _sn_191_get_vec4 * (1.0 - _sn_191_get_vec4) * 2.0, _sn_192_intensity);
+}
+
+#define _sn_193_SCALE 0.5
+uniform vec4 _sn_193_base_color;
+vec4 _sn_193_get_vec4 () {
+    return _sn_193_base_color * SCALE;
+}
+
+uniform float _sn_194_intensity;
+vec4 _sn_194_apply_filter (vec4 _sn_193_get_vec4) {
+    return mix(_sn_193_get_vec4, _sn_193_get_vec4 * (1.0 - _sn_193_get_vec4) * 2.0, _sn_194_intensity);
+}
+
+#define _sn_195_SCALE 0.5
+uniform vec4 _sn_195_base_color;
+vec4 _sn_195_get_vec4 () {
+    return _sn_195_base_color * SCALE;
+}
+
+uniform float _sn_196_intensity;
+vec4 _sn_196_apply_filter (vec4 _sn_195_get_vec4) {
+    return mix(_sn_195_get_vec4, _sn_195_get_vec4 * (1.0 - _sn_195_get_vec4) * 2.0, _sn_196_intensity);
+}
+
+#define _sn_197_SCALE 0.5
+uniform vec4 _sn_197_base_color;
+vec4 _sn_197_get_vec4 () {
+    return _sn_197_base_color * SCALE;
+}
+
+uniform float _sn_198_intensity;
+vec4 _sn_198_apply_filter (vec4 _sn_197_get_vec4) {
+    return mix(_sn_197_get_vec4, _sn_197_get_vec4 * (1.0 - _sn_197_get_vec4) * 2.0, _sn_198_intensity);
+}
+
+#define _sn_199_SCALE 0.5
+uniform vec4 _sn_199_base_color;
+vec4 _sn_199_get_vec4 () {
+    return _sn_199_base_color * SCALE;
+}
+
+uniform float _sn_200_intensity;
+vec4 _sn_200_apply_filter (vec4 _sn_199_get_vec4) {
+    return mix(_sn_199_get_vec4, _sn_199_get_vec4 * (1.0 - _sn_199_get_vec4) * 2.0, _sn_200_intensity);
+}
+
+#define _sn_201_SCALE 0.5
+uniform vec4 _sn_201_base_color;
+vec4 _sn_201_get_vec4 () {
+    return _sn_201_base_color * SCALE;
+}
+
+uniform float _sn_202_intensity;
+vec4 _sn_202_apply_filter (vec4 _sn_201_get_vec4) {
+    return mix(_sn_201_get_vec4, _sn_201_get_vec4 * (1.0 - _sn_201_get_vec4) * 2.0, _sn_202_intensity);
+}
+
+#define _sn_203_SCALE 0.5
+uniform vec4 _sn_203_base_color;
+vec4 _sn_203_get_vec4 () {
+    return _sn_203_base_color * SCALE;
+}
+
+uniform float _sn_204_intensity;
+vec4 _sn_204_apply_filter (vec4 _sn_203_get_vec4) {
+    return mix(_sn_203_get_vec4, _sn_203_get_vec4 * (1.0 - _sn_203_get_vec4) * 2.0, _sn_204_intensity);
+}
+
+#define _sn_205_SCALE 0.5
+uniform vec4 _sn_205_base_color;
+vec4 _sn_205_get_vec4 () {
+    return _sn_205_base_color * SCALE;
+}
+
+uniform float _sn_206_intensity;
+vec4 _sn_206_apply_filter (vec4 _sn_205_get_vec4) {
+    return mix(_sn_205_get_vec4, _sn_205_get_vec4 * (1.0 - _sn_205_get_vec4) * 2.0, _sn_206_intensity);
+}
+
+#define _sn_207_SCALE 0.5
+uniform vec4 _sn_207_base_color;
+vec4 _sn_207_get_vec4 () {
+    return _sn_207_base_color * SCALE;
+}
+
+uniform float _sn_208_intensity;
+vec4 _sn_208_apply_filter (vec4 _sn_207_get_vec4) {
+    return mix(_sn_207_get_vec4, _sn_207_get_vec4 * (1.0 - _sn_207_get_vec4) * 2.0, _sn_208_intensity);
+}
+
+#define _sn_209_SCALE 0.5
+uniform vec4 _sn_209_base_color;
+vec4 _sn_209_get_vec4 () {
+    return _sn_209_base_color * SCALE;
+}
+
+uniform float _sn_210_intensity;
+vec4 _sn_210_apply_filter (vec4 _sn_209_get_vec4) {
+    return mix(_sn_209_get_vec4, _sn_209_get_vec4 * (1.0 - _sn_209_get_vec4) * 2.0, _sn_210_intensity);
+}
+
+#define _sn_211_SCALE 0.5
+uniform vec4 _sn_211_base_color;
+vec4 _sn_211_get_vec4 () {
+    return _sn_211_base_color * SCALE;
+}
+
+uniform float _sn_212_intensity;
+vec4 _sn_212_apply_filter (vec4 _sn_211_get_vec4) {
+    return mix(_sn_211_get_vec4, _sn_211_get_vec4 * (1.0 - _sn_211_get_vec4) * 2.0, _sn_212_intensity);
+}
+
+#define _sn_213_SCALE 0.5
+uniform vec4 _sn_213_base_color;
+vec4 _sn_213_get_vec4 () {
+    return _sn_213_base_color * SCALE;
+}
+
+uniform float _sn_214_intensity;
+vec4 _sn_214_apply_filter (vec4 _sn_213_get_vec4) {
+    return mix(_sn_213_get_vec4, _sn_213_get_vec4 * (1.0 - _sn_213_get_vec4) * 2.0, _sn_214_intensity);
+}
+
+#define _sn_215_SCALE 0.5
+uniform vec4 _sn_215_base_color;
+vec4 _sn_215_get_vec4 () {
+    return _sn_215_base_color * SCALE;
+}
+
+uniform float _sn_216_intensity;
+vec4 _sn_216_apply_filter (vec4 _sn_215_get_vec4) {
+    return mix(_sn_215_get_vec4, _sn_215_get_vec4 * (1.0 - _sn_215_get_vec4) * 2.0, _sn_216_intensity);
+}
+
+#define _sn_217_SCALE 0.5
+uniform vec4 _sn_217_base_color;
+vec4 _sn_217_get_vec4 () {
+    return _sn_217_base_color * SCALE;
+}
+
+uniform float _sn_218_intensity;
+vec4 _sn_218_apply_filter (vec4 _sn_217_get_vec4) {
+    return mix(_sn_217_get_vec4, _sn_217_get_vec4 * (1.0 - _sn_217_get_vec4) * 2.0, _sn_218_intensity);
+}
+
+#define _sn_219_SCALE 0.5
+uniform vec4 _sn_219_base_color;
+vec4 _sn_219_get_vec4 () {
+    return _sn_219_base_color * SCALE;
+}
+
+uniform float _sn_220_intensity;
+vec4 _sn_220_apply_filter (vec4 _sn_219_get_vec4) {
+    return mix(_sn_219_get_vec4, _sn_219_get_vec4 * (1.0 - _sn_219_get_vec4) * 2.0, _sn_220_intensity);
+}
+
+#define _sn_221_SCALE 0.5
+uniform vec4 _sn_221_base_color;
+vec4 _sn_221_get_vec4 () {
+    return _sn_221_base_color * SCALE;
+}
+
+uniform float _sn_222_intensity;
+vec4 _sn_222_apply_filter (vec4 _sn_221_get_vec4) {
+    return mix(_sn_221_get_vec4, _sn_221_get_vec4 * (1.0 - _sn_221_get_vec4) * 2.0, _sn_222_intensity);
+}
+
+#define _sn_223_SCALE 0.5
+uniform vec4 _sn_223_base_color;
+vec4 _sn_223_get_vec4 () {
+    return _sn_223_base_color * SCALE;
+}
+
+uniform float _sn_224_intensity;
+vec4 _sn_224_apply_filter (vec4 _sn_223_get_vec4) {
+    return mix(_sn_223_get_vec4, _sn_223_get_vec4 * (1.0 - _sn_223_get_vec4) * 2.0, _sn_224_intensity);
+}
+
+#define _sn_225_SCALE 0.5
+uniform vec4 _sn_225_base_color;
+vec4 _sn_225_get_vec4 () {
+    return _sn_225_base_color * SCALE;
+}
+
+uniform float _sn_226_intensity;
+vec4 _sn_226_apply_filter (vec4 _sn_225_get_vec4) {
+    return mix(_sn_225_get_vec4, _sn_225_get_vec4 * (1.0 - _sn_225_get_vec4) * 2.0, _sn_226_intensity);
+}
+
+#define _sn_227_SCALE 0.5
+uniform vec4 _sn_227_base_color;
+vec4 _sn_227_get_vec4 () {
+    return _sn_227_base_color * SCALE;
+}
+
+uniform float _sn_228_intensity;
+vec4 _sn_228_apply_filter (vec4 _sn_227_get_vec4) {
+    return mix(_sn_227_get_vec4, _sn_227_get_vec4 * (1.0 - _sn_227_get_vec4) * 2.0, _sn_228_intensity);
+}
+
+#define _sn_229_SCALE 0.5
+uniform vec4 _sn_229_base_color;
+vec4 _sn_229_get_vec4 () {
+    return _sn_229_base_color * SCALE;
+}
+
+uniform float _sn_230_intensity;
+vec4 _sn_230_apply_filter (vec4 _sn_229_get_vec4) {
+    return mix(_sn_229_get_vec4, _sn_229_get_vec4 * (1.0 - _sn_229_get_vec4) * 2.0, _sn_230_intensity);
+}
+
+#define _sn_231_SCALE 0.5
+uniform vec4 _sn_231_base_color;
+vec4 _sn_231_get_vec4 () {
+    return _sn_231_base_color * SCALE;
+}
+
+uniform float _sn_232_intensity;
+vec4 _sn_232_apply_filter (vec4 _sn_231_get_vec4) {
+    return mix(_sn_231_get_vec4, _sn_231_get_vec4 * (1.0 - _sn_231_get_vec4) * 2.0, _sn_232_intensity);
+}
+
+#define _sn_233_SCALE 0.5
+uniform vec4 _sn_233_base_color;
+vec4 _sn_233_get_vec4 () {
+    return _sn_233_base_color * SCALE;
+}
+
+uniform float _sn_234_intensity;
+vec4 _sn_234_apply_filter (vec4 _sn_233_get_vec4) {
+    return mix(_sn_233_get_vec4, _sn_233_get_vec4 * (1.0 - _sn_233_get_vec4) * 2.0, _sn_234_intensity);
+}
+
+#define _sn_235_SCALE 0.5
+uniform vec4 _sn_235_base_color;
+vec4 _sn_235_get_vec4 () {
+    return _sn_235_base_color * SCALE;
+}
+
+uniform float _sn_236_intensity;
+vec4 _sn_236_apply_filter (vec4 _sn_235_get_vec4) {
+    return mix(_sn_235_get_vec4, _sn_235_get_vec4 * (1.0 - _sn_235_get_vec4) * 2.0, _sn_236_intensity);
+}
+
+#define _sn_237_SCALE 0.5
+uniform vec4 _sn_237_base_color;
+vec4 _sn_237_get_vec4 () {
+    return _sn_237_base_color * SCALE;
+}
+
+uniform float _sn_238_intensity;
+vec4 _sn_238_apply_filter (vec4 _sn_237_get_vec4) {
+    return mix(_sn_237_get_vec4, _sn_237_get_vec4 * (1.0 - _sn_237_get_vec4) * 2.0, _sn_238_intensity);
+}
+
+#define _sn_239_SCALE 0.5
+uniform vec4 _sn_239_base_color;
+vec4 _sn_239_get_vec4 () {
+    return _sn_239_base_color * SCALE;
+}
+
+uniform float _sn_240_intensity;
+vec4 _sn_240_apply_filter (vec4 _sn_239_get_vec4) {
+    return mix(_sn_239_get_vec4, _sn_239_get_vec4 * (1.0 - _sn_239_get_vec4) * 2.0, _sn_240_intensity);
+}
+
+#define _sn_241_SCALE 0.5
+uniform vec4 _sn_241_base_color;
+vec4 _sn_241_get_vec4 () {
+    return _sn_241_base_color * SCALE;
+}
+
+uniform float _sn_242_intensity;
+vec4 _sn_242_apply_filter (vec4 _sn_241_get_vec4) {
+    return mix(_sn_241_get_vec4, _sn_241_get_vec4 * (1.0 - _sn_241_get_vec4) * 2.0, _sn_242_intensity);
+}
+
+#define _sn_243_SCALE 0.5
+uniform vec4 _sn_243_base_color;
+vec4 _sn_243_get_vec4 () {
+    return _sn_243_base_color * SCALE;
+}
+
+uniform float _sn_244_intensity;
+vec4 _sn_244_apply_filter (vec4 _sn_243_get_vec4) {
+    return mix(_sn_243_get_vec4, _sn_243_get_vec4 * (1.0 - _sn_243_get_vec4) * 2.0, _sn_244_intensity);
+}
+
+#define _sn_245_SCALE 0.5
+uniform vec4 _sn_245_base_color;
+vec4 _sn_245_get_vec4 () {
+    return _sn_245_base_color * SCALE;
+}
+
+uniform float _sn_246_intensity;
+vec4 _sn_246_apply_filter (vec4 _sn_245_get_vec4) {
+    return mix(_sn_245_get_vec4, _sn_245_get_vec4 * (1.0 - _sn_245_get_vec4) * 2.0, _sn_246_intensity);
+}
+
+#define _sn_247_SCALE 0.5
+uniform vec4 _sn_247_base_color;
+vec4 _sn_247_get_vec4 () {
+    return _sn_247_base_color * SCALE;
+}
+
+uniform float _sn_248_intensity;
+vec4 _sn_248_apply_filter (vec4 _sn_247_get_vec4) {
+    return mix(_sn_247_get_vec4, _sn_247_get_vec4 * (1.0 - _sn_247_get_vec4) * 2.0, _sn_248_intensity);
+}
+
+#define _sn_249_SCALE 0.5
+uniform vec4 _sn_249_base_color;
+vec4 _sn_249_get_vec4 () {
+    return _sn_249_base_color * SCALE;
+}
+
+uniform float _sn_250_intensity;
+vec4 _sn_250_apply_filter (vec4 _sn_249_get_vec4) {
+    return mix(_sn_249_get_vec4, _sn_249_get_vec4 * (1.0 - _sn_249_get_vec4) * 2.0, _sn_250_intensity);
+}
+
+#define _sn_251_SCALE 0.5
+uniform vec4 _sn_251_base_color;
+vec4 _sn_251_get_vec4 () {
+    return _sn_251_base_color * SCALE;
+}
+
+uniform float _sn_252_intensity;
+vec4 _sn_252_apply_filter (vec4 _sn_251_get_vec4) {
+    return mix(_sn_251_get_vec4, _sn_251_get_vec4 * (1.0 - _sn_251_get_vec4) * 2.0, _sn_252_intensity);
+}
+
+#define _sn_253_SCALE 0.5
+uniform vec4 _sn_253_base_color;
+vec4 _sn_253_get_vec4 () {
+    return _sn_253_base_color * SCALE;
+}
+
+uniform float _sn_254_intensity;
+vec4 _sn_254_apply_filter (vec4 _sn_253_get_vec4) {
+    return mix(_sn_253_get_vec4, _sn_253_get_vec4 * (1.0 - _sn_253_get_vec4) * 2.0, _sn_254_intensity);
+}
+
+#define _sn_255_SCALE 0.5
+uniform vec4 _sn_255_base_color;
+vec4 _sn_255_get_vec4 () {
+    return _sn_255_base_color * SCALE;
+}
+
+uniform float _sn_256_intensity;
+vec4 _sn_256_apply_filter (vec4 _sn_255_get_vec4) {
+    return mix(_sn_255_get_vec4, _sn_255_get_vec4 * (1.0 - _sn_255_get_vec4) * 2.0, _sn_256_intensity);
+}
+
+vec4 _sn_257_combine_colors (vec4 _sn_2_apply_filter, vec4 _sn_4_apply_filter) {
+    return _sn_2_apply_filter + _sn_4_apply_filter;
+}
+
+vec4 _sn_258_combine_colors (vec4 _sn_6_apply_filter, vec4 _sn_8_apply_filter) {
+    return _sn_6_apply_filter + _sn_8_apply_filter;
+}
+
+vec4 _sn_259_combine_colors (vec4 _sn_10_apply_filter, vec4 _sn_12_apply_filter) {
+    return _sn_10_apply_filter + _sn_12_apply_filter;
+}
+
+vec4 _sn_260_combine_colors (vec4 _sn_14_apply_filter, vec4 _sn_16_apply_filter) {
+    return _sn_14_apply_filter + _sn_16_apply_filter;
+}
+
+vec4 _sn_261_combine_colors (vec4 _sn_18_apply_filter, vec4 _sn_20_apply_filter) {
+    return _sn_18_apply_filter + _sn_20_apply_filter;
+}
+
+vec4 _sn_262_combine_colors (vec4 _sn_22_apply_filter, vec4 _sn_24_apply_filter) {
+    return _sn_22_apply_filter + _sn_24_apply_filter;
+}
+
+vec4 _sn_263_combine_colors (vec4 _sn_26_apply_filter, vec4 _sn_28_apply_filter) {
+    return _sn_26_apply_filter + _sn_28_apply_filter;
+}
+
+vec4 _sn_264_combine_colors (vec4 _sn_30_apply_filter, vec4 _sn_32_apply_filter) {
+    return _sn_30_apply_filter + _sn_32_apply_filter;
+}
+
+vec4 _sn_265_combine_colors (vec4 _sn_34_apply_filter, vec4 _sn_36_apply_filter) {
+    return _sn_34_apply_filter + _sn_36_apply_filter;
+}
+
+vec4 _sn_266_combine_colors (vec4 _sn_38_apply_filter, vec4 _sn_40_apply_filter) {
+    return _sn_38_apply_filter + _sn_40_apply_filter;
+}
+
+vec4 _sn_267_combine_colors (vec4 _sn_42_apply_filter, vec4 _sn_44_apply_filter) {
+    return _sn_42_apply_filter + _sn_44_apply_filter;
+}
+
+vec4 _sn_268_combine_colors (vec4 _sn_46_apply_filter, vec4 _sn_48_apply_filter) {
+    return _sn_46_apply_filter + _sn_48_apply_filter;
+}
+
+vec4 _sn_269_combine_colors (vec4 _sn_50_apply_filter, vec4 _sn_52_apply_filter) {
+    return _sn_50_apply_filter + _sn_52_apply_filter;
+}
+
+vec4 _sn_270_combine_colors (vec4 _sn_54_apply_filter, vec4 _sn_56_apply_filter) {
+    return _sn_54_apply_filter + _sn_56_apply_filter;
+}
+
+vec4 _sn_271_combine_colors (vec4 _sn_58_apply_filter, vec4 _sn_60_apply_filter) {
+    return _sn_58_apply_filter + _sn_60_apply_filter;
+}
+
+vec4 _sn_272_combine_colors (vec4 _sn_62_apply_filter, vec4 _sn_64_apply_filter) {
+    return _sn_62_apply_filter + _sn_64_apply_filter;
+}
+
+vec4 _sn_273_combine_colors (vec4 _sn_66_apply_filter, vec4 _sn_68_apply_filter) {
+    return _sn_66_apply_filter + _sn_68_apply_filter;
+}
+
+vec4 _sn_274_combine_colors (vec4 _sn_70_apply_filter, vec4 _sn_72_apply_filter) {
+    return _sn_70_apply_filter + _sn_72_apply_filter;
+}
+
+vec4 _sn_275_combine_colors (vec4 _sn_74_apply_filter, vec4 _sn_76_apply_filter) {
+    return _sn_74_apply_filter + _sn_76_apply_filter;
+}
+
+vec4 _sn_276_combine_colors (vec4 _sn_78_apply_filter, vec4 _sn_80_apply_filter) {
+    return _sn_78_apply_filter + _sn_80_apply_filter;
+}
+
+vec4 _sn_277_combine_colors (vec4 _sn_82_apply_filter, vec4 _sn_84_apply_filter) {
+    return _sn_82_apply_filter + _sn_84_apply_filter;
+}
+
+vec4 _sn_278_combine_colors (vec4 _sn_86_apply_filter, vec4 _sn_88_apply_filter) {
+    return _sn_86_apply_filter + _sn_88_apply_filter;
+}
+
+vec4 _sn_279_combine_colors (vec4 _sn_90_apply_filter, vec4 _sn_92_apply_filter) {
+    return _sn_90_apply_filter + _sn_92_apply_filter;
+}
+
+vec4 _sn_280_combine_colors (vec4 _sn_94_apply_filter, vec4 _sn_96_apply_filter) {
+    return _sn_94_apply_filter + _sn_96_apply_filter;
+}
+
+vec4 _sn_281_combine_colors (vec4 _sn_98_apply_filter, vec4 _sn_100_apply_filter) {
+    return _sn_98_apply_filter + _sn_100_apply_filter;
+}
+
+vec4 _sn_282_combine_colors (vec4 _sn_102_apply_filter, vec4 _sn_104_apply_filter) {
+    return _sn_102_apply_filter + _sn_104_apply_filter;
+}
+
+vec4 _sn_283_combine_colors (vec4 _sn_106_apply_filter, vec4 _sn_108_apply_filter) {
+    return _sn_106_apply_filter + _sn_108_apply_filter;
+}
+
+vec4 _sn_284_combine_colors (vec4 _sn_110_apply_filter, vec4 _sn_112_apply_filter) {
+    return _sn_110_apply_filter + _sn_112_apply_filter;
+}
+
+vec4 _sn_285_combine_colors (vec4 _sn_114_apply_filter, vec4 _sn_116_apply_filter) {
+    return _sn_114_apply_filter + _sn_116_apply_filter;
+}
+
+vec4 _sn_286_combine_colors (vec4 _sn_118_apply_filter, vec4 _sn_120_apply_filter) {
+    return _sn_118_apply_filter + _sn_120_apply_filter;
+}
+
+vec4 _sn_287_combine_colors (vec4 _sn_122_apply_filter, vec4 _sn_124_apply_filter) {
+    return _sn_122_apply_filter + _sn_124_apply_filter;
+}
+
+vec4 _sn_288_combine_colors (vec4 _sn_126_apply_filter, vec4 _sn_128_apply_filter) {
+    return _sn_126_apply_filter + _sn_128_apply_filter;
+}
+
+vec4 _sn_289_combine_colors (vec4 _sn_130_apply_filter, vec4 _sn_132_apply_filter) {
+    return _sn_130_apply_filter + _sn_132_apply_filter;
+}
+
+vec4 _sn_290_combine_colors (vec4 _sn_134_apply_filter, vec4 _sn_136_apply_filter) {
+    return _sn_134_apply_filter + _sn_136_apply_filter;
+}
+
+vec4 _sn_291_combine_colors (vec4 _sn_138_apply_filter, vec4 _sn_140_apply_filter) {
+    return _sn_138_apply_filter + _sn_140_apply_filter;
+}
+
+vec4 _sn_292_combine_colors (vec4 _sn_142_apply_filter, vec4 _sn_144_apply_filter) {
+    return _sn_142_apply_filter + _sn_144_apply_filter;
+}
+
+vec4 _sn_293_combine_colors (vec4 _sn_146_apply_filter, vec4 _sn_148_apply_filter) {
+    return _sn_146_apply_filter + _sn_148_apply_filter;
+}
+
+vec4 _sn_294_combine_colors (vec4 _sn_150_apply_filter, vec4 _sn_152_apply_filter) {
+    return _sn_150_apply_filter + _sn_152_apply_filter;
+}
+
+vec4 _sn_295_combine_colors (vec4 _sn_154_apply_filter, vec4 _sn_156_apply_filter) {
+    return _sn_154_apply_filter + _sn_156_apply_filter;
+}
+
+vec4 _sn_296_combine_colors (vec4 _sn_158_apply_filter, vec4 _sn_160_apply_filter) {
+    return _sn_158_apply_filter + _sn_160_apply_filter;
+}
+
+vec4 _sn_297_combine_colors (vec4 _sn_162_apply_filter, vec4 _sn_164_apply_filter) {
+    return _sn_162_apply_filter + _sn_164_apply_filter;
+}
+
+vec4 _sn_298_combine_colors (vec4 _sn_166_apply_filter, vec4 _sn_168_apply_filter) {
+    return _sn_166_apply_filter + _sn_168_apply_filter;
+}
+
+vec4 _sn_299_combine_colors (vec4 _sn_170_apply_filter, vec4 _sn_172_apply_filter) {
+    return _sn_170_apply_filter + _sn_172_apply_filter;
+}
+
+vec4 _sn_300_combine_colors (vec4 _sn_174_apply_filter, vec4 _sn_176_apply_filter) {
+    return _sn_174_apply_filter + _sn_176_apply_filter;
+}
+
+vec4 _sn_301_combine_colors (vec4 _sn_178_apply_filter, vec4 _sn_180_apply_filter) {
+    return _sn_178_apply_filter + _sn_180_apply_filter;
+}
+
+vec4 _sn_302_combine_colors (vec4 _sn_182_apply_filter, vec4 _sn_184_apply_filter) {
+    return _sn_182_apply_filter + _sn_184_apply_filter;
+}
+
+vec4 _sn_303_combine_colors (vec4 _sn_186_apply_filter, vec4 _sn_188_apply_filter) {
+    return _sn_186_apply_filter + _sn_188_apply_filter;
+}
+
+vec4 _sn_304_combine_colors (vec4 _sn_190_apply_filter, vec4 _sn_192_apply_filter) {
+    return _sn_190_apply_filter + _sn_192_apply_filter;
+}
+
+vec4 _sn_305_combine_colors (vec4 _sn_194_apply_filter, vec4 _sn_196_apply_filter) {
+    return _sn_194_apply_filter + _sn_196_apply_filter;
+}
+
+vec4 _sn_306_combine_colors (vec4 _sn_198_apply_filter, vec4 _sn_200_apply_filter) {
+    return _sn_198_apply_filter + _sn_200_apply_filter;
+}
+
+vec4 _sn_307_combine_colors (vec4 _sn_202_apply_filter, vec4 _sn_204_apply_filter) {
+    return _sn_202_apply_filter + _sn_204_apply_filter;
+}
+
+vec4 _sn_308_combine_colors (vec4 _sn_206_apply_filter, vec4 _sn_208_apply_filter) {
+    return _sn_206_apply_filter + _sn_208_apply_filter;
+}
+
+vec4 _sn_309_combine_colors (vec4 _sn_210_apply_filter, vec4 _sn_212_apply_filter) {
+    return _sn_210_apply_filter + _sn_212_apply_filter;
+}
+
+vec4 _sn_310_combine_colors (vec4 _sn_214_apply_filter, vec4 _sn_216_apply_filter) {
+    return _sn_214_apply_filter + _sn_216_apply_filter;
+}
+
+vec4 _sn_311_combine_colors (vec4 _sn_218_apply_filter, vec4 _sn_220_apply_filter) {
+    return _sn_218_apply_filter + _sn_220_apply_filter;
+}
+
+vec4 _sn_312_combine_colors (vec4 _sn_222_apply_filter, vec4 _sn_224_apply_filter) {
+    return _sn_222_apply_filter + _sn_224_apply_filter;
+}
+
+vec4 _sn_313_combine_colors (vec4 _sn_226_apply_filter, vec4 _sn_228_apply_filter) {
+    return _sn_226_apply_filter + _sn_228_apply_filter;
+}
+
+vec4 _sn_314_combine_colors (vec4 _sn_230_apply_filter, vec4 _sn_232_apply_filter) {
+    return _sn_230_apply_filter + _sn_232_apply_filter;
+}
+
+vec4 _sn_315_combine_colors (vec4 _sn_234_apply_filter, vec4 _sn_236_apply_filter) {
+    return _sn_234_apply_filter + _sn_236_apply_filter;
+}
+
+vec4 _sn_316_combine_colors (vec4 _sn_238_apply_filter, vec4 _sn_240_apply_filter) {
+    return _sn_238_apply_filter + _sn_240_apply_filter;
+}
+
+vec4 _sn_317_combine_colors (vec4 _sn_242_apply_filter, vec4 _sn_244_apply_filter) {
+    return _sn_242_apply_filter + _sn_244_apply_filter;
+}
+
+vec4 _sn_318_combine_colors (vec4 _sn_246_apply_filter, vec4 _sn_248_apply_filter) {
+    return _sn_246_apply_filter + _sn_248_apply_filter;
+}
+
+vec4 _sn_319_combine_colors (vec4 _sn_250_apply_filter, vec4 _sn_252_apply_filter) {
+    return _sn_250_apply_filter + _sn_252_apply_filter;
+}
+
+vec4 _sn_320_combine_colors (vec4 _sn_254_apply_filter, vec4 _sn_256_apply_filter) {
+    return _sn_254_apply_filter + _sn_256_apply_filter;
+}
+
+vec4 _sn_321_combine_colors (vec4 _sn_257_combine_colors, vec4 _sn_258_combine_colors) {
+    return _sn_257_combine_colors + _sn_258_combine_colors;
+}
+
+vec4 _sn_322_combine_colors (vec4 _sn_259_combine_colors, vec4 _sn_260_combine_colors) {
+    return _sn_259_combine_colors + _sn_260_combine_colors;
+}
+
+vec4 _sn_323_combine_colors (vec4 _sn_261_combine_colors, vec4 _sn_262_combine_colors) {
+    return _sn_261_combine_colors + _sn_262_combine_colors;
+}
+
+vec4 _sn_324_combine_colors (vec4 _sn_263_combine_colors, vec4 _sn_264_combine_colors) {
+    return _sn_263_combine_colors + _sn_264_combine_colors;
+}
+
+vec4 _sn_325_combine_colors (vec4 _sn_265_combine_colors, vec4 _sn_266_combine_colors) {
+    return _sn_265_combine_colors + _sn_266_combine_colors;
+}
+
+vec4 _sn_326_combine_colors (vec4 _sn_267_combine_colors, vec4 _sn_268_combine_colors) {
+    return _sn_267_combine_colors + _sn_268_combine_colors;
+}
+
+vec4 _sn_327_combine_colors (vec4 _sn_269_combine_colors, vec4 _sn_270_combine_colors) {
+    return _sn_269_combine_colors + _sn_270_combine_colors;
+}
+
+vec4 _sn_328_combine_colors (vec4 _sn_271_combine_colors, vec4 _sn_272_combine_colors) {
+    return _sn_271_combine_colors + _sn_272_combine_colors;
+}
+
+vec4 _sn_329_combine_colors (vec4 _sn_273_combine_colors, vec4 _sn_274_combine_colors) {
+    return _sn_273_combine_colors + _sn_274_combine_colors;
+}
+
+vec4 _sn_330_combine_colors (vec4 _sn_275_combine_colors, vec4 _sn_276_combine_colors) {
+    return _sn_275_combine_colors + _sn_276_combine_colors;
+}
+
+vec4 _sn_331_combine_colors (vec4 _sn_277_combine_colors, vec4 _sn_278_combine_colors) {
+    return _sn_277_combine_colors + _sn_278_combine_colors;
+}
+
+vec4 _sn_332_combine_colors (vec4 _sn_279_combine_colors, vec4 _sn_280_combine_colors) {
+    return _sn_279_combine_colors + _sn_280_combine_colors;
+}
+
+vec4 _sn_333_combine_colors (vec4 _sn_281_combine_colors, vec4 _sn_282_combine_colors) {
+    return _sn_281_combine_colors + _sn_282_combine_colors;
+}
+
+vec4 _sn_334_combine_colors (vec4 _sn_283_combine_colors, vec4 _sn_284_combine_colors) {
+    return _sn_283_combine_colors + _sn_284_combine_colors;
+}
+
+vec4 _sn_335_combine_colors (vec4 _sn_285_combine_colors, vec4 _sn_286_combine_colors) {
+    return _sn_285_combine_colors + _sn_286_combine_colors;
+}
+
+vec4 _sn_336_combine_colors (vec4 _sn_287_combine_colors, vec4 _sn_288_combine_colors) {
+    return _sn_287_combine_colors + _sn_288_combine_colors;
+}
+
+vec4 _sn_337_combine_colors (vec4 _sn_289_combine_colors, vec4 _sn_290_combine_colors) {
+    return _sn_289_combine_colors + _sn_290_combine_colors;
+}
+
+vec4 _sn_338_combine_colors (vec4 _sn_291_combine_colors, vec4 _sn_292_combine_colors) {
+    return _sn_291_combine_colors + _sn_292_combine_colors;
+}
+
+vec4 _sn_339_combine_colors (vec4 _sn_293_combine_colors, vec4 _sn_294_combine_colors) {
+    return _sn_293_combine_colors + _sn_294_combine_colors;
+}
+
+vec4 _sn_340_combine_colors (vec4 _sn_295_combine_colors, vec4 _sn_296_combine_colors) {
+    return _sn_295_combine_colors + _sn_296_combine_colors;
+}
+
+vec4 _sn_341_combine_colors (vec4 _sn_297_combine_colors, vec4 _sn_298_combine_colors) {
+    return _sn_297_combine_colors + _sn_298_combine_colors;
+}
+
+vec4 _sn_342_combine_colors (vec4 _sn_299_combine_colors, vec4 _sn_300_combine_colors) {
+    return _sn_299_combine_colors + _sn_300_combine_colors;
+}
+
+vec4 _sn_343_combine_colors (vec4 _sn_301_combine_colors, vec4 _sn_302_combine_colors) {
+    return _sn_301_combine_colors + _sn_302_combine_colors;
+}
+
+vec4 _sn_344_combine_colors (vec4 _sn_303_combine_colors, vec4 _sn_304_combine_colors) {
+    return _sn_303_combine_colors + _sn_304_combine_colors;
+}
+
+vec4 _sn_345_combine_colors (vec4 _sn_305_combine_colors, vec4 _sn_306_combine_colors) {
+    return _sn_305_combine_colors + _sn_306_combine_colors;
+}
+
+vec4 _sn_346_combine_colors (vec4 _sn_307_combine_colors, vec4 _sn_308_combine_colors) {
+    return _sn_307_combine_colors + _sn_308_combine_colors;
+}
+
+vec4 _sn_347_combine_colors (vec4 _sn_309_combine_colors, vec4 _sn_310_combine_colors) {
+    return _sn_309_combine_colors + _sn_310_combine_colors;
+}
+
+vec4 _sn_348_combine_colors (vec4 _sn_311_combine_colors, vec4 _sn_312_combine_colors) {
+    return _sn_311_combine_colors + _sn_312_combine_colors;
+}
+
+vec4 _sn_349_combine_colors (vec4 _sn_313_combine_colors, vec4 _sn_314_combine_colors) {
+    return _sn_313_combine_colors + _sn_314_combine_colors;
+}
+
+vec4 _sn_350_combine_colors (vec4 _sn_315_combine_colors, vec4 _sn_316_combine_colors) {
+    return _sn_315_combine_colors + _sn_316_combine_colors;
+}
+
+vec4 _sn_351_combine_colors (vec4 _sn_317_combine_colors, vec4 _sn_318_combine_colors) {
+    return _sn_317_combine_colors + _sn_318_combine_colors;
+}
+
+vec4 _sn_352_combine_colors (vec4 _sn_319_combine_colors, vec4 _sn_320_combine_colors) {
+    return _sn_319_combine_colors + _sn_320_combine_colors;
+}
+
+vec4 _sn_353_combine_colors (vec4 _sn_321_combine_colors, vec4 _sn_322_combine_colors) {
+    return _sn_321_combine_colors + _sn_322_combine_colors;
+}
+
+vec4 _sn_354_combine_colors (vec4 _sn_323_combine_colors, vec4 _sn_324_combine_colors) {
+    return _sn_323_combine_colors + _sn_324_combine_colors;
+}
+
+vec4 _sn_355_combine_colors (vec4 _sn_325_combine_colors, vec4 _sn_326_combine_colors) {
+    return _sn_325_combine_colors + _sn_326_combine_colors;
+}
+
+vec4 _sn_356_combine_colors (vec4 _sn_327_combine_colors, vec4 _sn_328_combine_colors) {
+    return _sn_327_combine_colors + _sn_328_combine_colors;
+}
+
+vec4 _sn_357_combine_colors (vec4 _sn_329_combine_colors, vec4 _sn_330_combine_colors) {
+    return _sn_329_combine_colors + _sn_330_combine_colors;
+}
+
+vec4 _sn_358_combine_colors (vec4 _sn_331_combine_colors, vec4 _sn_332_combine_colors) {
+    return _sn_331_combine_colors + _sn_332_combine_colors;
+}
+
+vec4 _sn_359_combine_colors (vec4 _sn_333_combine_colors, vec4 _sn_334_combine_colors) {
+    return _sn_333_combine_colors + _sn_334_combine_colors;
+}
+
+vec4 _sn_360_combine_colors (vec4 _sn_335_combine_colors, vec4 _sn_336_combine_colors) {
+    return _sn_335_combine_colors + _sn_336_combine_colors;
+}
+
+vec4 _sn_361_combine_colors (vec4 _sn_337_combine_colors, vec4 _sn_338_combine_colors) {
+    return _sn_337_combine_colors + _sn_338_combine_colors;
+}
+
+vec4 _sn_362_combine_colors (vec4 _sn_339_combine_colors, vec4 _sn_340_combine_colors) {
+    return _sn_339_combine_colors + _sn_340_combine_colors;
+}
+
+vec4 _sn_363_combine_colors (vec4 _sn_341_combine_colors, vec4 _sn_342_combine_colors) {
+    return _sn_341_combine_colors + _sn_342_combine_colors;
+}
+
+vec4 _sn_364_combine_colors (vec4 _sn_343_combine_colors, vec4 _sn_344_combine_colors) {
+    return _sn_343_combine_colors + _sn_344_combine_colors;
+}
+
+vec4 _sn_365_combine_colors (vec4 _sn_345_combine_colors, vec4 _sn_346_combine_colors) {
+    return _sn_345_combine_colors + _sn_346_combine_colors;
+}
+
+vec4 _sn_366_combine_colors (vec4 _sn_347_combine_colors, vec4 _sn_348_combine_colors) {
+    return _sn_347_combine_colors + _sn_348_combine_colors;
+}
+
+vec4 _sn_367_combine_colors (vec4 _sn_349_combine_colors, vec4 _sn_350_combine_colors) {
+    return _sn_349_combine_colors + _sn_350_combine_colors;
+}
+
+vec4 _sn_368_combine_colors (vec4 _sn_351_combine_colors, vec4 _sn_352_combine_colors) {
+    return _sn_351_combine_colors + _sn_352_combine_colors;
+}
+
+vec4 _sn_369_combine_colors (vec4 _sn_353_combine_colors, vec4 _sn_354_combine_colors) {
+    return _sn_353_combine_colors + _sn_354_combine_colors;
+}
+
+vec4 _sn_370_combine_colors (vec4 _sn_355_combine_colors, vec4 _sn_356_combine_colors) {
+    return _sn_355_combine_colors + _sn_356_combine_colors;
+}
+
+vec4 _sn_371_combine_colors (vec4 _sn_357_combine_colors, vec4 _sn_358_combine_colors) {
+    return _sn_357_combine_colors + _sn_358_combine_colors;
+}
+
+vec4 _sn_372_combine_colors (vec4 _sn_359_combine_colors, vec4 _sn_360_combine_colors) {
+    return _sn_359_combine_colors + _sn_360_combine_colors;
+}
+
+vec4 _sn_373_combine_colors (vec4 _sn_361_combine_colors, vec4 _sn_362_combine_colors) {
+    return _sn_361_combine_colors + _sn_362_combine_colors;
+}
+
+vec4 _sn_374_combine_colors (vec4 _sn_363_combine_colors, vec4 _sn_364_combine_colors) {
+    return _sn_363_combine_colors + _sn_364_combine_colors;
+}
+
+vec4 _sn_375_combine_colors (vec4 _sn_365_combine_colors, vec4 _sn_366_combine_colors) {
+    return _sn_365_combine_colors + _sn_366_combine_colors;
+}
+
+vec4 _sn_376_combine_colors (vec4 _sn_367_combine_colors, vec4 _sn_368_combine_colors) {
+    return _sn_367_combine_colors + _sn_368_combine_colors;
+}
+
+vec4 _sn_377_combine_colors (vec4 _sn_369_combine_colors, vec4 _sn_370_combine_colors) {
+    return _sn_369_combine_colors + _sn_370_combine_colors;
+}
+
+vec4 _sn_378_combine_colors (vec4 _sn_371_combine_colors, vec4 _sn_372_combine_colors) {
+    return _sn_371_combine_colors + _sn_372_combine_colors;
+}
+
+vec4 _sn_379_combine_colors (vec4 _sn_373_combine_colors, vec4 _sn_374_combine_colors) {
+    return _sn_373_combine_colors + _sn_374_combine_colors;
+}
+
+vec4 _sn_380_combine_colors (vec4 _sn_375_combine_colors, vec4 _sn_376_combine_colors) {
+    return _sn_375_combine_colors + _sn_376_combine_colors;
+}
+
+vec4 _sn_381_combine_colors (vec4 _sn_377_combine_colors, vec4 _sn_378_combine_colors) {
+    return _sn_377_combine_colors + _sn_378_combine_colors;
+}
+
+vec4 _sn_382_combine_colors (vec4 _sn_379_combine_colors, vec4 _sn_380_combine_colors) {
+    return _sn_379_combine_colors + _sn_380_combine_colors;
+}
+
+vec4 _sn_383_combine_colors (vec4 _sn_381_combine_colors, vec4 _sn_382_combine_colors) {
+    return _sn_381_combine_colors + _sn_382_combine_colors;
+}
+
+void _sn_384_set_color (vec4 _sn_383_combine_colors) {
+    gl_FragColor = _sn_383_combine_colors;
+}
+
+
+void main() {
+
+  vec4 _io_1_return = _sn_1_get_vec4();
+  vec4 _io_2_return = _sn_2_apply_filter(_io_1_return);
+  vec4 _io_3_return = _sn_3_get_vec4();
+  vec4 _io_4_return = _sn_4_apply_filter(_io_3_return);
+  vec4 _io_5_return = _sn_5_get_vec4();
+  vec4 _io_6_return = _sn_6_apply_filter(_io_5_return);
+  vec4 _io_7_return = _sn_7_get_vec4();
+  vec4 _io_8_return = _sn_8_apply_filter(_io_7_return);
+  vec4 _io_9_return = _sn_9_get_vec4();
+  vec4 _io_10_return = _sn_10_apply_filter(_io_9_return);
+  vec4 _io_11_return = _sn_11_get_vec4();
+  vec4 _io_12_return = _sn_12_apply_filter(_io_11_return);
+  vec4 _io_13_return = _sn_13_get_vec4();
+  vec4 _io_14_return = _sn_14_apply_filter(_io_13_return);
+  vec4 _io_15_return = _sn_15_get_vec4();
+  vec4 _io_16_return = _sn_16_apply_filter(_io_15_return);
+  vec4 _io_17_return = _sn_17_get_vec4();
+  vec4 _io_18_return = _sn_18_apply_filter(_io_17_return);
+  vec4 _io_19_return = _sn_19_get_vec4();
+  vec4 _io_20_return = _sn_20_apply_filter(_io_19_return);
+  vec4 _io_21_return = _sn_21_get_vec4();
+  vec4 _io_22_return = _sn_22_apply_filter(_io_21_return);
+  vec4 _io_23_return = _sn_23_get_vec4();
+  vec4 _io_24_return = _sn_24_apply_filter(_io_23_return);
+  vec4 _io_25_return = _sn_25_get_vec4();
+  vec4 _io_26_return = _sn_26_apply_filter(_io_25_return);
+  vec4 _io_27_return = _sn_27_get_vec4();
+  vec4 _io_28_return = _sn_28_apply_filter(_io_27_return);
+  vec4 _io_29_return = _sn_29_get_vec4();
+  vec4 _io_30_return = _sn_30_apply_filter(_io_29_return);
+  vec4 _io_31_return = _sn_31_get_vec4();
+  vec4 _io_32_return = _sn_32_apply_filter(_io_31_return);
+  vec4 _io_33_return = _sn_33_get_vec4();
+  vec4 _io_34_return = _sn_34_apply_filter(_io_33_return);
+  vec4 _io_35_return = _sn_35_get_vec4();
+  vec4 _io_36_return = _sn_36_apply_filter(_io_35_return);
+  vec4 _io_37_return = _sn_37_get_vec4();
+  vec4 _io_38_return = _sn_38_apply_filter(_io_37_return);
+  vec4 _io_39_return = _sn_39_get_vec4();
+  vec4 _io_40_return = _sn_40_apply_filter(_io_39_return);
+  vec4 _io_41_return = _sn_41_get_vec4();
+  vec4 _io_42_return = _sn_42_apply_filter(_io_41_return);
+  vec4 _io_43_return = _sn_43_get_vec4();
+  vec4 _io_44_return = _sn_44_apply_filter(_io_43_return);
+  vec4 _io_45_return = _sn_45_get_vec4();
+  vec4 _io_46_return = _sn_46_apply_filter(_io_45_return);
+  vec4 _io_47_return = _sn_47_get_vec4();
+  vec4 _io_48_return = _sn_48_apply_filter(_io_47_return);
+  vec4 _io_49_return = _sn_49_get_vec4();
+  vec4 _io_50_return = _sn_50_apply_filter(_io_49_return);
+  vec4 _io_51_return = _sn_51_get_vec4();
+  vec4 _io_52_return = _sn_52_apply_filter(_io_51_return);
+  vec4 _io_53_return = _sn_53_get_vec4();
+  vec4 _io_54_return = _sn_54_apply_filter(_io_53_return);
+  vec4 _io_55_return = _sn_55_get_vec4();
+  vec4 _io_56_return = _sn_56_apply_filter(_io_55_return);
+  vec4 _io_57_return = _sn_57_get_vec4();
+  vec4 _io_58_return = _sn_58_apply_filter(_io_57_return);
+  vec4 _io_59_return = _sn_59_get_vec4();
+  vec4 _io_60_return = _sn_60_apply_filter(_io_59_return);
+  vec4 _io_61_return = _sn_61_get_vec4();
+  vec4 _io_62_return = _sn_62_apply_filter(_io_61_return);
+  vec4 _io_63_return = _sn_63_get_vec4();
+  vec4 _io_64_return = _sn_64_apply_filter(_io_63_return);
+  vec4 _io_65_return = _sn_65_get_vec4();
+  vec4 _io_66_return = _sn_66_apply_filter(_io_65_return);
+  vec4 _io_67_return = _sn_67_get_vec4();
+  vec4 _io_68_return = _sn_68_apply_filter(_io_67_return);
+  vec4 _io_69_return = _sn_69_get_vec4();
+  vec4 _io_70_return = _sn_70_apply_filter(_io_69_return);
+  vec4 _io_71_return = _sn_71_get_vec4();
+  vec4 _io_72_return = _sn_72_apply_filter(_io_71_return);
+  vec4 _io_73_return = _sn_73_get_vec4();
+  vec4 _io_74_return = _sn_74_apply_filter(_io_73_return);
+  vec4 _io_75_return = _sn_75_get_vec4();
+  vec4 _io_76_return = _sn_76_apply_filter(_io_75_return);
+  vec4 _io_77_return = _sn_77_get_vec4();
+  vec4 _io_78_return = _sn_78_apply_filter(_io_77_return);
+  vec4 _io_79_return = _sn_79_get_vec4();
+  vec4 _io_80_return = _sn_80_apply_filter(_io_79_return);
+  vec4 _io_81_return = _sn_81_get_vec4();
+  vec4 _io_82_return = _sn_82_apply_filter(_io_81_return);
+  vec4 _io_83_return = _sn_83_get_vec4();
+  vec4 _io_84_return = _sn_84_apply_filter(_io_83_return);
+  vec4 _io_85_return = _sn_85_get_vec4();
+  vec4 _io_86_return = _sn_86_apply_filter(_io_85_return);
+  vec4 _io_87_return = _sn_87_get_vec4();
+  vec4 _io_88_return = _sn_88_apply_filter(_io_87_return);
+  vec4 _io_89_return = _sn_89_get_vec4();
+  vec4 _io_90_return = _sn_90_apply_filter(_io_89_return);
+  vec4 _io_91_return = _sn_91_get_vec4();
+  vec4 _io_92_return = _sn_92_apply_filter(_io_91_return);
+  vec4 _io_93_return = _sn_93_get_vec4();
+  vec4 _io_94_return = _sn_94_apply_filter(_io_93_return);
+  vec4 _io_95_return = _sn_95_get_vec4();
+  vec4 _io_96_return = _sn_96_apply_filter(_io_95_return);
+  vec4 _io_97_return = _sn_97_get_vec4();
+  vec4 _io_98_return = _sn_98_apply_filter(_io_97_return);
+  vec4 _io_99_return = _sn_99_get_vec4();
+  vec4 _io_100_return = _sn_100_apply_filter(_io_99_return);
+  vec4 _io_101_return = _sn_101_get_vec4();
+  vec4 _io_102_return = _sn_102_apply_filter(_io_101_return);
+  vec4 _io_103_return = _sn_103_get_vec4();
+  vec4 _io_104_return = _sn_104_apply_filter(_io_103_return);
+  vec4 _io_105_return = _sn_105_get_vec4();
+  vec4 _io_106_return = _sn_106_apply_filter(_io_105_return);
+  vec4 _io_107_return = _sn_107_get_vec4();
+  vec4 _io_108_return = _sn_108_apply_filter(_io_107_return);
+  vec4 _io_109_return = _sn_109_get_vec4();
+  vec4 _io_110_return = _sn_110_apply_filter(_io_109_return);
+  vec4 _io_111_return = _sn_111_get_vec4();
+  vec4 _io_112_return = _sn_112_apply_filter(_io_111_return);
+  vec4 _io_113_return = _sn_113_get_vec4();
+  vec4 _io_114_return = _sn_114_apply_filter(_io_113_return);
+  vec4 _io_115_return = _sn_115_get_vec4();
+  vec4 _io_116_return = _sn_116_apply_filter(_io_115_return);
+  vec4 _io_117_return = _sn_117_get_vec4();
+  vec4 _io_118_return = _sn_118_apply_filter(_io_117_return);
+  vec4 _io_119_return = _sn_119_get_vec4();
+  vec4 _io_120_return = _sn_120_apply_filter(_io_119_return);
+  vec4 _io_121_return = _sn_121_get_vec4();
+  vec4 _io_122_return = _sn_122_apply_filter(_io_121_return);
+  vec4 _io_123_return = _sn_123_get_vec4();
+  vec4 _io_124_return = _sn_124_apply_filter(_io_123_return);
+  vec4 _io_125_return = _sn_125_get_vec4();
+  vec4 _io_126_return = _sn_126_apply_filter(_io_125_return);
+  vec4 _io_127_return = _sn_127_get_vec4();
+  vec4 _io_128_return = _sn_128_apply_filter(_io_127_return);
+  vec4 _io_129_return = _sn_129_get_vec4();
+  vec4 _io_130_return = _sn_130_apply_filter(_io_129_return);
+  vec4 _io_131_return = _sn_131_get_vec4();
+  vec4 _io_132_return = _sn_132_apply_filter(_io_131_return);
+  vec4 _io_133_return = _sn_133_get_vec4();
+  vec4 _io_134_return = _sn_134_apply_filter(_io_133_return);
+  vec4 _io_135_return = _sn_135_get_vec4();
+  vec4 _io_136_return = _sn_136_apply_filter(_io_135_return);
+  vec4 _io_137_return = _sn_137_get_vec4();
+  vec4 _io_138_return = _sn_138_apply_filter(_io_137_return);
+  vec4 _io_139_return = _sn_139_get_vec4();
+  vec4 _io_140_return = _sn_140_apply_filter(_io_139_return);
+  vec4 _io_141_return = _sn_141_get_vec4();
+  vec4 _io_142_return = _sn_142_apply_filter(_io_141_return);
+  vec4 _io_143_return = _sn_143_get_vec4();
+  vec4 _io_144_return = _sn_144_apply_filter(_io_143_return);
+  vec4 _io_145_return = _sn_145_get_vec4();
+  vec4 _io_146_return = _sn_146_apply_filter(_io_145_return);
+  vec4 _io_147_return = _sn_147_get_vec4();
+  vec4 _io_148_return = _sn_148_apply_filter(_io_147_return);
+  vec4 _io_149_return = _sn_149_get_vec4();
+  vec4 _io_150_return = _sn_150_apply_filter(_io_149_return);
+  vec4 _io_151_return = _sn_151_get_vec4();
+  vec4 _io_152_return = _sn_152_apply_filter(_io_151_return);
+  vec4 _io_153_return = _sn_153_get_vec4();
+  vec4 _io_154_return = _sn_154_apply_filter(_io_153_return);
+  vec4 _io_155_return = _sn_155_get_vec4();
+  vec4 _io_156_return = _sn_156_apply_filter(_io_155_return);
+  vec4 _io_157_return = _sn_157_get_vec4();
+  vec4 _io_158_return = _sn_158_apply_filter(_io_157_return);
+  vec4 _io_159_return = _sn_159_get_vec4();
+  vec4 _io_160_return = _sn_160_apply_filter(_io_159_return);
+  vec4 _io_161_return = _sn_161_get_vec4();
+  vec4 _io_162_return = _sn_162_apply_filter(_io_161_return);
+  vec4 _io_163_return = _sn_163_get_vec4();
+  vec4 _io_164_return = _sn_164_apply_filter(_io_163_return);
+  vec4 _io_165_return = _sn_165_get_vec4();
+  vec4 _io_166_return = _sn_166_apply_filter(_io_165_return);
+  vec4 _io_167_return = _sn_167_get_vec4();
+  vec4 _io_168_return = _sn_168_apply_filter(_io_167_return);
+  vec4 _io_169_return = _sn_169_get_vec4();
+  vec4 _io_170_return = _sn_170_apply_filter(_io_169_return);
+  vec4 _io_171_return = _sn_171_get_vec4();
+  vec4 _io_172_return = _sn_172_apply_filter(_io_171_return);
+  vec4 _io_173_return = _sn_173_get_vec4();
+  vec4 _io_174_return = _sn_174_apply_filter(_io_173_return);
+  vec4 _io_175_return = _sn_175_get_vec4();
+  vec4 _io_176_return = _sn_176_apply_filter(_io_175_return);
+  vec4 _io_177_return = _sn_177_get_vec4();
+  vec4 _io_178_return = _sn_178_apply_filter(_io_177_return);
+  vec4 _io_179_return = _sn_179_get_vec4();
+  vec4 _io_180_return = _sn_180_apply_filter(_io_179_return);
+  vec4 _io_181_return = _sn_181_get_vec4();
+  vec4 _io_182_return = _sn_182_apply_filter(_io_181_return);
+  vec4 _io_183_return = _sn_183_get_vec4();
+  vec4 _io_184_return = _sn_184_apply_filter(_io_183_return);
+  vec4 _io_185_return = _sn_185_get_vec4();
+  vec4 _io_186_return = _sn_186_apply_filter(_io_185_return);
+  vec4 _io_187_return = _sn_187_get_vec4();
+  vec4 _io_188_return = _sn_188_apply_filter(_io_187_return);
+  vec4 _io_189_return = _sn_189_get_vec4();
+  vec4 _io_190_return = _sn_190_apply_filter(_io_189_return);
+  vec4 _io_191_return = _sn_191_get_vec4();
+  vec4 _io_192_return = _sn_192_apply_filter(_io_191_return);
+  vec4 _io_193_return = _sn_193_get_vec4();
+  vec4 _io_194_return = _sn_194_apply_filter(_io_193_return);
+  vec4 _io_195_return = _sn_195_get_vec4();
+  vec4 _io_196_return = _sn_196_apply_filter(_io_195_return);
+  vec4 _io_197_return = _sn_197_get_vec4();
+  vec4 _io_198_return = _sn_198_apply_filter(_io_197_return);
+  vec4 _io_199_return = _sn_199_get_vec4();
+  vec4 _io_200_return = _sn_200_apply_filter(_io_199_return);
+  vec4 _io_201_return = _sn_201_get_vec4();
+  vec4 _io_202_return = _sn_202_apply_filter(_io_201_return);
+  vec4 _io_203_return = _sn_203_get_vec4();
+  vec4 _io_204_return = _sn_204_apply_filter(_io_203_return);
+  vec4 _io_205_return = _sn_205_get_vec4();
+  vec4 _io_206_return = _sn_206_apply_filter(_io_205_return);
+  vec4 _io_207_return = _sn_207_get_vec4();
+  vec4 _io_208_return = _sn_208_apply_filter(_io_207_return);
+  vec4 _io_209_return = _sn_209_get_vec4();
+  vec4 _io_210_return = _sn_210_apply_filter(_io_209_return);
+  vec4 _io_211_return = _sn_211_get_vec4();
+  vec4 _io_212_return = _sn_212_apply_filter(_io_211_return);
+  vec4 _io_213_return = _sn_213_get_vec4();
+  vec4 _io_214_return = _sn_214_apply_filter(_io_213_return);
+  vec4 _io_215_return = _sn_215_get_vec4();
+  vec4 _io_216_return = _sn_216_apply_filter(_io_215_return);
+  vec4 _io_217_return = _sn_217_get_vec4();
+  vec4 _io_218_return = _sn_218_apply_filter(_io_217_return);
+  vec4 _io_219_return = _sn_219_get_vec4();
+  vec4 _io_220_return = _sn_220_apply_filter(_io_219_return);
+  vec4 _io_221_return = _sn_221_get_vec4();
+  vec4 _io_222_return = _sn_222_apply_filter(_io_221_return);
+  vec4 _io_223_return = _sn_223_get_vec4();
+  vec4 _io_224_return = _sn_224_apply_filter(_io_223_return);
+  vec4 _io_225_return = _sn_225_get_vec4();
+  vec4 _io_226_return = _sn_226_apply_filter(_io_225_return);
+  vec4 _io_227_return = _sn_227_get_vec4();
+  vec4 _io_228_return = _sn_228_apply_filter(_io_227_return);
+  vec4 _io_229_return = _sn_229_get_vec4();
+  vec4 _io_230_return = _sn_230_apply_filter(_io_229_return);
+  vec4 _io_231_return = _sn_231_get_vec4();
+  vec4 _io_232_return = _sn_232_apply_filter(_io_231_return);
+  vec4 _io_233_return = _sn_233_get_vec4();
+  vec4 _io_234_return = _sn_234_apply_filter(_io_233_return);
+  vec4 _io_235_return = _sn_235_get_vec4();
+  vec4 _io_236_return = _sn_236_apply_filter(_io_235_return);
+  vec4 _io_237_return = _sn_237_get_vec4();
+  vec4 _io_238_return = _sn_238_apply_filter(_io_237_return);
+  vec4 _io_239_return = _sn_239_get_vec4();
+  vec4 _io_240_return = _sn_240_apply_filter(_io_239_return);
+  vec4 _io_241_return = _sn_241_get_vec4();
+  vec4 _io_242_return = _sn_242_apply_filter(_io_241_return);
+  vec4 _io_243_return = _sn_243_get_vec4();
+  vec4 _io_244_return = _sn_244_apply_filter(_io_243_return);
+  vec4 _io_245_return = _sn_245_get_vec4();
+  vec4 _io_246_return = _sn_246_apply_filter(_io_245_return);
+  vec4 _io_247_return = _sn_247_get_vec4();
+  vec4 _io_248_return = _sn_248_apply_filter(_io_247_return);
+  vec4 _io_249_return = _sn_249_get_vec4();
+  vec4 _io_250_return = _sn_250_apply_filter(_io_249_return);
+  vec4 _io_251_return = _sn_251_get_vec4();
+  vec4 _io_252_return = _sn_252_apply_filter(_io_251_return);
+  vec4 _io_253_return = _sn_253_get_vec4();
+  vec4 _io_254_return = _sn_254_apply_filter(_io_253_return);
+  vec4 _io_255_return = _sn_255_get_vec4();
+  vec4 _io_256_return = _sn_256_apply_filter(_io_255_return);
+  vec4 _io_257_return = _sn_257_combine_colors(_io_2_return, _io_4_return);
+  vec4 _io_258_return = _sn_258_combine_colors(_io_6_return, _io_8_return);
+  vec4 _io_259_return = _sn_259_combine_colors(_io_10_return, _io_12_return);
+  vec4 _io_260_return = _sn_260_combine_colors(_io_14_return, _io_16_return);
+  vec4 _io_261_return = _sn_261_combine_colors(_io_18_return, _io_20_return);
+  vec4 _io_262_return = _sn_262_combine_colors(_io_22_return, _io_24_return);
+  vec4 _io_263_return = _sn_263_combine_colors(_io_26_return, _io_28_return);
+  vec4 _io_264_return = _sn_264_combine_colors(_io_30_return, _io_32_return);
+  vec4 _io_265_return = _sn_265_combine_colors(_io_34_return, _io_36_return);
+  vec4 _io_266_return = _sn_266_combine_colors(_io_38_return, _io_40_return);
+  vec4 _io_267_return = _sn_267_combine_colors(_io_42_return, _io_44_return);
+  vec4 _io_268_return = _sn_268_combine_colors(_io_46_return, _io_48_return);
+  vec4 _io_269_return = _sn_269_combine_colors(_io_50_return, _io_52_return);
+  vec4 _io_270_return = _sn_270_combine_colors(_io_54_return, _io_56_return);
+  vec4 _io_271_return = _sn_271_combine_colors(_io_58_return, _io_60_return);
+  vec4 _io_272_return = _sn_272_combine_colors(_io_62_return, _io_64_return);
+  vec4 _io_273_return = _sn_273_combine_colors(_io_66_return, _io_68_return);
+  vec4 _io_274_return = _sn_274_combine_colors(_io_70_return, _io_72_return);
+  vec4 _io_275_return = _sn_275_combine_colors(_io_74_return, _io_76_return);
+  vec4 _io_276_return = _sn_276_combine_colors(_io_78_return, _io_80_return);
+  vec4 _io_277_return = _sn_277_combine_colors(_io_82_return, _io_84_return);
+  vec4 _io_278_return = _sn_278_combine_colors(_io_86_return, _io_88_return);
+  vec4 _io_279_return = _sn_279_combine_colors(_io_90_return, _io_92_return);
+  vec4 _io_280_return = _sn_280_combine_colors(_io_94_return, _io_96_return);
+  vec4 _io_281_return = _sn_281_combine_colors(_io_98_return, _io_100_return);
+  vec4 _io_282_return = _sn_282_combine_colors(_io_102_return, _io_104_return);
+  vec4 _io_283_return = _sn_283_combine_colors(_io_106_return, _io_108_return);
+  vec4 _io_284_return = _sn_284_combine_colors(_io_110_return, _io_112_return);
+  vec4 _io_285_return = _sn_285_combine_colors(_io_114_return, _io_116_return);
+  vec4 _io_286_return = _sn_286_combine_colors(_io_118_return, _io_120_return);
+  vec4 _io_287_return = _sn_287_combine_colors(_io_122_return, _io_124_return);
+  vec4 _io_288_return = _sn_288_combine_colors(_io_126_return, _io_128_return);
+  vec4 _io_289_return = _sn_289_combine_colors(_io_130_return, _io_132_return);
+  vec4 _io_290_return = _sn_290_combine_colors(_io_134_return, _io_136_return);
+  vec4 _io_291_return = _sn_291_combine_colors(_io_138_return, _io_140_return);
+  vec4 _io_292_return = _sn_292_combine_colors(_io_142_return, _io_144_return);
+  vec4 _io_293_return = _sn_293_combine_colors(_io_146_return, _io_148_return);
+  vec4 _io_294_return = _sn_294_combine_colors(_io_150_return, _io_152_return);
+  vec4 _io_295_return = _sn_295_combine_colors(_io_154_return, _io_156_return);
+  vec4 _io_296_return = _sn_296_combine_colors(_io_158_return, _io_160_return);
+  vec4 _io_297_return = _sn_297_combine_colors(_io_162_return, _io_164_return);
+  vec4 _io_298_return = _sn_298_combine_colors(_io_166_return, _io_168_return);
+  vec4 _io_299_return = _sn_299_combine_colors(_io_170_return, _io_172_return);
+  vec4 _io_300_return = _sn_300_combine_colors(_io_174_return, _io_176_return);
+  vec4 _io_301_return = _sn_301_combine_colors(_io_178_return, _io_180_return);
+  vec4 _io_302_return = _sn_302_combine_colors(_io_182_return, _io_184_return);
+  vec4 _io_303_return = _sn_303_combine_colors(_io_186_return, _io_188_return);
+  vec4 _io_304_return = _sn_304_combine_colors(_io_190_return, _io_192_return);
+  vec4 _io_305_return = _sn_305_combine_colors(_io_194_return, _io_196_return);
+  vec4 _io_306_return = _sn_306_combine_colors(_io_198_return, _io_200_return);
+  vec4 _io_307_return = _sn_307_combine_colors(_io_202_return, _io_204_return);
+  vec4 _io_308_return = _sn_308_combine_colors(_io_206_return, _io_208_return);
+  vec4 _io_309_return = _sn_309_combine_colors(_io_210_return, _io_212_return);
+  vec4 _io_310_return = _sn_310_combine_colors(_io_214_return, _io_216_return);
+  vec4 _io_311_return = _sn_311_combine_colors(_io_218_return, _io_220_return);
+  vec4 _io_312_return = _sn_312_combine_colors(_io_222_return, _io_224_return);
+  vec4 _io_313_return = _sn_313_combine_colors(_io_226_return, _io_228_return);
+  vec4 _io_314_return = _sn_314_combine_colors(_io_230_return, _io_232_return);
+  vec4 _io_315_return = _sn_315_combine_colors(_io_234_return, _io_236_return);
+  vec4 _io_316_return = _sn_316_combine_colors(_io_238_return, _io_240_return);
+  vec4 _io_317_return = _sn_317_combine_colors(_io_242_return, _io_244_return);
+  vec4 _io_318_return = _sn_318_combine_colors(_io_246_return, _io_248_return);
+  vec4 _io_319_return = _sn_319_combine_colors(_io_250_return, _io_252_return);
+  vec4 _io_320_return = _sn_320_combine_colors(_io_254_return, _io_256_return);
+  vec4 _io_321_return = _sn_321_combine_colors(_io_257_return, _io_258_return);
+  vec4 _io_322_return = _sn_322_combine_colors(_io_259_return, _io_260_return);
+  vec4 _io_323_return = _sn_323_combine_colors(_io_261_return, _io_262_return);
+  vec4 _io_324_return = _sn_324_combine_colors(_io_263_return, _io_264_return);
+  vec4 _io_325_return = _sn_325_combine_colors(_io_265_return, _io_266_return);
+  vec4 _io_326_return = _sn_326_combine_colors(_io_267_return, _io_268_return);
+  vec4 _io_327_return = _sn_327_combine_colors(_io_269_return, _io_270_return);
+  vec4 _io_328_return = _sn_328_combine_colors(_io_271_return, _io_272_return);
+  vec4 _io_329_return = _sn_329_combine_colors(_io_273_return, _io_274_return);
+  vec4 _io_330_return = _sn_330_combine_colors(_io_275_return, _io_276_return);
+  vec4 _io_331_return = _sn_331_combine_colors(_io_277_return, _io_278_return);
+  vec4 _io_332_return = _sn_332_combine_colors(_io_279_return, _io_280_return);
+  vec4 _io_333_return = _sn_333_combine_colors(_io_281_return, _io_282_return);
+  vec4 _io_334_return = _sn_334_combine_colors(_io_283_return, _io_284_return);
+  vec4 _io_335_return = _sn_335_combine_colors(_io_285_return, _io_286_return);
+  vec4 _io_336_return = _sn_336_combine_colors(_io_287_return, _io_288_return);
+  vec4 _io_337_return = _sn_337_combine_colors(_io_289_return, _io_290_return);
+  vec4 _io_338_return = _sn_338_combine_colors(_io_291_return, _io_292_return);
+  vec4 _io_339_return = _sn_339_combine_colors(_io_293_return, _io_294_return);
+  vec4 _io_340_return = _sn_340_combine_colors(_io_295_return, _io_296_return);
+  vec4 _io_341_return = _sn_341_combine_colors(_io_297_return, _io_298_return);
+  vec4 _io_342_return = _sn_342_combine_colors(_io_299_return, _io_300_return);
+  vec4 _io_343_return = _sn_343_combine_colors(_io_301_return, _io_302_return);
+  vec4 _io_344_return = _sn_344_combine_colors(_io_303_return, _io_304_return);
+  vec4 _io_345_return = _sn_345_combine_colors(_io_305_return, _io_306_return);
+  vec4 _io_346_return = _sn_346_combine_colors(_io_307_return, _io_308_return);
+  vec4 _io_347_return = _sn_347_combine_colors(_io_309_return, _io_310_return);
+  vec4 _io_348_return = _sn_348_combine_colors(_io_311_return, _io_312_return);
+  vec4 _io_349_return = _sn_349_combine_colors(_io_313_return, _io_314_return);
+  vec4 _io_350_return = _sn_350_combine_colors(_io_315_return, _io_316_return);
+  vec4 _io_351_return = _sn_351_combine_colors(_io_317_return, _io_318_return);
+  vec4 _io_352_return = _sn_352_combine_colors(_io_319_return, _io_320_return);
+  vec4 _io_353_return = _sn_353_combine_colors(_io_321_return, _io_322_return);
+  vec4 _io_354_return = _sn_354_combine_colors(_io_323_return, _io_324_return);
+  vec4 _io_355_return = _sn_355_combine_colors(_io_325_return, _io_326_return);
+  vec4 _io_356_return = _sn_356_combine_colors(_io_327_return, _io_328_return);
+  vec4 _io_357_return = _sn_357_combine_colors(_io_329_return, _io_330_return);
+  vec4 _io_358_return = _sn_358_combine_colors(_io_331_return, _io_332_return);
+  vec4 _io_359_return = _sn_359_combine_colors(_io_333_return, _io_334_return);
+  vec4 _io_360_return = _sn_360_combine_colors(_io_335_return, _io_336_return);
+  vec4 _io_361_return = _sn_361_combine_colors(_io_337_return, _io_338_return);
+  vec4 _io_362_return = _sn_362_combine_colors(_io_339_return, _io_340_return);
+  vec4 _io_363_return = _sn_363_combine_colors(_io_341_return, _io_342_return);
+  vec4 _io_364_return = _sn_364_combine_colors(_io_343_return, _io_344_return);
+  vec4 _io_365_return = _sn_365_combine_colors(_io_345_return, _io_346_return);
+  vec4 _io_366_return = _sn_366_combine_colors(_io_347_return, _io_348_return);
+  vec4 _io_367_return = _sn_367_combine_colors(_io_349_return, _io_350_return);
+  vec4 _io_368_return = _sn_368_combine_colors(_io_351_return, _io_352_return);
+  vec4 _io_369_return = _sn_369_combine_colors(_io_353_return, _io_354_return);
+  vec4 _io_370_return = _sn_370_combine_colors(_io_355_return, _io_356_return);
+  vec4 _io_371_return = _sn_371_combine_colors(_io_357_return, _io_358_return);
+  vec4 _io_372_return = _sn_372_combine_colors(_io_359_return, _io_360_return);
+  vec4 _io_373_return = _sn_373_combine_colors(_io_361_return, _io_362_return);
+  vec4 _io_374_return = _sn_374_combine_colors(_io_363_return, _io_364_return);
+  vec4 _io_375_return = _sn_375_combine_colors(_io_365_return, _io_366_return);
+  vec4 _io_376_return = _sn_376_combine_colors(_io_367_return, _io_368_return);
+  vec4 _io_377_return = _sn_377_combine_colors(_io_369_return, _io_370_return);
+  vec4 _io_378_return = _sn_378_combine_colors(_io_371_return, _io_372_return);
+  vec4 _io_379_return = _sn_379_combine_colors(_io_373_return, _io_374_return);
+  vec4 _io_380_return = _sn_380_combine_colors(_io_375_return, _io_376_return);
+  vec4 _io_381_return = _sn_381_combine_colors(_io_377_return, _io_378_return);
+  vec4 _io_382_return = _sn_382_combine_colors(_io_379_return, _io_380_return);
+  vec4 _io_383_return = _sn_383_combine_colors(_io_381_return, _io_382_return);
+  _sn_384_set_color(_io_383_return);
+}
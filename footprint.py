@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2015, Nicolas P. Rougier
+# Distributed under the (new) BSD License. See LICENSE.txt for more info.
+# -----------------------------------------------------------------------------
+import sys
+import parser
+from snippet import Snippet, Input, Output
+from parser import Constant, Struct, Variable, Prototype, Function, Parameter
+
+
+# AST node categories, in the order they're accounted for
+categories = ("constants", "structs", "variables", "prototypes", "functions")
+
+# Objects belonging to a snippet, only followed when owned by current snippet
+nodes = (Snippet, Input, Output,
+         Constant, Struct, Variable, Prototype, Function, Parameter)
+
+
+def owned(snippet):
+    """ Return ids of the hooks and parsed objects belonging to snippet """
+    objects = snippet.inputs + snippet.outputs
+    for category in categories:
+        objects = objects + getattr(snippet, category)
+    for hook in snippet.prototypes + snippet.functions:
+        objects = objects + hook.parameters
+    return set([id(obj) for obj in objects])
+
+
+def sizeof(obj, seen, owned=None):
+    """
+    Return the number of bytes retained by obj, not counting objects already
+    seen nor, if owned is given, snippets, hooks and parsed objects that are
+    not owned (i.e. they belong to another snippet, reached through
+    connections).
+    """
+    if id(obj) in seen:
+        return 0
+    if owned is not None and isinstance(obj, nodes) and id(obj) not in owned:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += sizeof(key, seen, owned) + sizeof(value, seen, owned)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += sizeof(item, seen, owned)
+    elif hasattr(obj, "__dict__"):
+        size += sizeof(obj.__dict__, seen, owned)
+    return size
+
+
+def snippet_footprint(snippet, seen=None):
+    """
+    Return bytes retained by a snippet per AST node category, plus its hooks
+    ("hooks"), its raw source ("code") and anything else ("other").
+    """
+    seen = set() if seen is None else seen
+    seen.add(id(snippet))
+    objects = owned(snippet)
+    report = {}
+    for category in categories:
+        report[category] = sizeof(getattr(snippet, category), seen, objects)
+    report["hooks"] = (sizeof(snippet._inputs, seen, objects) +
+                       sizeof(snippet._outputs, seen, objects))
+    report["code"] = sizeof(snippet._code, seen, objects)
+    report["other"] = sys.getsizeof(snippet) + sizeof(snippet.__dict__, seen, objects)
+    return report
+
+
+def footprint(shader):
+    """
+    Return bytes retained by a shader as a dictionary with the shader total
+    ("total"), a list of (name, report) for each snippet ("snippets") and
+    the total per category ("categories"). The process wide parse cache is
+    reported as well ("cache") but is not included in total. Sources (and the
+    owner) are not accounted for since they are usually shared between
+    shaders, and snippets raw code is only reported ("code") when it is not
+    the current source.
+    """
+    seen = set([id(shader.sources), id(shader.owner)])
+    for snippet in shader.snippets:
+        if snippet.name in shader.sources:
+            seen.add(id(shader.sources[snippet.name]))
+    snippets = []
+    totals = {}
+    for snippet in shader.snippets:
+        report = snippet_footprint(snippet, seen)
+        snippets.append((snippet.name, report))
+        for key, value in report.items():
+            totals[key] = totals.get(key, 0) + value
+    total = sys.getsizeof(shader) + sizeof(shader.__dict__, seen, ())
+    total += sum(totals.values())
+    return { "total"      : total,
+             "snippets"   : snippets,
+             "categories" : totals,
+             "cache"      : cache_footprint() }
+
+
+def cache_footprint():
+    """ Return bytes retained by the (process wide) parse cache """
+    return sizeof(parser.cache, set())
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2015, Nicolas P. Rougier
+# Distributed under the (new) BSD License. See LICENSE.txt for more info.
+# -----------------------------------------------------------------------------
+"""
+Declarative description of a shader graph. A graph is made of named nodes
+(each one referring to a source key) and of explicit edges connecting an
+output hook of a node to an input hook of another node:
+
+    graph = { "nodes": { "colors"  : "get_colors",
+                         "filter"  : "apply_filter",
+                         "output"  : "set_color" },
+              "edges": [ ("colors.color1", "filter.ramp"),
+                         ("filter.apply_filter", "output.color") ] }
+    shader = build(sources, graph)
+
+Nodes can also be given as a list of (name, key) pairs to impose snippet
+creation order. The return value of a function is named after the function.
+"""
+from shader import Shader
+
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+
+class GraphError(RuntimeError):
+    """ Wiring errors found while building a graph """
+
+    def __init__(self, errors):
+        self.errors = errors
+        RuntimeError.__init__(self, "\n".join(errors))
+
+
+def _hooks(hooks):
+    """ Index hooks by name, keeping all hooks sharing a name """
+    index = {}
+    for hook in hooks:
+        index.setdefault(hook.name, []).append(hook)
+    return index
+
+
+def _resolve(nodes, endpoint, kind, errors):
+    """ Resolve a 'node.hook' endpoint into an input or output hook """
+
+    if not isinstance(endpoint, string_types):
+        errors.append("Malformed %s endpoint (%r)" % (kind, endpoint))
+        return None
+    node, _, name = endpoint.partition(".")
+    if not name:
+        errors.append("Malformed %s endpoint (%s)" % (kind, endpoint))
+        return None
+    if node not in nodes:
+        errors.append("Unknown node in %s endpoint (%s)" % (kind, endpoint))
+        return None
+    hooks = nodes[node][kind].get(name, [])
+    if not hooks:
+        errors.append("Unknown %s hook (%s)" % (kind, endpoint))
+        return None
+    if len(hooks) > 1:
+        errors.append("Ambiguous %s hook (%s)" % (kind, endpoint))
+        return None
+    return hooks[0]
+
+
+def build(sources, graph):
+    """
+    Build a shader from a graph description, reporting all wiring errors
+    (including unconnected inputs) at once (GraphError) instead of failing
+    at the first one.
+    """
+
+    shader = Shader(sources)
+    errors = []
+
+    # Create snippets and index their hooks
+    nodes = {}
+    items = graph.get("nodes", {})
+    if isinstance(items, dict):
+        items = sorted(items.items())
+    for item in items:
+        if not isinstance(item, (list, tuple)) or len(item) != 2:
+            errors.append("Malformed node (%r)" % (item,))
+            continue
+        name, key = item
+        if not isinstance(name, string_types) or not isinstance(key, string_types):
+            errors.append("Malformed node (%r)" % (item,))
+            continue
+        if name in nodes:
+            errors.append("Duplicate node (%s)" % name)
+            continue
+        try:
+            snippet = shader(key)
+        except IndexError:
+            errors.append("Unknown source (%s) for node %s" % (key, name))
+            continue
+        nodes[name] = { "snippet" : snippet,
+                        "input"   : _hooks(snippet.inputs),
+                        "output"  : _hooks(snippet.outputs) }
+
+    # Resolve and check all edges before connecting anything
+    connections = []
+    connected = {}
+    for edge in graph.get("edges", []):
+        if not isinstance(edge, (list, tuple)) or len(edge) != 2:
+            errors.append("Malformed edge (%r)" % (edge,))
+            continue
+        source, target = edge
+        output = _resolve(nodes, source, "output", errors)
+        input = _resolve(nodes, target, "input", errors)
+        if output is None or input is None:
+            continue
+        if not output.type == input.type:
+            error = "Incompatible types in edge %s (%s) -> %s (%s)"
+            errors.append(error % (source, output.type, target, input.type))
+            continue
+        if input in connected:
+            error = "Input %s is connected to both %s and %s"
+            errors.append(error % (target, connected[input], source))
+            continue
+        connected[input] = source
+        connections.append((output, input))
+
+    # Every input (parameter or prototype) must be connected
+    for name in sorted(nodes.keys()):
+        for input in nodes[name]["snippet"].inputs:
+            if input not in connected:
+                errors.append("Unconnected input %s.%s" % (name, input.name))
+
+    if errors:
+        raise GraphError(errors)
+
+    for output, input in connections:
+        output.targets.append(input)
+        input.source = output
+    return shader
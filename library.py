@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2015, Nicolas P. Rougier
+# Distributed under the (new) BSD License. See LICENSE.txt for more info.
+# -----------------------------------------------------------------------------
+import os
+import mmap
+import hashlib
+import weakref
+
+
+class Source(object):
+    """
+    A source is a snippet file known to a library. Its code is only read when
+    first requested and kept until the file changes on disk.
+    """
+
+    def __init__(self, path, threshold):
+        self.path      = path
+        self.threshold = threshold
+        self.mtime     = None
+        self.size      = None
+        self.digest    = None
+        self._code     = None
+        self.stat()
+
+    def stat(self):
+        """ Update mtime/size and tell whether they changed """
+        info = os.stat(self.path)
+        changed = (info.st_mtime, info.st_size) != (self.mtime, self.size)
+        self.mtime = info.st_mtime
+        self.size  = info.st_size
+        return changed
+
+    def read(self, digest=None):
+        """
+        Read file content and return (code, digest), code being None if its
+        digest is the given one. Large files are memory-mapped and hashed in
+        place such that unchanged content is never copied.
+        """
+        with open(self.path, "rb") as file:
+            if self.threshold and self.size >= self.threshold:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    new = hashlib.sha1(data).hexdigest()
+                    code = data[:] if new != digest else None
+                finally:
+                    data.close()
+            else:
+                code = file.read()
+                new = hashlib.sha1(code).hexdigest()
+                if new == digest:
+                    code = None
+        if code is not None and not isinstance(code, str):
+            code = code.decode("utf-8")
+        return code, new
+
+    @property
+    def loaded(self):
+        return self._code is not None
+
+    @property
+    def code(self):
+        if self._code is None:
+            self._code, self.digest = self.read()
+        return self._code
+
+    def reload(self):
+        """
+        Re-read the file if it has been loaded and its stat changed. Return
+        True if content is actually different.
+        """
+        if not self.stat() or not self.loaded:
+            return False
+        code, digest = self.read(self.digest)
+        if code is None:
+            return False
+        self._code, self.digest = code, digest
+        return True
+
+
+class Library(object):
+    """
+    A library indexes a directory tree of snippet files that can be used as
+    shader sources. Snippets are named after their path relative to the
+    library root, without extension and using '/' as separator.
+
+    Files are only read when a shader first asks for them and the library
+    can be polled (reload) such that only changed files are re-read and only
+    shaders using them are rebuilt.
+    """
+
+    def __init__(self, path, extensions=(".glsl",), threshold=64*1024):
+        self.path       = os.path.abspath(path)
+        self.extensions = tuple(extensions)
+        self.threshold  = threshold
+        self._sources   = {}
+        self._shaders   = weakref.WeakSet()
+        self._pending   = weakref.WeakKeyDictionary()
+        self._scan()
+
+    def _scan(self):
+        """ Walk library tree, update the index and return removed keys """
+        found = {}
+        for root, dirs, files in os.walk(self.path):
+            dirs.sort()
+            for filename in sorted(files):
+                base, ext = os.path.splitext(filename)
+                if ext not in self.extensions:
+                    continue
+                path = os.path.join(root, filename)
+                key = os.path.relpath(os.path.join(root, base), self.path)
+                found[key.replace(os.sep, "/")] = path
+        removed = []
+        for key in list(self._sources.keys()):
+            if key not in found:
+                del self._sources[key]
+                removed.append(key)
+        for key, path in found.items():
+            if key not in self._sources:
+                self._sources[key] = Source(path, self.threshold)
+        return removed
+
+    def attach(self, shader):
+        """ Register a shader to be rebuilt when its sources change """
+        self._shaders.add(shader)
+
+    def reload(self):
+        """
+        Rescan library tree, re-read changed files and rebuild attached
+        shaders depending on them. Return the sorted list of changed keys,
+        removed files being reported as changed.
+
+        All attached shaders are rebuilt even if some of them fail (e.g. a
+        connected hook or a whole file disappeared), in which case a
+        RuntimeError reporting all failures is raised afterward. Keys of a
+        failed rebuild are retried on next reload.
+        """
+        removed = self._scan()
+        changed = [key for key, source in self._sources.items()
+                   if source.reload()]
+        changed = sorted(changed + removed)
+        errors = []
+        for shader in list(self._shaders):
+            keys = set(changed) | self._pending.pop(shader, set())
+            if not keys:
+                continue
+            try:
+                shader.rebuild(keys)
+            except RuntimeError as error:
+                self._pending[shader] = keys
+                errors.append(str(error))
+        if errors:
+            error = "Some shaders cannot be rebuilt (%s changed):\n%s"
+            keys = ", ".join(sorted(set.union(*self._pending.values())))
+            raise RuntimeError(error % (keys, "\n".join(errors)))
+        return changed
+
+    def keys(self):
+        return sorted(self._sources.keys())
+
+    def __contains__(self, key):
+        return key in self._sources
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._sources)
+
+    def __getitem__(self, key):
+        try:
+            return self._sources[key].code
+        except KeyError:
+            raise KeyError("Unknown snippet (%s)" % key)
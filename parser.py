@@ -3,8 +3,17 @@
 # Copyright (c) 2015, Nicolas P. Rougier
 # Distributed under the (new) BSD License. See LICENSE.txt for more info.
 # -----------------------------------------------------------------------------
+import re
+import copy
+import hashlib
+from collections import OrderedDict
 from pyparsing import *
 
+try:
+    intern
+except NameError:
+    from sys import intern
+
 keywords = ("attribute const uniform varying break continue do for while"
             "if else"
             "in out inout"
@@ -97,10 +106,11 @@ class Type(object):
             self.storage = other.storage
             self.precision = other.precision
         else:
-            self.base = base.strip()
+            # Type strings are interned since they are shared by many objects
+            self.base = intern(str(base.strip()))
             self.size = size.strip()
-            self.storage = storage.strip()
-            self.precision = precision.strip()
+            self.storage = intern(str(storage.strip()))
+            self.precision = intern(str(precision.strip()))
 
     def __str__(self):
         s = ""
@@ -186,6 +196,59 @@ class Function(object):
         return s
 
 
+class Template(object):
+    """
+    A function (as generated by str) split at occurrences of the given symbol
+    names such that code can be generated by filling aliases into slots
+    instead of searching symbols in the whole function text. Templates only
+    depend on the function source and are shared by all function copies.
+    """
+
+    def __init__(self, function, names):
+        head = str(function.type) + " "
+        tail = " ("
+        tail += ", ".join([str(parameter) for parameter in function.parameters])
+        tail += ") " + function.code
+
+        # Slot None stands for the function alias, in between head and tail
+        self.pieces = [""]
+        self.slots = []
+        self._split(head, names, 0)
+        self.slots.append(None)
+        self.pieces.append("")
+        self._split(tail, names, len(head) + 1)
+
+        # A symbol at the very beginning of text is never renamed
+        self.rename_alias = len(head) > 0
+
+    def _split(self, text, names, offset):
+        """ Split text at symbol names (offset is text position in function) """
+        start = 0
+        for match in re.finditer(r'[a-zA-Z0-9_]+', text):
+            if match.group() in names and offset + match.start() > 0:
+                self.pieces[-1] += text[start:match.start()]
+                self.slots.append(match.group())
+                self.pieces.append("")
+                start = match.end()
+        self.pieces[-1] += text[start:]
+
+    def fill(self, alias, rename):
+        """ Generate function code, rename giving the alias of a symbol """
+        if self.rename_alias:
+            alias = rename(alias)
+        s = [self.pieces[0]]
+        for slot, piece in zip(self.slots, self.pieces[1:]):
+            s.append(alias if slot is None else rename(slot))
+            s.append(piece)
+        return "".join(s)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
 class Constant(object):
     def __init__(self, name, value):
         self.name = name.strip()
@@ -211,7 +274,39 @@ class Struct(object):
 
 
 
+# Parse results indexed by source code digest, least recently used ones being
+# dropped beyond cache_size entries (0 disables the cache)
+cache = OrderedDict()
+cache_size = 256
+
+def clear_cache():
+    """ Forget all cached parse results """
+    cache.clear()
+
+
 def parse(code):
+    """
+    Parse a GLSL source code into an abstract syntax list. Results are cached
+    such that a given code is parsed only once, each call returning a fresh
+    copy of the objects (since they are modified when linking).
+    """
+
+    if cache_size <= 0:
+        return _parse(code)
+
+    data = code if isinstance(code, bytes) else code.encode("utf-8")
+    key = hashlib.sha1(data).hexdigest()
+    if key in cache:
+        objects = cache.pop(key)
+    else:
+        objects = _parse(code)
+    cache[key] = objects
+    while len(cache) > cache_size:
+        cache.popitem(last=False)
+    return copy.deepcopy(objects)
+
+
+def _parse(code):
     """ Parse a GLSL source code into an abstract syntax list """
 
     constants = []
@@ -288,4 +383,12 @@ def parse(code):
             for parameter in parameters:
                 parameter.function = None
 
+    # Function templates, split at symbols that may be renamed by a shader
+    names = set([prototype.name for prototype in prototypes] +
+                [variable.name for variable in variables])
+    for function in functions:
+        names.update([parameter.name for parameter in function.parameters])
+    for function in functions:
+        function.template = Template(function, names)
+
     return constants, structs, variables, prototypes, functions
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2015, Nicolas P. Rougier
+# Distributed under the (new) BSD License. See LICENSE.txt for more info.
+# -----------------------------------------------------------------------------
+import re
+
+
+class Program(object):
+    """
+    A program links a vertex and a fragment shader together. Varyings are
+    matched by name across stages and given a common alias, while varyings
+    the fragment stage never reads are dropped (and demoted to plain globals
+    in the vertex stage). Snippets are parsed only once even when used in
+    both stages. Shaders are owned by the program such that rebuilding one
+    of them re-links the whole program.
+    """
+
+    def __init__(self, vertex, fragment):
+        self.vertex = vertex
+        self.fragment = fragment
+        vertex.owner = self
+        fragment.owner = self
+
+
+    def _varyings(self, shader):
+        """ Index varying variables of a shader by name """
+        varyings = {}
+        for snippet in shader.snippets:
+            for variable in snippet.variables:
+                if variable.type.storage == "varying":
+                    varyings.setdefault(variable.name, []).append((snippet, variable))
+        return varyings
+
+
+    def link(self):
+        """
+        Link both stages. Decisions about varyings only last until next link
+        (shaders are not modified, see Shader.omitted and Shader.demoted).
+        """
+
+        self.vertex.link()
+        self.fragment.link()
+
+        outputs = self._varyings(self.vertex)
+        inputs = self._varyings(self.fragment)
+
+        # Check fragment varyings are written by vertex with the same type
+        for name, variables in inputs.items():
+            if name not in outputs:
+                error = "Varying %s is not provided by vertex shader" % name
+                raise RuntimeError(error)
+            vtype = outputs[name][0][1].type
+            for snippet, variable in variables + outputs[name]:
+                if not variable.type == vtype:
+                    error = "Varying %s has inconsistent types" % name
+                    raise RuntimeError(error)
+
+        # Find which varyings are actually read by the fragment shader
+        used = set()
+        for name, variables in inputs.items():
+            regex = r'(?<=[^a-zA-Z0-9_])%s(?=[^a-zA-Z0-9_])' % name
+            for snippet, variable in variables:
+                for function in snippet.functions:
+                    if re.search(regex, function.code):
+                        used.add(name)
+
+        # Share varyings, demote unused ones in vertex shader (they're still
+        # written) and omit them from fragment shader
+        for name, variables in outputs.items():
+            for snippet, variable in variables:
+                variable.alias = "_vy_%s" % name
+                if name not in used:
+                    self.vertex.demoted.add(variable)
+        for name, variables in inputs.items():
+            for snippet, variable in variables:
+                variable.alias = "_vy_%s" % name
+                if name not in used:
+                    self.fragment.omitted.add(variable)
+
+
+    def build(self):
+        """ Link the program and return (vertex, fragment) sources """
+
+        self.link()
+        return str(self.vertex), str(self.fragment)
@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2015, Nicolas P. Rougier
+# Distributed under the (new) BSD License. See LICENSE.txt for more info.
+# -----------------------------------------------------------------------------
+"""
+Differential regression corpus for generated GLSL code.
+
+Each scenario builds a shader graph whose generated code is compared against
+a golden source stored in the corpus directory and whose memory footprint
+report is checked for consistency. Throughput (shaders built, linked and
+generated per second) is reported for each scenario, with a cold (parse cache
+cleared) and a warm parse cache. Additional checks exercise graph building
+helpers (library reload, ...) that have no golden source.
+
+Usage: python regression.py [--update] [--normalize] [--duration SECONDS]
+"""
+from __future__ import print_function
+import os
+import re
+import sys
+import time
+import shutil
+import tempfile
+import parser
+from shader import Shader
+from program import Program
+from footprint import footprint
+from library import Library
+import graph
+
+
+corpus = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+
+# Snippets
+# -----------------------------------------------------------------------------
+get_colors = """
+uniform vec4 diffuse_color;
+void get_colors(out vec4 color1, out vec4 color2)
+{
+    color1 = diffuse_color;
+    color2 = diffuse_color.zyxw;
+} """
+
+apply_filter = """
+uniform float intensity;
+vec4 apply_filter(vec4 ramp)
+{
+    return mix(ramp, ramp * (1.0 - ramp) * 2.0, intensity);
+} """
+
+combine = """
+vec4 combine_colors(vec4 a, vec4 b)
+{
+    return a + b;
+}
+"""
+
+set_color = """
+void set_color(vec4 color)
+{
+    gl_FragColor = color;
+}
+"""
+
+get_color = """
+vec3 get_color()
+{
+  return vec3(0.2, 0.3, 0.4);
+} """
+
+get_color_sum = """
+vec3 get_color1();
+vec3 get_color2();
+vec3 get_color_sum() {
+  return get_color1() + get_color2();
+}
+"""
+
+set_color_main = """
+vec3 get_color();
+void main() {
+  gl_FragColor = vec4(get_color(), 1.0);
+}
+"""
+
+get_vec4 = """
+#define SCALE 0.5
+uniform vec4 base_color;
+vec4 get_vec4()
+{
+    return base_color * SCALE;
+} """
+
+transform = """
+attribute vec2 position;
+varying vec2 v_texcoord;
+varying float v_depth;
+vec4 transform()
+{
+    v_texcoord = position;
+    v_depth = 0.0;
+    return vec4(position, 0.0, 1.0);
+} """
+
+scale = """
+varying vec2 v_texcoord;
+vec4 scale(vec4 position)
+{
+    v_texcoord *= 0.5;
+    return position * 0.5;
+} """
+
+set_position = """
+void set_position(vec4 position)
+{
+    gl_Position = position;
+}
+"""
+
+get_texcoord = """
+varying vec2 v_texcoord;
+varying float v_depth;
+vec4 get_texcoord()
+{
+    return vec4(v_texcoord, 0.0, 1.0);
+} """
+
+offset = """
+varying float v_depth;
+vec4 offset(vec4 position)
+{
+    v_depth = position.z;
+    return position;
+} """
+
+
+# Scenarios
+# -----------------------------------------------------------------------------
+def example_1():
+    shader = Shader({ 'get_colors'   : get_colors,
+                      'apply_filter' : apply_filter,
+                      'combine'      : combine,
+                      'set_color'    : set_color })
+    shader("get_colors") >> shader("apply_filter") >> shader("combine") >> shader("set_color")
+    shader["get_colors"] >> shader("apply_filter") >> shader["combine"]
+    return shader
+
+def example_2():
+    shader = Shader({ 'get_color'     : get_color,
+                      'get_color_sum' : get_color_sum,
+                      'set_color'     : set_color_main })
+    shader("get_color") >> shader("get_color_sum") >> shader("set_color")
+    shader("get_color") >> shader["get_color_sum"]
+    return shader
+
+def example_3():
+    shader = Shader({ 'get_color'     : get_color,
+                      'get_color_sum' : get_color_sum,
+                      'set_color'     : set_color_main })
+    shader["get_color"] >> shader["get_color_sum"] >> shader("set_color")
+    shader["get_color"] >> shader["get_color_sum"]
+    return shader
+
+def chain(n=200):
+    """ A long chain of filters """
+    shader = Shader({ 'get_vec4'     : get_vec4,
+                      'apply_filter' : apply_filter,
+                      'set_color'    : set_color })
+    snippet = shader("get_vec4")
+    for i in range(n):
+        snippet = snippet >> shader("apply_filter")
+    snippet >> shader("set_color")
+    return shader
+
+def tree(depth=7):
+    """ A binary tree of combinations (2**depth leaves) """
+    shader = Shader({ 'get_vec4'     : get_vec4,
+                      'apply_filter' : apply_filter,
+                      'combine'      : combine,
+                      'set_color'    : set_color })
+    level = [shader("get_vec4") >> shader("apply_filter") for i in range(2**depth)]
+    while len(level) > 1:
+        nodes = []
+        for a, b in zip(level[::2], level[1::2]):
+            node = shader("combine")
+            a >> node
+            b >> node
+            nodes.append(node)
+        level = nodes
+    level[0] >> shader("set_color")
+    return shader
+
+def program():
+    """ A vertex/fragment program sharing a varying and dropping another one """
+    sources = { 'transform'    : transform,
+                'scale'        : scale,
+                'set_position' : set_position,
+                'get_texcoord' : get_texcoord,
+                'set_color'    : set_color }
+    vertex = Shader(sources)
+    vertex("transform") >> vertex("scale") >> vertex("set_position")
+    fragment = Shader(sources)
+    fragment("get_texcoord") >> fragment("set_color")
+    return Program(vertex, fragment)
+
+scenarios = [example_1, example_2, example_3, chain, tree, program]
+
+
+# Checks
+# -----------------------------------------------------------------------------
+pair = """
+vec4 f(vec4 x) { return x; }
+vec4 g(vec4 x) { return x * 2.0; }
+"""
+
+def check_library():
+    """ Library reload of changed, rewired and removed snippet files """
+
+    path = tempfile.mkdtemp()
+    stamp = [time.time()]
+    def write(key, code):
+        filename = os.path.join(path, key + ".glsl")
+        with open(filename, "w") as file:
+            file.write(code)
+        # Make sure modification is noticed whatever the mtime resolution
+        stamp[0] += 10
+        os.utime(filename, (stamp[0], stamp[0]))
+
+    try:
+        write("get_colors", get_colors)
+        write("apply_filter", apply_filter)
+        write("set_color", set_color)
+        write("pair", pair)
+        library = Library(path)
+
+        filtered = Shader(library)
+        filtered("get_colors") >> filtered("apply_filter") >> filtered("set_color")
+        filtered.link()
+        code = str(filtered)
+        paired = Shader(library)
+        paired("get_colors") >> paired("pair")
+        paired["get_colors"] >> paired["pair"]
+        paired.link()
+
+        # Changed files, hooks unchanged (pair has two "x" parameters)
+        write("apply_filter", apply_filter.replace("2.0", "3.0"))
+        write("pair", pair.replace("2.0", "4.0"))
+        assert library.reload() == ["apply_filter", "pair"]
+        assert str(filtered) == code.replace("2.0", "3.0")
+        assert "4.0" in str(paired)
+        f, g = paired["pair"].inputs
+        assert (f.source.name, g.source.name) == ("color1", "color2")
+
+        # Connected hook removed: rebuild fails and is retried on next reload
+        write("get_colors", get_colors.replace("color1", "colorX"))
+        for i in range(2):
+            try:
+                library.reload()
+            except RuntimeError as error:
+                assert "color1 disappeared" in str(error)
+            else:
+                assert False, "missing hook not reported"
+        assert str(filtered) == code.replace("2.0", "3.0")
+        write("get_colors", get_colors.replace("diffuse_color.zyxw", "diffuse_color"))
+        assert library.reload() == ["get_colors"]
+        assert ".zyxw" not in str(filtered) and ".zyxw" not in str(paired)
+
+        # Removed file
+        os.remove(os.path.join(path, "set_color.glsl"))
+        try:
+            library.reload()
+        except RuntimeError as error:
+            assert "set_color has been removed" in str(error)
+        else:
+            assert False, "removed source not reported"
+    finally:
+        shutil.rmtree(path)
+
+def check_builder():
+    """ Builder coalescing and cancellation of stale builds (Python 3) """
+
+    import asyncio
+    from builder import Builder
+
+    loop = asyncio.new_event_loop()
+    builder = Builder(loop=loop)
+    try:
+        # Concurrent requests for the same graph share a single build
+        shader = example_1()
+        first, second = builder.build(shader), builder.build(shader)
+        assert first is second
+        assert loop.run_until_complete(first) == generate(example_1)
+
+        # A pending build is cancelled once its graph changed
+        stale = builder.build(shader)
+        shader("get_colors")
+        fresh = builder.build(shader)
+        assert fresh is not stale and stale.cancelled()
+        assert loop.run_until_complete(fresh).count("get_colors (") == 2
+    finally:
+        builder.shutdown()
+        loop.close()
+
+def check_graph():
+    """ Graph description errors are all reported at once """
+
+    sources = { 'get_colors' : get_colors,
+                'combine'    : combine,
+                'set_color'  : set_color }
+    description = {
+        "nodes": [ ("colors", "get_colors"), ("sum", "combine"),
+                   ("output", "set_color"), ("missing", "unknown"),
+                   ("colors", "combine"), ("broken",) ],
+        "edges": [ ("colors.color1", "sum.a"),
+                   ("colors.color2", "sum.a"),
+                   ("colors.nothing", "output.color"),
+                   ("ghost.color1", "output.color"),
+                   ("colors", "output.color"),
+                   ("colors.color1", None),
+                   ("colors.color1",) ] }
+    try:
+        graph.build(sources, description)
+    except graph.GraphError as error:
+        assert error.errors == [
+            "Unknown source (unknown) for node missing",
+            "Duplicate node (colors)",
+            "Malformed node (('broken',))",
+            "Input sum.a is connected to both colors.color1 and colors.color2",
+            "Unknown output hook (colors.nothing)",
+            "Unknown node in output endpoint (ghost.color1)",
+            "Malformed output endpoint (colors)",
+            "Malformed input endpoint (None)",
+            "Malformed edge (('colors.color1',))",
+            "Unconnected input output.color",
+            "Unconnected input sum.b" ], error.errors
+    else:
+        assert False, "wiring errors not reported"
+
+    description = { "nodes": { "colors": "get_colors", "output": "set_color" },
+                    "edges": [ ("colors.color2", "output.color") ] }
+    shader = graph.build(sources, description)
+    shader.link()
+    assert "_sn_2_set_color(_io_1_color2);" in str(shader)
+
+def check_program():
+    """ Program varyings are decided anew on each link, including rebuilds """
+
+    sources = { 'transform'    : transform,
+                'offset'       : offset,
+                'scale'        : scale,
+                'set_position' : set_position,
+                'get_texcoord' : get_texcoord,
+                'set_color'    : set_color }
+    vertex = Shader(sources)
+    vertex("transform") >> vertex("offset") >> vertex("scale") >> vertex("set_position")
+    fragment = Shader(sources)
+    fragment("get_texcoord") >> fragment("set_color")
+    program = Program(vertex, fragment)
+
+    # Unread varying written by two snippets is demoted once, with one alias
+    code, _ = program.build()
+    assert code.count("float _vy_v_depth;") == 1, code
+    assert "varying float" not in code, code
+    assert not re.search(r"_sn_\d+_v_depth", code), code
+    assert code == program.build()[0]
+
+    # Reading it later on (through a rebuild) makes it a varying again
+    sources["get_texcoord"] = get_texcoord.replace("0.0, 1.0", "v_depth, 1.0")
+    fragment.rebuild(["get_texcoord"])
+    code = str(vertex)
+    assert code.count("varying float _vy_v_depth;") == 1, code
+    code = str(fragment)
+    assert "varying float _vy_v_depth;" in code, code
+    assert "vec4(_vy_v_texcoord, _vy_v_depth, 1.0)" in code, code
+
+checks = [check_library, check_builder, check_graph, check_program]
+
+
+# Runner
+# -----------------------------------------------------------------------------
+def generate(scenario):
+    result = scenario()
+    if isinstance(result, Program):
+        return "\n".join(result.build())
+    result.link()
+    return str(result)
+
+
+def check_footprint(scenario):
+    """ Check each snippet is charged at least for its own functions """
+    result = scenario()
+    result.link()
+    if isinstance(result, Program):
+        shaders = [result.vertex, result.fragment]
+    else:
+        shaders = [result]
+    for shader in shaders:
+        reports = footprint(shader)["snippets"]
+        for snippet, (name, report) in zip(shader.snippets, reports):
+            size = sum([sys.getsizeof(function) + sys.getsizeof(function.__dict__)
+                        for function in snippet.functions])
+            if report["functions"] < size:
+                return False
+    return True
+
+
+def normalize(code):
+    """ Normalize whitespace such that only significant changes are reported """
+    code = re.sub(r'[ \t]+', ' ', code)
+    code = re.sub(r' *\n *', '\n', code)
+    return re.sub(r'\n+', '\n', code).strip()
+
+
+def throughput(scenario, duration, cold):
+    count, start = 0, time.time()
+    while True:
+        if cold:
+            parser.clear_cache()
+        generate(scenario)
+        count += 1
+        elapsed = time.time() - start
+        if elapsed >= duration:
+            return count / elapsed
+
+
+def run(update=False, normalized=False, duration=1.0):
+    """ Check (or update) golden sources and report throughput """
+
+    failures = 0
+    for scenario in scenarios:
+        name = scenario.__name__
+        filename = os.path.join(corpus, name + ".glsl")
+        code = generate(scenario)
+        if update:
+            if not os.path.exists(corpus):
+                os.makedirs(corpus)
+            with open(filename, "w") as file:
+                file.write(code)
+            status = "updated"
+        elif not os.path.exists(filename):
+            status, failures = "missing", failures+1
+        else:
+            with open(filename) as file:
+                golden = file.read()
+            if normalized:
+                same = normalize(golden) == normalize(code)
+            else:
+                same = golden == code
+            if not same:
+                status, failures = "FAILED", failures+1
+            elif not check_footprint(scenario):
+                status, failures = "FAILED (footprint)", failures+1
+            else:
+                status = "ok"
+        if duration:
+            cold = throughput(scenario, duration, True)
+            warm = throughput(scenario, duration, False)
+            print("%-12s %-18s %10.1f shaders/s (cold) %10.1f shaders/s (warm)"
+                  % (name, status, cold, warm))
+        else:
+            print("%-12s %s" % (name, status))
+
+    for check in checks:
+        name = check.__name__
+        try:
+            check()
+            status = "ok"
+        except ImportError as error:
+            status = "skipped (%s)" % error
+        except Exception as error:
+            status, failures = "FAILED (%s: %s)" % (type(error).__name__, error), failures+1
+        print("%-18s %s" % (name, status))
+    return failures
+
+
+if __name__ == '__main__':
+    duration = 1.0
+    if "--duration" in sys.argv:
+        duration = float(sys.argv[sys.argv.index("--duration")+1])
+    failures = run(update = "--update" in sys.argv,
+                   normalized = "--normalize" in sys.argv,
+                   duration = duration)
+    sys.exit(1 if failures else 0)
@@ -4,6 +4,8 @@
 # Distributed under the (new) BSD License. See LICENSE.txt for more info.
 # -----------------------------------------------------------------------------
 import re
+import copy
+from collections import OrderedDict
 from snippet import *
 
 
@@ -12,6 +14,19 @@ class Shader(object):
     def __init__(self, sources=[]):
         self.sources = sources
         self.snippets = []
+        self.linked = False
+
+        # Owner (e.g. a program) linking this shader along with others
+        self.owner = None
+
+        # Variables omitted or demoted to plain globals by the current link
+        self.omitted = set()
+        self.demoted = set()
+
+        # Sources (e.g. a library) may want to rebuild shader on changes
+        attach = getattr(sources, "attach", None)
+        if attach is not None:
+            attach(self)
 
     def __getitem__(self, key):
         # Look for an existing snippet
@@ -23,21 +38,94 @@ class Shader(object):
         return self.__call__(key)
 
     def __call__(self, key):
-        if key in self.sources.keys():
+        if key in self.sources:
             snippet = Snippet(code=self.sources[key], name=key)
             self.snippets.append(snippet)
             return snippet
         raise IndexError("Unknown hook (%s)" % key)
 
 
-    def link(self):
+    def rebuild(self, keys):
+        """
+        Re-create snippets whose source (key) has changed, keeping their
+        connections, and re-link the shader (or its owner) if it was already
+        linked. Connected hooks are matched by (function name, hook name).
+        """
+
+        def index(hooks):
+            index = {}
+            for hook in hooks:
+                index.setdefault(hook.key, []).append(hook)
+            return index
+
+        def match(hook, hooks, kind, snippet):
+            candidates = hooks.get(hook.key, [])
+            if not candidates or not candidates[0].type == hook.type:
+                error = "Connected %s %s disappeared from %s"
+                raise RuntimeError(error % (kind, hook.name, snippet.name))
+            if len(candidates) > 1:
+                error = "Connected %s %s is ambiguous in %s"
+                raise RuntimeError(error % (kind, hook.name, snippet.name))
+            return candidates[0]
+
+        # Check all snippets first such that a failure leaves shader untouched
+        changes = []
+        for i,snippet in enumerate(self.snippets):
+            if snippet.name not in keys:
+                continue
+            if snippet.name not in self.sources:
+                error = "Source of snippet %s has been removed"
+                raise RuntimeError(error % snippet.name)
+            new = Snippet(code=self.sources[snippet.name], name=snippet.name)
+            inputs, outputs = index(new.inputs), index(new.outputs)
+            pairs = []
+            for input in snippet.inputs:
+                if input.source is not None:
+                    pairs.append((input, match(input, inputs, "input", snippet)))
+            for output in snippet.outputs:
+                if output.targets:
+                    pairs.append((output, match(output, outputs, "output", snippet)))
+            changes.append((i, new, pairs))
+
+        # Move connections from old snippets to new ones
+        for i, new, pairs in changes:
+            for old, hook in pairs:
+                if isinstance(old, Input):
+                    source = old.source
+                    source.targets[source.targets.index(old)] = hook
+                    hook.source = source
+                else:
+                    for target in old.targets:
+                        target.source = hook
+                    hook.targets = old.targets
+            self.snippets[i] = new
+
+        if changes and self.linked:
+            (self.owner or self).link()
+
+
+    def release(self):
+        """
+        Release snippets raw source code. Memory is only reclaimed if sources
+        are not kept elsewhere (e.g. shader sources or a library).
+        """
+        for snippet in self.snippets:
+            snippet.release()
+
 
-        # Order snippets (topological sort according to dependencies)
-        unsorted = dict([(snippet, snippet.dependencies) for snippet in self.snippets])
+    def link(self, release=False):
+        """
+        Link snippets. If release is True, snippets raw source code is
+        released once linked (code can still be generated), see release.
+        """
+
+        # Order snippets (topological sort according to dependencies), ties
+        # being broken by creation order such that output is deterministic
+        unsorted = OrderedDict([(snippet, snippet.dependencies) for snippet in self.snippets])
         sorted = []
         while unsorted:
             acyclic = False
-            for node, edges in unsorted.items():
+            for node, edges in list(unsorted.items()):
                 for edge in edges:
                     if edge in unsorted:
                         break
@@ -48,6 +136,8 @@ class Shader(object):
             if not acyclic:
                 raise RuntimeError("A cyclic dependency occurred")
         self.snippets = sorted
+        self.omitted = set()
+        self.demoted = set()
 
         # Set unique aliases
         for i,snippet in enumerate(self.snippets):
@@ -70,6 +160,10 @@ class Shader(object):
                 for target in output.targets:
                     target.hook.holder = name
 
+        self.linked = True
+        if release:
+            self.release()
+
 
     def __str__(self):
         s = ""
@@ -77,35 +171,47 @@ class Shader(object):
         snippets = self.snippets
 
         # Generate code
+        declared = set()
         for snippet in snippets:
             for constant in snippet.constants:
                 s += str(constant) + "\n"
             for struct in snippet.structs:
                 s += str(struct) + "\n"
             for variable in snippet.variables:
-                s += str(variable) + "\n"
+                if variable in self.omitted:
+                    continue
+                if variable in self.demoted:
+                    variable = copy.copy(variable)
+                    variable.type = Type(variable.type)
+                    variable.type.storage = ""
+                # Variables may share an alias (e.g. program varyings)
+                if variable.alias not in declared:
+                    declared.add(variable.alias)
+                    s += str(variable) + "\n"
 
-            for function in snippet.functions:
-                code = str(function) + "\n"
+            if snippet.functions:
+                # Renaming steps, applied in order to each symbol occurrence
+                steps = []
                 for input in snippet.inputs:
-                    name = input.hook.name
                     if not isinstance(input.hook, Parameter):
-                        alias = input.hook.alias
-                        regex = r'(?<=[^a-zA-Z0-9_])%s(?=[^a-zA-Z0-9_])' % name
-                        code = re.sub(regex, alias, code)
-
+                        steps.append((input.hook.name, input.hook.alias))
                 for input in snippet.inputs:
-                    name = input.hook.name
-                    alias = input.source.hook.alias
-                    regex = r'(?<=[^a-zA-Z0-9_])%s(?=[^a-zA-Z0-9_])' % name
-                    code = re.sub(regex, alias, code)
-
+                    steps.append((input.hook.name, input.source.hook.alias))
                 for variable in snippet.variables:
-                    name = variable.name
-                    alias = variable.alias
-                    regex = r'(?<=[^a-zA-Z0-9_])%s(?=[^a-zA-Z0-9_])' % name
-                    code = re.sub(regex, alias, code)
-                s += code
+                    steps.append((variable.name, variable.alias))
+
+                def rename(name, steps=steps, aliases={}):
+                    if name not in aliases:
+                        alias = name
+                        for step_name, step_alias in steps:
+                            if alias == step_name:
+                                alias = step_alias
+                        aliases[name] = alias
+                    return aliases[name]
+
+            # Fill aliases into precomputed function templates
+            for function in snippet.functions:
+                s += function.template.fill(function.alias, rename) + "\n"
             s += "\n"
         s += "\n"
 
@@ -16,6 +16,16 @@ class Input(object):
         self.hook    = hook
         self.source  = None
 
+    @property
+    def name(self):
+        return self.hook.name
+
+    @property
+    def key(self):
+        """ (function name, hook name) identifying hook within its snippet """
+        function = getattr(self.hook, "function", None)
+        return (function.name if function is not None else None, self.hook.name)
+
     @property
     def type(self):
         return self.hook.type
@@ -30,6 +40,16 @@ class Output(object):
         self.hook    = hook
         self.targets = []
 
+    @property
+    def name(self):
+        return self.hook.name
+
+    @property
+    def key(self):
+        """ (function name, hook name) identifying hook within its snippet """
+        function = getattr(self.hook, "function", None)
+        return (function.name if function is not None else None, self.hook.name)
+
     @property
     def type(self):
         return self.hook.type
@@ -84,6 +104,14 @@ class Snippet(object):
                 self._outputs.append(Output(self, function))
 
 
+    def release(self):
+        """
+        Release raw source code (parsed objects are enough to generate code).
+        Note that code is usually shared with shader sources which must then
+        be dropped as well for memory to be actually reclaimed.
+        """
+        self._code = None
+
     @property
     def name(self):
         return self._name